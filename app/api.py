@@ -0,0 +1,97 @@
+"""
+API JSON de solo lectura de eventos (v1): /api/v1/events/ y /api/v1/events/<id>/.
+
+Las vistas leen las filas con values() y las serializan a dicts sin instanciar modelos.
+Cada respuesta lleva un ETag fuerte calculado con los ids y las fechas de modificación del
+evento, su categoría y su ubicación (más el cursor de la página siguiente, en el listado).
+Si el cliente manda ese ETag en If-None-Match se responde 304 sin serializar nada.
+
+Los campos de la respuesta solo pueden salir del evento, la categoría o la ubicación: un
+dato que no cambie alguna de esas fechas (por ejemplo el nombre del organizador) dejaría
+el ETag desactualizado.
+"""
+
+import hashlib
+import json
+
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+
+VERSION = "v1"
+# Se sube al cambiar el formato de las respuestas, para que no coincidan los ETag anteriores
+REVISION = 1
+
+# Campos que determinan la representación de un evento: si no cambia ninguno, tampoco cambia
+# la respuesta
+VERSION_FIELDS = ("pk", "updated_at", "category__updated_at", "venue__updated_at")
+
+LIST_FIELDS = VERSION_FIELDS + (
+    "title",
+    "scheduled_at",
+    "organizer_id",
+    "category_id",
+    "category__name",
+    "venue_id",
+    "venue__name",
+    "venue__city",
+)
+
+DETAIL_FIELDS = LIST_FIELDS + (
+    "description",
+    "created_at",
+    "category__description",
+    "venue__address",
+    "venue__capacity",
+)
+
+
+def event_summary(row):
+    return {
+        "id": row["pk"],
+        "title": row["title"],
+        "scheduled_at": row["scheduled_at"].isoformat(),
+        "updated_at": row["updated_at"].isoformat(),
+        "organizer_id": row["organizer_id"],
+        "category": {"id": row["category_id"], "name": row["category__name"]},
+        "venue": {"id": row["venue_id"], "name": row["venue__name"], "city": row["venue__city"]},
+    }
+
+
+def event_detail(row):
+    data = event_summary(row)
+    data["description"] = row["description"]
+    data["created_at"] = row["created_at"].isoformat()
+    data["category"]["description"] = row["category__description"]
+    data["venue"]["address"] = row["venue__address"]
+    data["venue"]["capacity"] = row["venue__capacity"]
+    return data
+
+
+def etag(rows, *extra):
+    """ETag fuerte de las filas (en orden) y de los valores de `extra`."""
+    digest = hashlib.sha256(f"{VERSION}:{REVISION}".encode())
+    for value in extra:
+        digest.update(f"\0{value}".encode())
+    for row in rows:
+        digest.update(b"\1")
+        for field in VERSION_FIELDS:
+            value = row[field]
+            digest.update(f"\0{value.isoformat() if hasattr(value, 'isoformat') else value}".encode())
+    return quote_etag(digest.hexdigest())
+
+
+def conditional_json(request, etag, build):
+    """
+    304 si el cliente ya tiene `etag`; si no, el JSON de build(). Las respuestas dependen del
+    usuario (un organizador ve solo sus eventos), así que no se comparten entre sesiones.
+    """
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    else:
+        body = json.dumps(build(), separators=(",", ":"), ensure_ascii=False)
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ["Cookie"])
+    return response
@@ -0,0 +1,262 @@
+"""
+Control de ingreso en la puerta del evento.
+
+Al abrir la puerta se cargan en memoria todos los códigos válidos del evento y los que ya
+ingresaron, así cada escaneo es una búsqueda en un diccionario y no una consulta. Los
+ingresos se acumulan y se guardan con bulk_create cada CHECKIN_FLUSH_SIZE escaneos o cada
+CHECKIN_FLUSH_SECONDS segundos: el plazo se controla en cada escaneo y en cada consulta
+del estado de la puerta (gate_status), que los lectores hacen periódicamente, así los
+ingresos no quedan sin guardar después de un rato sin escaneos.
+
+Los códigos que no están en el índice se buscan en la base fuera del lock (pueden ser
+tickets vendidos después de abrir la puerta) y los que no existen se recuerdan
+CHECKIN_MISS_SECONDS segundos, así una ráfaga de códigos mal tipeados no frena la puerta.
+
+Al borrar un ticket (eliminación o reembolso) su código se quita del índice abierto en el
+proceso. Los que se borran desde otro proceso se descartan al guardar el lote.
+
+El índice vive en el proceso: las puertas de un mismo evento deben apuntar al mismo worker
+para que un código no pueda ingresar dos veces por workers distintos. Igualmente
+CheckIn.ticket es único, así que la base nunca guarda dos ingresos del mismo ticket.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from . import ticket_codes
+from .models import CheckIn, Event, Ticket
+
+ADMITTED = "admitted"
+DUPLICATE = "duplicate"
+INVALID = "invalid"
+
+
+class GateIndex:
+    # Máximo de códigos inexistentes recordados; al llegar se descartan los vencidos
+    MAX_MISSES = 10000
+
+    def __init__(self, event_id, organizer_id, flush_size=None, flush_seconds=None, miss_seconds=None):
+        self.event_id = event_id
+        self.organizer_id = organizer_id
+        self.flush_size = flush_size or settings.CHECKIN_FLUSH_SIZE
+        self.flush_seconds = flush_seconds if flush_seconds is not None else settings.CHECKIN_FLUSH_SECONDS
+        self.miss_seconds = miss_seconds if miss_seconds is not None else settings.CHECKIN_MISS_SECONDS
+        self.valid = {}
+        self.misses = {}
+        self.admitted = set()
+        self.pending = []
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load(cls, event_id, **kwargs):
+        organizer_id = Event.objects.filter(pk=event_id).values_list("organizer_id", flat=True).first()
+        if organizer_id is None:
+            return None
+
+        index = cls(event_id, organizer_id, **kwargs)
+        tickets = Ticket.objects.filter(event_id=event_id).values_list("ticket_code", "pk", "quantity")
+        for code, ticket_id, quantity in tickets.iterator(chunk_size=5000):
+            index.valid[code] = (ticket_id, quantity)
+
+        index.admitted.update(
+            CheckIn.objects.filter(ticket__event_id=event_id).values_list("ticket__ticket_code", flat=True)
+        )
+        return index
+
+    def _find(self, code):
+        """
+        Busca el código en el índice. Tolera O/0 e I/1 confundidos al tipear a mano un código
+        nuevo. Los tickets vendidos después de abrir la puerta se buscan una vez en la base,
+        sin tener tomado el lock, y se agregan al índice; los códigos que no existen se
+        recuerdan miss_seconds segundos.
+        """
+        candidates = list(dict.fromkeys([code, ticket_codes.normalize(code)]))
+        with self.lock:
+            for candidate in candidates:
+                if candidate in self.valid:
+                    return candidate, self.valid[candidate]
+            if self.misses.get(code, 0) > time.monotonic():
+                return code, None
+
+        row = Ticket.objects.filter(
+            event_id=self.event_id, ticket_code__in=candidates
+        ).values_list("ticket_code", "pk", "quantity").first()
+
+        with self.lock:
+            if row is None:
+                self._remember_miss(code)
+                return code, None
+            self.misses.pop(code, None)
+            return row[0], self.valid.setdefault(row[0], row[1:])
+
+    def _remember_miss(self, code):
+        now = time.monotonic()
+        if len(self.misses) >= self.MAX_MISSES:
+            self.misses = {miss: expires for miss, expires in self.misses.items() if expires > now}
+            if len(self.misses) >= self.MAX_MISSES:
+                self.misses.clear()
+        self.misses[code] = now + self.miss_seconds
+
+    def scan(self, code, gate=""):
+        """
+        Registra el ingreso de `code`. Retorna (estado, cantidad de personas).
+        """
+        to_flush = None
+        code, ticket = self._find((code or "").strip().upper())
+        if ticket is None:
+            return INVALID, 0
+
+        with self.lock:
+            # El ticket pudo borrarse mientras se buscaba
+            if code not in self.valid:
+                return INVALID, 0
+
+            if code in self.admitted:
+                return DUPLICATE, ticket[1]
+
+            self.admitted.add(code)
+            self.pending.append(CheckIn(ticket_id=ticket[0], admitted_at=timezone.now(), gate=gate))
+
+            if len(self.pending) >= self.flush_size or self._flush_due():
+                to_flush = self._take_pending()
+
+        if to_flush:
+            self._save(to_flush)
+        return ADMITTED, ticket[1]
+
+    def _flush_due(self):
+        return time.monotonic() - self.last_flush >= self.flush_seconds
+
+    def _take_pending(self):
+        pending, self.pending = self.pending, []
+        self.last_flush = time.monotonic()
+        return pending
+
+    def forget(self, code):
+        """Quita del índice un ticket que se borró, junto con su ingreso si aún no se guardó."""
+        with self.lock:
+            ticket = self.valid.pop(code, None)
+            self.admitted.discard(code)
+            if ticket is not None:
+                self.pending = [pending for pending in self.pending if pending.ticket_id != ticket[0]]
+
+    def _save(self, checkins):
+        """
+        Guarda el lote. Los ingresos de tickets borrados después de abrir la puerta se
+        descartan, así un ticket inválido no hace perder el resto del lote.
+        """
+        existing = set(
+            Ticket.objects.filter(pk__in=[checkin.ticket_id for checkin in checkins]).values_list("pk", flat=True)
+        )
+        checkins = [checkin for checkin in checkins if checkin.ticket_id in existing]
+        try:
+            with transaction.atomic():
+                CheckIn.objects.bulk_create(checkins, ignore_conflicts=True)
+        except IntegrityError:
+            # Un ticket se borró entre la consulta y el insert: se guardan de a uno
+            for checkin in checkins:
+                try:
+                    with transaction.atomic():
+                        CheckIn.objects.bulk_create([checkin], ignore_conflicts=True)
+                except IntegrityError:
+                    pass
+
+    def flush(self):
+        with self.lock:
+            pending = self._take_pending()
+        if pending:
+            self._save(pending)
+        return len(pending)
+
+    def flush_if_due(self):
+        """Guarda los ingresos pendientes si ya pasaron flush_seconds desde el último lote."""
+        with self.lock:
+            pending = self._take_pending() if self.pending and self._flush_due() else []
+        if pending:
+            self._save(pending)
+        return len(pending)
+
+    def stats(self):
+        return {
+            "valid": len(self.valid),
+            "admitted": len(self.admitted),
+            "pending": len(self.pending),
+        }
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def open_gate(event_id):
+    """Carga (o recarga) el índice del evento."""
+    with _indexes_lock:
+        previous = _indexes.pop(event_id, None)
+    if previous is not None:
+        previous.flush()
+
+    index = GateIndex.load(event_id)
+    if index is not None:
+        with _indexes_lock:
+            _indexes[event_id] = index
+    return index
+
+
+def peek_gate(event_id):
+    """El índice del evento si ya está abierto en este proceso, sin cargarlo."""
+    with _indexes_lock:
+        return _indexes.get(event_id)
+
+
+def get_gate(event_id):
+    return peek_gate(event_id) or open_gate(event_id)
+
+
+def forget_ticket(event_id, code):
+    index = peek_gate(event_id)
+    if index is not None:
+        index.forget(code)
+
+
+def import_admissions(event_id, admissions):
+    """
+    Guarda los ingresos que un lector registró sin conexión. `admissions` es una lista de
+    (código, momento del ingreso, puerta). Los tickets que ya tenían ingreso se ignoran.
+    Retorna (ingresos nuevos, códigos desconocidos).
+    """
+    by_code = {}
+    for code, admitted_at, gate in admissions:
+        by_code.setdefault((code or "").strip().upper(), (admitted_at, gate))
+
+    tickets = dict(
+        Ticket.objects.filter(event_id=event_id, ticket_code__in=by_code).values_list("ticket_code", "pk")
+    )
+    already = set(CheckIn.objects.filter(ticket_id__in=tickets.values()).values_list("ticket_id", flat=True))
+
+    checkins = [
+        CheckIn(ticket_id=ticket_id, admitted_at=by_code[code][0], gate=by_code[code][1])
+        for code, ticket_id in tickets.items()
+        if ticket_id not in already
+    ]
+    CheckIn.objects.bulk_create(checkins, ignore_conflicts=True)
+
+    with _indexes_lock:
+        index = _indexes.get(event_id)
+    if index is not None:
+        with index.lock:
+            index.admitted.update(tickets)
+
+    return len(checkins), sorted(set(by_code) - set(tickets))
+
+
+def close_gate(event_id):
+    with _indexes_lock:
+        index = _indexes.pop(event_id, None)
+    if index is None:
+        return 0
+    return index.flush()
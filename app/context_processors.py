@@ -2,9 +2,11 @@ from .models import Notification
 
 
 def unread_notifications(request):
-    if request.user.is_authenticated:
-        notificaciones_no_leidas = Notification.objects.filter(users=request.user, is_read=False).count()
-    else:
-        notificaciones_no_leidas = 0
+    if not request.user.is_authenticated:
+        return {"notificaciones_no_leidas": 0}
 
-    return {"notificaciones_no_leidas": notificaciones_no_leidas}
\ No newline at end of file
+    # Se guarda en el request: las vistas que renderizan fragmentos aparte (como el listado
+    # de eventos) pasan dos veces por acá
+    if not hasattr(request, "_notificaciones_no_leidas"):
+        request._notificaciones_no_leidas = Notification.objects.filter(users=request.user, is_read=False).count()
+    return {"notificaciones_no_leidas": request._notificaciones_no_leidas}
@@ -0,0 +1,96 @@
+"""
+Filtros por categoría, ubicación y mes del listado de eventos, con la cantidad de eventos
+de cada opción.
+
+Las cantidades salen de una sola consulta agrupada por (categoría, ubicación, mes) sobre
+los eventos con el resto de los filtros aplicados (visibilidad, fecha y búsqueda). Cada
+faceta suma los grupos que cumplen los filtros de las otras dos, no el propio: con una
+categoría elegida se siguen viendo las cantidades de las demás para poder cambiarla.
+
+La consulta devuelve una fila por combinación existente, no por evento, así que su costo
+no crece con la cantidad de opciones de cada filtro.
+"""
+
+import datetime
+from collections import Counter
+
+from django.db.models import Count, Q
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+FACETS = ("category", "venue", "month")
+
+
+def parse_id(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_month(value):
+    """'AAAA-MM' -> primer día del mes, o None si no es un mes válido."""
+    try:
+        return datetime.datetime.strptime(value or "", "%Y-%m").date()
+    except ValueError:
+        return None
+
+
+def month_range(month):
+    start = timezone.make_aware(datetime.datetime(month.year, month.month, 1))
+    if month.month == 12:
+        end = start.replace(year=month.year + 1, month=1)
+    else:
+        end = start.replace(month=month.month + 1)
+    return start, end
+
+
+def selected(filters):
+    """Valor elegido de cada faceta ({'category': id, 'venue': id, 'month': date}), o None."""
+    return {
+        "category": parse_id(filters.get("category")),
+        "venue": parse_id(filters.get("venue")),
+        "month": parse_month(filters.get("month")),
+    }
+
+
+def apply(events, filters):
+    """Aplica a `events` los filtros de categoría, ubicación y mes elegidos."""
+    chosen = selected(filters)
+    if chosen["category"] is not None:
+        events = events.filter(category_id=chosen["category"])
+    if chosen["venue"] is not None:
+        events = events.filter(venue_id=chosen["venue"])
+    if chosen["month"] is not None:
+        # Rango sobre scheduled_at en vez de __month para que se use el índice
+        start, end = month_range(chosen["month"])
+        events = events.filter(Q(scheduled_at__gte=start) & Q(scheduled_at__lt=end))
+    return events
+
+
+def counts(events, filters):
+    """
+    Cantidad de eventos por opción de cada faceta: {'category': Counter({id: n}),
+    'venue': Counter({id: n}), 'month': Counter({date: n})}. `events` son los eventos
+    sin los filtros de las facetas.
+    """
+    chosen = selected(filters)
+    groups = (
+        events.order_by()
+        .annotate(month=TruncMonth("scheduled_at"))
+        .values("category_id", "venue_id", "month")
+        .annotate(total=Count("pk"))
+    )
+
+    result = {facet: Counter() for facet in FACETS}
+    for group in groups:
+        key = {
+            "category": group["category_id"],
+            "venue": group["venue_id"],
+            # TruncMonth ya devuelve el inicio del mes en la zona horaria actual
+            "month": group["month"].date(),
+        }
+        for facet in FACETS:
+            if all(chosen[other] is None or key[other] == chosen[other] for other in FACETS if other != facet):
+                result[facet][key[facet]] += group["total"]
+    return result
@@ -0,0 +1,103 @@
+"""
+Caché de fragmentos HTML del catálogo de eventos.
+
+Un fragmento se guarda bajo una clave con su nombre, los parámetros que lo definen (por
+ejemplo los filtros del listado) y la versión del catálogo. Los receivers de models.py
+suben la versión cuando se guarda o borra un Event, Venue o Category: las claves viejas
+dejan de leerse y vencen solas, sin tener que buscarlas para borrarlas.
+
+La versión y los fragmentos viven en la caché `default`. Con LocMemCache cada proceso tiene
+la suya (sirve para desarrollo y tests); con varios workers hace falta una caché compartida
+(archivos, Redis, Memcached) para que una modificación invalide a todos.
+
+Los aciertos y fallos se cuentan en la misma caché (ver stats()).
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = "fragments:catalog-version"
+HITS_KEY = "fragments:hits"
+MISSES_KEY = "fragments:misses"
+
+
+def catalog_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # Si la versión se perdió (reinicio, desalojo) se arranca de un valor que no se usó
+        # antes, para no volver a leer fragmentos guardados con una versión anterior
+        cache.add(VERSION_KEY, time.time_ns(), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def _bump():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, time.time_ns(), None)
+
+
+def bump_catalog_version():
+    """
+    Invalida todos los fragmentos del catálogo. Se sube ya y otra vez al hacer commit, por si
+    un request concurrente guardó un fragmento con los datos previos a la escritura.
+    Los save() y delete() la llaman solos; hay que llamarla a mano después de bulk_create o
+    de un update() sobre eventos, ubicaciones o categorías.
+    """
+    _bump()
+    transaction.on_commit(_bump)
+
+
+def fragment_key(name, params):
+    """Clave del fragmento `name` para `params` (un QueryDict o un dict), sin importar el orden."""
+    items = params.lists() if hasattr(params, "lists") else ((key, [value]) for key, value in params.items())
+    digest = hashlib.sha256()
+    for key, values in sorted(items):
+        for value in values:
+            digest.update(f"{key}={value}\0".encode())
+    return f"fragments:{name}:{catalog_version()}:{digest.hexdigest()}"
+
+
+def _count(key):
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        pass
+
+
+def get_or_render(name, params, render):
+    """
+    Fragmento `name` para `params` desde la caché; si no está, lo genera con render() y lo
+    guarda por EVENTS_FRAGMENT_CACHE_SECONDS. Con 0 segundos la caché queda desactivada.
+    """
+    timeout = settings.EVENTS_FRAGMENT_CACHE_SECONDS
+    if not timeout:
+        return render()
+
+    key = fragment_key(name, params)
+    html = cache.get(key)
+    if html is not None:
+        _count(HITS_KEY)
+        return html
+
+    _count(MISSES_KEY)
+    html = render()
+    cache.set(key, html, timeout)
+    return html
+
+
+def stats():
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {"hits": hits, "misses": misses, "hit_rate": hits / total if total else 0.0}
+
+
+def reset_stats():
+    cache.delete_many([HITS_KEY, MISSES_KEY])
@@ -0,0 +1,164 @@
+"""
+Snapshot binario de los códigos válidos de un evento para los lectores sin conexión.
+
+Formato (enteros big-endian):
+- Encabezado: MAGIC, versión (u8), tipo (u8: FULL o DELTA), id del evento (u64),
+  generado en (u64, ms epoch) y desde (u64, ms epoch; 0 en un snapshot completo).
+- Registros ordenados por código: código ASCII de CODE_WIDTH bytes rellenado con ceros y
+  cantidad (u16). Ordenados, el lector busca con búsqueda binaria sin armar un índice.
+  En un delta, cantidad 0 significa que el ticket ya no es válido.
+- Cierre: cantidad de registros (u32) y CRC32 de todo lo anterior (u32).
+
+El lector guarda el `generated_at` del último snapshot y lo manda como `since` para pedir
+solo los cambios. Los tickets se leen con .iterator(), así que la memoria no depende del
+tamaño del evento.
+"""
+
+import heapq
+import struct
+import zlib
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.db import connection
+from django.db.models.functions import Collate
+from django.utils import timezone
+
+from .models import Ticket, TicketTombstone
+
+MAGIC = b"EHGS"
+VERSION = 1
+FULL = 0
+DELTA = 1
+CODE_WIDTH = 16
+
+HEADER = struct.Struct(">4sBBQQQ")
+RECORD = struct.Struct(f">{CODE_WIDTH}sH")
+TRAILER = struct.Struct(">II")
+
+MAX_QUANTITY = 0xFFFF
+CHUNK_SIZE = 2000
+
+
+def to_millis(moment):
+    return int(moment.timestamp() * 1000)
+
+
+def from_millis(millis):
+    return datetime.fromtimestamp(millis / 1000, tz=dt_timezone.utc)
+
+
+def _byte_order(field):
+    """
+    Ordena por bytes, igual que la búsqueda binaria del lector. SQLite compara así por
+    defecto; en Postgres hay que pedir la collation "C" para no usar la del idioma.
+    """
+    if connection.vendor == "postgresql":
+        return Collate(field, "C")
+    return field
+
+
+def encode_record(code, quantity):
+    raw = code.encode("ascii")
+    if len(raw) > CODE_WIDTH:
+        raise ValueError(f"El código {code!r} supera los {CODE_WIDTH} caracteres")
+    return RECORD.pack(raw, min(quantity, MAX_QUANTITY))
+
+
+def _tickets(event_id, since):
+    tickets = Ticket.objects.filter(event_id=event_id)
+    if since is not None:
+        tickets = tickets.filter(updated_at__gte=since)
+    rows = tickets.order_by(_byte_order("ticket_code")).values_list("ticket_code", "quantity")
+    return rows.iterator(chunk_size=CHUNK_SIZE)
+
+
+def _removed(event_id, since):
+    rows = (
+        TicketTombstone.objects.filter(event_id=event_id, deleted_at__gte=since)
+        .order_by(_byte_order("ticket_code"))
+        .values_list("ticket_code", flat=True)
+    )
+    for code in rows.iterator(chunk_size=CHUNK_SIZE):
+        yield code, 0
+
+
+def generate(event_id, since=None, now=None):
+    """
+    Genera el snapshot en partes de bytes. Con `since` (datetime) genera un delta con los
+    tickets creados o modificados y los borrados desde ese momento.
+    """
+    now = now or timezone.now()
+    kind = FULL if since is None else DELTA
+    header = HEADER.pack(
+        MAGIC, VERSION, kind, event_id, to_millis(now), 0 if since is None else to_millis(since)
+    )
+    crc = zlib.crc32(header)
+    yield header
+
+    records = _tickets(event_id, since)
+    if since is not None:
+        # Los borrados van primero: si un código aparece en ambos, gana el ticket vigente
+        records = heapq.merge(_removed(event_id, since), records, key=lambda record: record[0])
+
+    count = 0
+    chunk = []
+    for code, quantity in records:
+        chunk.append(encode_record(code, quantity))
+        count += 1
+        if len(chunk) >= CHUNK_SIZE:
+            data = b"".join(chunk)
+            crc = zlib.crc32(data, crc)
+            chunk = []
+            yield data
+
+    if chunk:
+        data = b"".join(chunk)
+        crc = zlib.crc32(data, crc)
+        yield data
+
+    count_bytes = struct.pack(">I", count)
+    yield count_bytes + struct.pack(">I", zlib.crc32(count_bytes, crc))
+
+
+def read(data):
+    """
+    Decodifica un snapshot completo. Retorna (encabezado, [(código, cantidad), ...]).
+    Lanza ValueError si el archivo está truncado o corrupto.
+    """
+    if len(data) < HEADER.size + TRAILER.size:
+        raise ValueError("Snapshot truncado")
+
+    count, crc = TRAILER.unpack_from(data, len(data) - TRAILER.size)
+    if zlib.crc32(data[:-4]) != crc:
+        raise ValueError("El CRC del snapshot no coincide")
+
+    magic, version, kind, event_id, generated_at, since = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Formato de snapshot desconocido")
+
+    body = data[HEADER.size:len(data) - TRAILER.size]
+    if len(body) != count * RECORD.size:
+        raise ValueError("La cantidad de registros no coincide")
+
+    records = [
+        (code.rstrip(b"\0").decode("ascii"), quantity)
+        for code, quantity in RECORD.iter_unpack(body)
+    ]
+    header = {
+        "kind": kind,
+        "event_id": event_id,
+        "generated_at": generated_at,
+        "since": since,
+    }
+    return header, records
+
+
+def apply(codes, records):
+    """Aplica los registros de un snapshot (completo o delta) a un dict código -> cantidad."""
+    for code, quantity in records:
+        if quantity:
+            codes[code] = quantity
+        else:
+            codes.pop(code, None)
+    return codes
@@ -0,0 +1,203 @@
+"""
+Búsqueda de ubicaciones y eventos cerca de un punto, sin PostGIS.
+
+Cada Venue guarda latitud, longitud y la celda de una grilla de CELL_DEGREES grados que
+las contiene (grid_cell = fila * COLUMNS + columna, con índice). Para buscar a menos de
+X km de un punto:
+1. Se calcula el rectángulo de latitudes y longitudes que contiene el círculo.
+2. Las celdas del rectángulo son, en cada fila, un rango de números consecutivos: el
+   filtro es un grid_cell BETWEEN por fila y se resuelve con el índice.
+3. Sobre esos candidatos se filtra por la distancia exacta (haversine) calculada en la
+   base con las funciones matemáticas de Django, que SQLite también tiene.
+
+Las coordenadas se cargan con el comando import_venue_coordinates desde un archivo CSV
+local (ver read_lookup), sin consultar servicios externos.
+"""
+
+import csv
+import math
+
+from django.db import transaction
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import ASin, Cos, Least, Power, Radians, Sin, Sqrt
+
+from . import fragment_cache
+from .models import Venue
+
+EARTH_RADIUS_KM = 6371.0088
+# Celdas de 0,1° (unos 11 km de alto): un radio de 50 km abarca unas 10 filas
+CELL_DEGREES = 0.1
+COLUMNS = round(360 / CELL_DEGREES)
+ROWS = round(180 / CELL_DEGREES)
+MAX_RADIUS_KM = 200
+RADIUS_CHOICES = (5, 10, 25, 50, 100)
+
+
+def _step(degrees):
+    """
+    Cantidad de celdas enteras en `degrees`. Se redondea antes de truncar porque la
+    división en punto flotante deja los bordes apenas por debajo del entero (360 / 0.1 da
+    3599.99...) y el punto caería en la celda anterior.
+    """
+    return math.floor(round(degrees / CELL_DEGREES, 9))
+
+
+def grid_cell(latitude, longitude):
+    """
+    Celda de la grilla que contiene el punto, o None si no hay coordenadas. La longitud
+    +180 es la misma columna que -180, y la latitud 90 queda en la última fila.
+    """
+    if latitude is None or longitude is None:
+        return None
+    row = min(_step(latitude + 90), ROWS - 1)
+    column = _step(longitude + 180) % COLUMNS
+    return row * COLUMNS + column
+
+
+def parse_point(latitude, longitude, radius):
+    """
+    (latitud, longitud, radio en km) a partir de los parámetros del request, o None si
+    falta alguno o no es válido. El radio se limita a MAX_RADIUS_KM.
+    """
+    try:
+        latitude, longitude, radius = float(latitude), float(longitude), float(radius)
+    except (TypeError, ValueError):
+        return None
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180) or not radius > 0:
+        return None
+    return latitude, longitude, min(radius, MAX_RADIUS_KM)
+
+
+def bounding_box(latitude, longitude, radius):
+    """(lat mín, lat máx, lon mín, lon máx) del círculo; las longitudes pueden salir de ±180."""
+    lat_delta = math.degrees(radius / EARTH_RADIUS_KM)
+    min_lat, max_lat = max(latitude - lat_delta, -90.0), min(latitude + lat_delta, 90.0)
+    # El círculo es más ancho en la latitud más alejada del ecuador
+    widest = max(abs(min_lat), abs(max_lat))
+    if widest >= 90:
+        return min_lat, max_lat, -180.0, 180.0
+    lon_delta = math.degrees(radius / (EARTH_RADIUS_KM * math.cos(math.radians(widest))))
+    if lon_delta >= 180:
+        return min_lat, max_lat, -180.0, 180.0
+    return min_lat, max_lat, longitude - lon_delta, longitude + lon_delta
+
+
+def cell_ranges(latitude, longitude, radius):
+    """Rangos [(primera celda, última celda), ...] que cubren el círculo, uno o dos por fila."""
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius)
+    first_row = grid_cell(min_lat, 0) // COLUMNS
+    last_row = grid_cell(max_lat, 0) // COLUMNS
+
+    if max_lon - min_lon >= 360:
+        columns = [(0, COLUMNS - 1)]
+    else:
+        first_column = grid_cell(0, min_lon) % COLUMNS
+        last_column = grid_cell(0, max_lon) % COLUMNS
+        if first_column <= last_column:
+            columns = [(first_column, last_column)]
+        else:
+            # El rectángulo cruza el antimeridiano
+            columns = [(first_column, COLUMNS - 1), (0, last_column)]
+
+    return [
+        (row * COLUMNS + start, row * COLUMNS + end)
+        for row in range(first_row, last_row + 1)
+        for start, end in columns
+    ]
+
+
+def distance_km(lat1, lon1, lat2, lon2):
+    """Distancia haversine entre dos puntos, en km."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def distance_expression(latitude, longitude):
+    """Distancia haversine en km de cada Venue al punto, como expresión de la base."""
+    lat = Radians(F("latitude"))
+    lon = Radians(F("longitude"))
+    point_lat = Value(math.radians(latitude), output_field=FloatField())
+    point_lon = Value(math.radians(longitude), output_field=FloatField())
+    a = (
+        Power(Sin((lat - point_lat) / 2), 2)
+        + Cos(point_lat) * Cos(lat) * Power(Sin((lon - point_lon) / 2), 2)
+    )
+    # Least evita que el redondeo deje a apenas por encima de 1
+    return 2 * EARTH_RADIUS_KM * ASin(Sqrt(Least(a, Value(1.0, output_field=FloatField()))))
+
+
+def nearby_venues(latitude, longitude, radius):
+    """
+    Ubicaciones a menos de `radius` km del punto, con la distancia en `distance`. Las
+    ubicaciones sin coordenadas no se incluyen.
+    """
+    cells = Q()
+    for start, end in cell_ranges(latitude, longitude, radius):
+        cells |= Q(grid_cell__range=(start, end))
+    return (
+        Venue.objects.filter(cells)
+        .annotate(distance=distance_expression(latitude, longitude))
+        .filter(distance__lte=radius)
+    )
+
+
+def near(events, latitude, longitude, radius):
+    """Los eventos de `events` cuya ubicación está a menos de `radius` km del punto."""
+    venue_ids = nearby_venues(latitude, longitude, radius).values("pk")
+    return events.filter(venue_id__in=venue_ids)
+
+
+def normalize(text):
+    return " ".join((text or "").split()).casefold()
+
+
+def read_lookup(lines):
+    """
+    Lee el archivo de coordenadas: CSV con encabezado city,address,latitude,longitude.
+    Una fila con la dirección vacía vale para las ubicaciones de esa ciudad que no tienen
+    una fila propia. Retorna {(ciudad, dirección): (latitud, longitud)} con la ciudad y la
+    dirección normalizadas. Lanza ValueError si una fila no es válida.
+    """
+    lookup = {}
+    reader = csv.DictReader(lines)
+    missing = {"city", "address", "latitude", "longitude"} - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"Faltan columnas: {', '.join(sorted(missing))}")
+
+    for row in reader:
+        point = parse_point(row["latitude"], row["longitude"], 1)
+        if point is None or not normalize(row["city"]):
+            raise ValueError(f"Fila {reader.line_num} inválida")
+        lookup[(normalize(row["city"]), normalize(row["address"]))] = point[:2]
+    return lookup
+
+
+def assign_coordinates(lookup, overwrite=False, batch_size=500):
+    """
+    Asigna a las ubicaciones las coordenadas de `lookup` (ver read_lookup). Sin `overwrite`
+    solo se completan las que no tienen. Retorna (actualizadas, sin coordenadas en el archivo).
+    """
+    venues = Venue.objects.order_by("pk").only("pk", "address", "city", "latitude", "longitude")
+    if not overwrite:
+        venues = venues.filter(latitude__isnull=True)
+
+    changed = []
+    not_found = 0
+    for venue in venues.iterator(chunk_size=batch_size):
+        city = normalize(venue.city)
+        point = lookup.get((city, normalize(venue.address))) or lookup.get((city, ""))
+        if point is None:
+            not_found += 1
+            continue
+        if (venue.latitude, venue.longitude) != point:
+            venue.set_coordinates(*point)
+            changed.append(venue)
+
+    # bulk_update no manda post_save: las coordenadas no cambian el índice de búsqueda ni
+    # la proyección de próximos eventos, pero sí el resultado de los filtros por cercanía
+    with transaction.atomic():
+        Venue.objects.bulk_update(changed, ["latitude", "longitude", "grid_cell"], batch_size=batch_size)
+    if changed:
+        fragment_cache.bump_catalog_version()
+    return len(changed), not_found
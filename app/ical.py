@@ -0,0 +1,149 @@
+"""
+Calendarios iCalendar (.ics) de eventos para suscribirse desde Google Calendar, Outlook, etc.
+
+Las aplicaciones de calendario no inician sesión, así que cada usuario tiene un token
+firmado (feed_token) que va en la URL del calendario y lo identifica. Hay tres calendarios:
+los eventos con entradas del usuario, los eventos que organiza y los próximos eventos de
+una categoría.
+
+Los clientes consultan el calendario cada pocos minutos. Antes de generar nada se calcula
+con una sola consulta qué eventos hay y su última modificación, de donde salen el ETag y
+Last-Modified: si el cliente ya tiene esa versión se responde 304. Si no, el
+calendario se genera de a un evento a medida que se envía (StreamingHttpResponse sobre
+.iterator()), sin cargar todos los eventos en memoria.
+"""
+
+import hashlib
+from datetime import timedelta
+from datetime import timezone as dt_timezone
+
+from django.core import signing
+from django.db.models import Count, F, Max, Sum
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from .models import User
+
+TOKEN_SALT = "app.ical.feed"
+# Los eventos no tienen hora de fin: se usan las mismas 3 horas que Event.is_future
+EVENT_DURATION = timedelta(hours=3)
+LINE_LENGTH = 75
+
+
+def feed_token(user):
+    return signing.Signer(salt=TOKEN_SALT).sign(str(user.pk))
+
+
+def user_from_token(token):
+    """Usuario del token, o None si el token no es válido."""
+    try:
+        user_id = signing.Signer(salt=TOKEN_SALT).unsign(token)
+    except signing.BadSignature:
+        return None
+    return User.objects.filter(pk=user_id, is_active=True).first()
+
+
+def escape(text):
+    """Escapa un valor de texto (RFC 5545, 3.3.11)."""
+    return (
+        (text or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line):
+    """Corta las líneas de más de 75 bytes en líneas de continuación (RFC 5545, 3.1)."""
+    encoded = line.encode()
+    if len(encoded) <= LINE_LENGTH:
+        return line + "\r\n"
+
+    parts = []
+    start = 0
+    limit = LINE_LENGTH
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # No cortar un carácter UTF-8 por la mitad
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        start = end
+        limit = LINE_LENGTH - 1  # las líneas de continuación empiezan con un espacio
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_datetime(moment):
+    return moment.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def event_lines(event, host, detail_url):
+    venue = event.venue
+    yield "BEGIN:VEVENT"
+    yield f"UID:event-{event.pk}@{host}"
+    yield f"DTSTAMP:{format_datetime(event.updated_at)}"
+    yield f"LAST-MODIFIED:{format_datetime(event.updated_at)}"
+    yield f"DTSTART:{format_datetime(event.scheduled_at)}"
+    yield f"DTEND:{format_datetime(event.scheduled_at + EVENT_DURATION)}"
+    yield f"SUMMARY:{escape(event.title)}"
+    yield f"DESCRIPTION:{escape(event.description)}"
+    yield f"LOCATION:{escape(f'{venue.name}, {venue.address}, {venue.city}')}"
+    yield f"URL:{detail_url}"
+    yield "END:VEVENT"
+
+
+def calendar(events, name, request):
+    """Genera el calendario línea por línea a partir de un queryset de Event."""
+    host = request.get_host().split(":")[0]
+    # La URL del detalle se arma una sola vez y se completa con el id de cada evento
+    detail_url = request.build_absolute_uri(reverse("event_detail", kwargs={"id": 0}))
+    prefix, suffix = detail_url.rsplit("/0/", 1)
+
+    yield fold("BEGIN:VCALENDAR")
+    yield fold("VERSION:2.0")
+    yield fold("PRODID:-//EventHub//Eventos//ES")
+    yield fold("CALSCALE:GREGORIAN")
+    yield fold("METHOD:PUBLISH")
+    yield fold(f"X-WR-CALNAME:{escape(name)}")
+    for event in events.select_related("venue").order_by("scheduled_at", "pk").iterator(chunk_size=500):
+        for line in event_lines(event, host, f"{prefix}/{event.pk}/{suffix}"):
+            yield fold(line)
+    yield fold("END:VCALENDAR")
+
+
+def feed_response(request, events, name, filename, version=""):
+    """
+    Respuesta del calendario de `events`, o 304 si el cliente ya tiene la versión actual.
+    La versión sale de los ids de los eventos (cantidad, suma y suma de cuadrados, que
+    cambian si un evento entra o sale aunque la cantidad sea la misma), de la última
+    modificación del evento o de su ubicación, y de `version` si la vista agrega algo.
+    """
+    state = events.order_by().aggregate(
+        total=Count("pk"),
+        ids=Sum("pk"),
+        squares=Sum(F("pk") * F("pk")),
+        updated=Max("updated_at"),
+        venue_updated=Max("venue__updated_at"),
+    )
+    moments = [moment for moment in (state["updated"], state["venue_updated"]) if moment is not None]
+    last_modified = max(moments).timestamp() if moments else None
+
+    version = (
+        f"{request.get_host()}:{name}:{state['total']}:{state['ids']}:{state['squares']}:"
+        f"{state['updated']}:{state['venue_updated']}:{version}"
+    )
+    etag = quote_etag(hashlib.sha256(version.encode()).hexdigest())
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = StreamingHttpResponse(calendar(events, name, request), content_type="text/calendar; charset=utf-8")
+        response["Content-Disposition"] = f'inline; filename="{filename}"'
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,114 @@
+"""
+Claves de idempotencia para los POST que compran o piden reembolsos.
+
+El cliente manda una clave única por operación, en el header Idempotency-Key o en el campo
+oculto `idempotency_key` de los formularios. La primera vez la vista se ejecuta normalmente
+y su respuesta se guarda en IdempotencyKey; los reintentos con la misma clave reciben esa
+misma respuesta sin volver a validar ni insertar nada.
+
+- Si llega un reintento mientras el original todavía se procesa se responde 409.
+- Si la clave se reusa con otros datos se responde 422.
+- Las respuestas 5xx y las excepciones no se guardan: el cliente puede reintentar.
+- Tampoco las marcadas con not_stored(), las de un request en el que la operación no se
+  llegó a ejecutar (por ejemplo, el usuario quedó en la sala de espera).
+
+Las vistas con @idempotent dejan en `request.idempotency_key` una clave nueva para el
+formulario que rendericen. Las claves vencidas se borran con purge_idempotency_keys.
+"""
+
+import hashlib
+import uuid
+from functools import wraps
+
+from django.http import HttpResponse, JsonResponse
+
+from .models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+FIELD = "idempotency_key"
+MAX_KEY_LENGTH = 100
+
+# Campos que cambian en cada envío aunque la operación sea la misma
+IGNORED_FIELDS = {"csrfmiddlewaretoken", FIELD}
+
+
+def request_fingerprint(request):
+    """SHA-256 de la ruta y los datos del POST, sin los campos que varían entre reintentos."""
+    digest = hashlib.sha256(request.path.encode())
+    for name in sorted(request.POST):
+        if name in IGNORED_FIELDS:
+            continue
+        for value in request.POST.getlist(name):
+            digest.update(b"\0" + name.encode() + b"=" + value.encode())
+    return digest.hexdigest()
+
+
+def replay(entry):
+    response = HttpResponse(entry.body, status=entry.status_code, content_type=entry.content_type or None)
+    if entry.location:
+        response["Location"] = entry.location
+    response["Idempotent-Replayed"] = "true"
+    return response
+
+
+def not_stored(response):
+    """Marca la respuesta para que no se guarde: un reintento con la misma clave vuelve a ejecutar la vista."""
+    response.idempotency_not_stored = True
+    return response
+
+
+def idempotent(scope):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            request.idempotency_key = uuid.uuid4().hex
+
+            if request.method != "POST" or not request.user.is_authenticated:
+                return view(request, *args, **kwargs)
+
+            key = request.headers.get(HEADER) or request.POST.get(FIELD)
+            if not key:
+                return view(request, *args, **kwargs)
+            if len(key) > MAX_KEY_LENGTH:
+                return JsonResponse(
+                    {"success": False, "error": f"La clave de idempotencia supera los {MAX_KEY_LENGTH} caracteres"},
+                    status=400,
+                )
+
+            fingerprint = request_fingerprint(request)
+            entry, created = IdempotencyKey.reserve(request.user, scope, key, fingerprint)
+
+            if not created:
+                if entry.request_hash != fingerprint:
+                    return JsonResponse(
+                        {"success": False, "error": "La clave de idempotencia ya se usó con otros datos"},
+                        status=422,
+                    )
+                if entry.is_pending():
+                    response = JsonResponse(
+                        {"success": False, "error": "La solicitud original todavía se está procesando"},
+                        status=409,
+                    )
+                    response["Retry-After"] = "1"
+                    return response
+                return replay(entry)
+
+            try:
+                response = view(request, *args, **kwargs)
+            except Exception:
+                entry.delete()
+                raise
+
+            if (
+                response.status_code >= 500
+                or response.streaming
+                or getattr(response, "idempotency_not_stored", False)
+            ):
+                entry.delete()
+            else:
+                entry.complete(response)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,189 @@
+"""
+Prueba de carga de la venta de entradas contra un servidor local.
+
+Se crea un evento con capacidad fija y N compradores. Cada comprador inicia sesión, consulta
+check_ticket_limit y compra por el formulario de purchase_ticket, todos a la vez desde un
+pool de threads. Al final se compara lo vendido contra Venue.capacity: cualquier excedente
+es una sobreventa.
+
+El servidor tiene que usar la misma base que el comando (SQLite con DB_SQLITE_WAL=1 o
+Postgres con DB_ENGINE), porque los datos se crean directamente con el ORM.
+"""
+
+import http.cookiejar
+import math
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db.models import Sum
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Category, Event, Ticket, User, Venue
+
+USERNAME_PREFIX = "loadtest-buyer-"
+PASSWORD = "loadtest-password"
+
+
+def seed(capacity, buyers):
+    """Crea el evento y los compradores. Retorna (evento, usernames)."""
+    organizer, _ = User.objects.get_or_create(
+        username="loadtest-organizer", defaults={"is_organizer": True}
+    )
+    event = Event.objects.create(
+        title="Prueba de carga",
+        description="Evento generado por loadtest_purchase",
+        scheduled_at=timezone.now() + timedelta(days=30),
+        organizer=organizer,
+        category=Category.objects.get_or_create(name="Prueba de carga", defaults={"description": "-"})[0],
+        venue=Venue.objects.create(
+            name="Prueba de carga", address="-", city="-", capacity=capacity, contact="-"
+        ),
+    )
+
+    # Un solo hash para todos: calcularlo N veces es más lento que la prueba en sí
+    password = make_password(PASSWORD)
+    usernames = [f"{USERNAME_PREFIX}{event.pk}-{i}" for i in range(buyers)]
+    User.objects.bulk_create([User(username=username, password=password) for username in usernames])
+    return event, usernames
+
+
+def cleanup(event, usernames):
+    venue_id = event.venue_id
+    event.delete()
+    Venue.objects.filter(pk=venue_id).delete()
+    User.objects.filter(username__in=usernames).delete()
+
+
+def percentile(values, fraction):
+    """Percentil por rango más cercano. `values` debe estar ordenado."""
+    if not values:
+        return 0.0
+    index = max(math.ceil(fraction * len(values)) - 1, 0)
+    return values[index]
+
+
+def summarize(latencies, errors, elapsed):
+    """`latencies` en segundos. Retorna las métricas de una operación."""
+    latencies = sorted(latencies)
+    total = len(latencies) + errors
+    return {
+        "requests": total,
+        "errors": errors,
+        "error_rate": errors / total if total else 0.0,
+        "throughput": total / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+class Buyer:
+    """Cliente HTTP con su propia sesión y cookie CSRF."""
+
+    def __init__(self, base_url, username, timeout=30):
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.timeout = timeout
+        self.cookies = http.cookiejar.CookieJar()
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookies))
+
+    def _csrf_token(self):
+        for cookie in self.cookies:
+            if cookie.name == "csrftoken":
+                return cookie.value
+        return ""
+
+    def _open(self, path, data=None):
+        body = None
+        headers = {}
+        if data is not None:
+            data = {**data, "csrfmiddlewaretoken": self._csrf_token()}
+            body = urllib.parse.urlencode(data).encode()
+            headers["Referer"] = self.base_url + path
+        request = urllib.request.Request(self.base_url + path, data=body, headers=headers)
+        with self.opener.open(request, timeout=self.timeout) as response:
+            response.read()
+            return response.geturl()
+
+    def login(self):
+        path = reverse("login")
+        self._open(path)
+        final_url = self._open(path, {"username": self.username, "password": PASSWORD})
+        if final_url.endswith(path):
+            raise RuntimeError(f"No se pudo iniciar sesión como {self.username}")
+
+    def check_limit(self, event_id, quantity):
+        path = reverse("check_ticket_limit", kwargs={"event_id": event_id})
+        self._open(f"{path}?cantidad={quantity}")
+
+    def purchase(self, event_id, quantity):
+        """Retorna True si la compra terminó en la lista de tickets del usuario."""
+        path = reverse("purchase_ticket", kwargs={"event_id": event_id})
+        final_url = self._open(path, {"cantidad": quantity, "tipoEntrada": "GENERAL"})
+        return final_url.endswith(reverse("view_ticket", kwargs={"event_id": event_id}))
+
+
+def run(base_url, event_id, usernames, quantity=1, concurrency=50):
+    """
+    Ejecuta la prueba. Los compradores inician sesión primero y las compras se liberan
+    todas juntas, como en la apertura de una venta.
+    """
+    buyers = [Buyer(base_url, username) for username in usernames]
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda buyer: buyer.login(), buyers))
+
+    start = threading.Event()
+    lock = threading.Lock()
+    samples = {"check_limit": [], "purchase": []}
+    errors = {"check_limit": 0, "purchase": 0}
+    purchased = []
+
+    def measure(operation, call):
+        started = time.perf_counter()
+        try:
+            result = call()
+        except OSError:
+            with lock:
+                errors[operation] += 1
+            return None
+        with lock:
+            samples[operation].append(time.perf_counter() - started)
+        return result
+
+    def buy(buyer):
+        start.wait()
+        measure("check_limit", lambda: buyer.check_limit(event_id, quantity))
+        if measure("purchase", lambda: buyer.purchase(event_id, quantity)):
+            with lock:
+                purchased.append(buyer.username)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(buy, buyer) for buyer in buyers]
+        started = time.perf_counter()
+        start.set()
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    event = Event.objects.select_related("venue").get(pk=event_id)
+    sold = Ticket.objects.filter(event_id=event_id).aggregate(total=Sum("quantity"))["total"] or 0
+
+    return {
+        "elapsed": elapsed,
+        "buyers": len(buyers),
+        "purchased": len(purchased),
+        "sold": sold,
+        "capacity": event.venue.capacity,
+        "oversell": max(sold - event.venue.capacity, 0),
+        "counter_drift": event.tickets_sold - sold,
+        "operations": {
+            operation: summarize(samples[operation], errors[operation], elapsed)
+            for operation in samples
+        },
+    }
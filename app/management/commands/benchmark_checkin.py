@@ -0,0 +1,66 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from app import checkin, ticket_codes
+from app.models import Category, Event, Ticket, User, Venue
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide escaneos por segundo del control de ingreso sobre un evento sintético. "
+        "Todo se hace dentro de una transacción que se descarta al final."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tickets", type=int, default=20000)
+        parser.add_argument("--flush-size", type=int, default=100)
+
+    def handle(self, *args, **options):
+        total = options["tickets"]
+
+        with transaction.atomic():
+            organizer = User.objects.create(username="benchmark-checkin-organizer", is_organizer=True)
+            buyer = User.objects.create(username="benchmark-checkin-buyer")
+            event = Event.objects.create(
+                title="Benchmark check-in",
+                description="Evento sintético",
+                scheduled_at=timezone.now(),
+                organizer=organizer,
+                category=Category.objects.create(name="Benchmark", description="Benchmark check-in"),
+                venue=Venue.objects.create(name="Benchmark", address="-", city="-", capacity=total, contact="-"),
+            )
+
+            codes = [ticket_codes.encode(number) for number in range(1, total + 1)]
+            Ticket.objects.bulk_create(
+                [
+                    Ticket(event=event, user=buyer, buy_date=timezone.now().date(), ticket_code=code, quantity=1, type="GENERAL")
+                    for code in codes
+                ],
+                batch_size=2000,
+            )
+
+            started = time.perf_counter()
+            gate = checkin.GateIndex.load(event.pk, flush_size=options["flush_size"])
+            load_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            statuses = [gate.scan(code)[0] for code in codes]
+            statuses += [gate.scan(code)[0] for code in codes[: total // 10]]
+            gate.flush()
+            scan_time = time.perf_counter() - started
+
+            admitted = statuses.count(checkin.ADMITTED)
+            duplicates = statuses.count(checkin.DUPLICATE)
+            transaction.set_rollback(True)
+
+        scans = len(statuses)
+        self.stdout.write(f"Carga del índice: {total} códigos en {load_time:.2f}s")
+        self.stdout.write(f"Admitidos: {admitted}, duplicados rechazados: {duplicates}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{scans} escaneos en {scan_time:.2f}s ({scans / scan_time:,.0f} escaneos/s, incluye guardado en lotes)"
+            )
+        )
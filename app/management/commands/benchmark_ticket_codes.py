@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app import ticket_codes
+
+
+class Command(BaseCommand):
+    help = "Genera N códigos de ticket, verifica que no haya colisiones y reporta el throughput"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=10_000_000)
+        parser.add_argument("--block-size", type=int, default=1000)
+        parser.add_argument(
+            "--exact",
+            action="store_true",
+            help="Además guarda todos los códigos en un set (usa mucha memoria con N grande)",
+        )
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        next_block = [1]
+
+        # Simula la tabla de secuencia en memoria para medir solo la generación
+        def allocator(size):
+            start = next_block[0]
+            next_block[0] += size
+            return start, start + size
+
+        generator = ticket_codes.TicketCodeGenerator(block_size=options["block_size"], allocator=allocator)
+        seen = set() if options["exact"] else None
+
+        started = time.perf_counter()
+        for expected in range(1, count + 1):
+            code = generator.next_code()
+            # decode(encode(n)) == n para todo n prueba que no hay dos números con el mismo código
+            if ticket_codes.decode(code) != expected:
+                raise CommandError(f"El código {code} no corresponde al número {expected}")
+            if seen is not None:
+                if code in seen:
+                    raise CommandError(f"Colisión en el código {code}")
+                seen.add(code)
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{count} códigos generados y verificados sin colisiones en {elapsed:.2f}s "
+                f"({count / elapsed:,.0f} códigos/s, incluye validación y decodificación)"
+            )
+        )
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from app.models import UpcomingEvent
+
+
+class Command(BaseCommand):
+    help = "Quita de la proyección de próximos eventos los que ya pasaron y vuelve a proyectar el resto"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Cantidad de eventos a proyectar por transacción",
+        )
+
+    def handle(self, *args, **options):
+        removed, projected = UpcomingEvent.compact(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"{removed} eventos pasados quitados, {projected} eventos proyectados"))
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app import exports
+from app.models import Event, User
+
+
+class Command(BaseCommand):
+    help = "Exporta en CSV o JSONL los eventos de un organizador o las entradas y asistentes de un evento"
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(exports.KINDS))
+        parser.add_argument("--event", type=int, help="Evento a exportar (para tickets y attendees)")
+        parser.add_argument("--organizer", help="Username del organizador (para events; por defecto, todos)")
+        parser.add_argument("--format", choices=sorted(exports.FORMATS), default="csv")
+        parser.add_argument("--output", help="Archivo de salida. Por defecto, la salida estándar.")
+
+    def handle(self, *args, **options):
+        kind = options["kind"]
+        if kind == "events":
+            organizer = None
+            if options["organizer"]:
+                organizer = User.objects.filter(username=options["organizer"]).first()
+                if organizer is None:
+                    raise CommandError(f"No existe el usuario {options['organizer']}")
+            rows = exports.events_rows(organizer)
+        else:
+            event_id = options["event"]
+            if event_id is None:
+                raise CommandError(f"{kind} requiere --event")
+            if not Event.objects.filter(pk=event_id).exists():
+                raise CommandError(f"No existe el evento {event_id}")
+            rows = exports.tickets_rows(event_id) if kind == "tickets" else exports.attendees_rows(event_id)
+
+        export = exports.Export(kind, options["format"], rows)
+        if options["output"]:
+            with open(options["output"], "w", newline="", encoding="utf-8") as output:
+                for chunk in export:
+                    output.write(chunk)
+        else:
+            for chunk in export:
+                self.stdout.write(chunk, ending="")
+
+        # A stderr, para no mezclarlo con los datos cuando se exporta a la salida estándar
+        self.stderr.write(
+            self.style.SUCCESS(
+                f"{export.rows} filas en {export.elapsed:.2f} s ({export.rows_per_second:.0f} filas/s)"
+            )
+        )
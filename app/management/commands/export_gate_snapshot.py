@@ -0,0 +1,45 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app import gate_snapshot
+from app.models import Event
+
+
+class Command(BaseCommand):
+    help = "Exporta el snapshot binario de códigos válidos de un evento para los lectores sin conexión"
+
+    def add_arguments(self, parser):
+        parser.add_argument("event_id", type=int)
+        parser.add_argument(
+            "--since",
+            type=int,
+            help="Timestamp en milisegundos del snapshot anterior; exporta solo los cambios.",
+        )
+        parser.add_argument("--output", help="Archivo de salida. Por defecto, la salida estándar.")
+
+    def handle(self, *args, **options):
+        event_id = options["event_id"]
+        if not Event.objects.filter(pk=event_id).exists():
+            raise CommandError(f"No existe el evento {event_id}")
+
+        since = options["since"]
+        if since is not None:
+            since = gate_snapshot.from_millis(since)
+
+        chunks = gate_snapshot.generate(event_id, since=since)
+        if options["output"]:
+            size = 0
+            with open(options["output"], "wb") as output:
+                for chunk in chunks:
+                    output.write(chunk)
+                    size += len(chunk)
+            records = (size - gate_snapshot.HEADER.size - gate_snapshot.TRAILER.size) // gate_snapshot.RECORD.size
+            self.stdout.write(
+                self.style.SUCCESS(f"{records} registros ({size} bytes) en {options['output']}")
+            )
+        else:
+            output = sys.stdout.buffer
+            for chunk in chunks:
+                output.write(chunk)
+            output.flush()
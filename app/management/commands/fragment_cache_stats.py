@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from app import fragment_cache
+
+
+class Command(BaseCommand):
+    help = "Muestra los aciertos y fallos de la caché de fragmentos del catálogo"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Pone los contadores en cero después de mostrarlos",
+        )
+
+    def handle(self, *args, **options):
+        stats = fragment_cache.stats()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{stats['hits']} aciertos, {stats['misses']} fallos "
+                f"({stats['hit_rate']:.0%} de aciertos), versión del catálogo {fragment_cache.catalog_version()}"
+            )
+        )
+        if options["reset"]:
+            fragment_cache.reset_stats()
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app import geo
+
+
+class Command(BaseCommand):
+    help = "Carga las coordenadas de las ubicaciones desde un archivo CSV (city,address,latitude,longitude)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Archivo CSV con las coordenadas")
+        parser.add_argument(
+            "--overwrite",
+            action="store_true",
+            help="Reemplaza también las coordenadas de las ubicaciones que ya tienen",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["path"], newline="", encoding="utf-8") as lines:
+                lookup = geo.read_lookup(lines)
+        except OSError as error:
+            raise CommandError(f"No se pudo leer {options['path']}: {error}") from None
+        except ValueError as error:
+            raise CommandError(str(error)) from None
+
+        updated, not_found = geo.assign_coordinates(lookup, overwrite=options["overwrite"])
+        self.stdout.write(self.style.SUCCESS(f"{updated} ubicaciones actualizadas"))
+        if not_found:
+            self.stdout.write(self.style.WARNING(f"{not_found} ubicaciones sin coordenadas en el archivo"))
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app import loadtest
+
+
+class Command(BaseCommand):
+    help = (
+        "Simula una venta masiva contra un servidor local: N compradores concurrentes sobre "
+        "purchase_ticket y check_ticket_limit. Reporta throughput, latencias y sobreventa."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://127.0.0.1:8000", help="Servidor a probar")
+        parser.add_argument("--buyers", type=int, default=500)
+        parser.add_argument("--capacity", type=int, default=200)
+        parser.add_argument("--quantity", type=int, default=1, help="Entradas por compra")
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--keep", action="store_true", help="No borra el evento ni los compradores")
+
+    def handle(self, *args, **options):
+        event, usernames = loadtest.seed(options["capacity"], options["buyers"])
+        try:
+            result = loadtest.run(
+                options["url"],
+                event.pk,
+                usernames,
+                quantity=options["quantity"],
+                concurrency=options["concurrency"],
+            )
+        finally:
+            if not options["keep"]:
+                loadtest.cleanup(event, usernames)
+
+        self.stdout.write(
+            f"{result['buyers']} compradores en {result['elapsed']:.2f}s: {result['purchased']} compras, "
+            f"{result['sold']}/{result['capacity']} entradas vendidas"
+        )
+        for operation, stats in result["operations"].items():
+            self.stdout.write(
+                f"{operation}: {stats['throughput']:.1f} req/s, p50 {stats['p50_ms']:.1f}ms, "
+                f"p95 {stats['p95_ms']:.1f}ms, p99 {stats['p99_ms']:.1f}ms, "
+                f"errores {stats['errors']} ({stats['error_rate']:.1%})"
+            )
+
+        if result["oversell"] or result["counter_drift"]:
+            raise CommandError(
+                f"Sobreventa de {result['oversell']} entradas, diferencia del contador {result['counter_drift']}"
+            )
+        self.stdout.write(self.style.SUCCESS("Sin sobreventa"))
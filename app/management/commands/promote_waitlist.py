@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from app.models import WaitlistEntry
+
+
+class Command(BaseCommand):
+    help = "Ofrece las entradas libres a las listas de espera de los eventos"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Cantidad de entradas de la lista a leer por consulta",
+        )
+
+    def handle(self, *args, **options):
+        event_ids = (
+            WaitlistEntry.objects.filter(offered_at__isnull=True)
+            .values_list("event_id", flat=True)
+            .distinct()
+        )
+        offered = sum(
+            WaitlistEntry.promote(event_id, batch_size=options["batch_size"]) for event_id in event_ids
+        )
+        self.stdout.write(self.style.SUCCESS(f"{offered} ofertas de lista de espera enviadas"))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from app.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = "Borra las claves de idempotencia vencidas"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Cantidad de claves a borrar por consulta",
+        )
+
+    def handle(self, *args, **options):
+        purged = IdempotencyKey.purge_expired(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"{purged} claves de idempotencia vencidas borradas"))
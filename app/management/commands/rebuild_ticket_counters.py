@@ -0,0 +1,90 @@
+from django.core.management.base import BaseCommand
+from django.db.models import F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+from app.models import Event, Ticket, TicketHold, TicketPool, UpcomingEvent
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula Event.tickets_sold, Event.tickets_held y los contadores de TicketPool "
+        "a partir de tickets y retenciones, y vuelve a proyectar los próximos eventos"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--event",
+            type=int,
+            action="append",
+            dest="events",
+            help="ID de evento a reconciliar (se puede repetir). Por defecto, todos.",
+        )
+
+    def handle(self, *args, **options):
+        sold = (
+            Ticket.objects.filter(event=OuterRef("pk"))
+            .values("event")
+            .annotate(total=Sum("quantity"))
+            .values("total")
+        )
+        held = (
+            TicketHold.objects.filter(event=OuterRef("pk"))
+            .values("event")
+            .annotate(total=Sum("quantity"))
+            .values("total")
+        )
+
+        events = Event.objects.all()
+        if options["events"]:
+            events = events.filter(pk__in=options["events"])
+
+        drifted = list(
+            events.annotate(
+                real_sold=Coalesce(Subquery(sold), 0),
+                real_held=Coalesce(Subquery(held), 0),
+            )
+            .filter(~Q(tickets_sold=F("real_sold")) | ~Q(tickets_held=F("real_held")))
+            .values_list("pk", "tickets_sold", "real_sold", "tickets_held", "real_held")
+        )
+
+        for event_id, counted, real, counted_held, real_held in drifted:
+            self.stdout.write(
+                f"Evento {event_id}: vendidas {counted} -> {real}, retenidas {counted_held} -> {real_held}"
+            )
+
+        updated = events.update(
+            tickets_sold=Coalesce(Subquery(sold), 0),
+            tickets_held=Coalesce(Subquery(held), 0),
+        )
+
+        pool_sold = (
+            Ticket.objects.filter(event=OuterRef("event"), type=OuterRef("type"))
+            .values("event")
+            .annotate(total=Sum("quantity"))
+            .values("total")
+        )
+        pool_held = (
+            TicketHold.objects.filter(event=OuterRef("event"), type=OuterRef("type"))
+            .values("event")
+            .annotate(total=Sum("quantity"))
+            .values("total")
+        )
+        pools = TicketPool.objects.filter(event__in=events)
+        pools_updated = pools.update(
+            sold=Coalesce(Subquery(pool_sold), 0),
+            held=Coalesce(Subquery(pool_held), 0),
+        )
+
+        # Los contadores se corrigen con update(), que no pasa por los receivers de
+        # UpcomingEvent: la capacidad restante de la proyección se recalcula acá
+        if options["events"]:
+            projected = UpcomingEvent.refresh(options["events"])
+        else:
+            _, projected = UpcomingEvent.compact()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{updated} eventos reconciliados ({len(drifted)} con diferencias), {pools_updated} cupos "
+                f"recalculados, {projected} próximos eventos proyectados"
+            )
+        )
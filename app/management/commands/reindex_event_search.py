@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app import search
+
+
+class Command(BaseCommand):
+    help = "Reconstruye el índice de búsqueda de eventos"
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            indexed = search.get_backend().rebuild()
+        self.stdout.write(self.style.SUCCESS(f"{indexed} eventos indexados"))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from app.models import TicketHold
+
+
+class Command(BaseCommand):
+    help = "Libera las entradas retenidas cuyo tiempo de checkout expiró"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Cantidad de retenciones a liberar por transacción",
+        )
+
+    def handle(self, *args, **options):
+        released = TicketHold.release_expired(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"{released} retenciones expiradas liberadas"))
@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-18 17:46
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def fill_tickets_sold(apps, schema_editor):
+    Event = apps.get_model('app', 'Event')
+    Ticket = apps.get_model('app', 'Ticket')
+    sold = (
+        Ticket.objects.filter(event=OuterRef('pk'))
+        .values('event')
+        .annotate(total=Sum('quantity'))
+        .values('total')
+    )
+    Event.objects.update(tickets_sold=Coalesce(Subquery(sold), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='tickets_sold',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_tickets_sold, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-18 17:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0005_ticket_code_sequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CheckIn',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('admitted_at', models.DateTimeField()),
+                ('gate', models.CharField(blank=True, max_length=50)),
+                ('ticket', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='checkin', to='app.ticket')),
+            ],
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2 on 2026-10-18 17:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0006_checkin'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ticket_code', models.CharField(max_length=100)),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['event', 'updated_at'], name='ticket_event_updated_idx'),
+        ),
+        migrations.AddField(
+            model_name='tickettombstone',
+            name='event',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ticket_tombstones', to='app.event'),
+        ),
+        migrations.AddIndex(
+            model_name='tickettombstone',
+            index=models.Index(fields=['event', 'deleted_at'], name='tombstone_event_deleted_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-18 18:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_gate_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketPool',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type', models.CharField(choices=[('GENERAL', 'GENERAL'), ('VIP', 'VIP')], max_length=10)),
+                ('capacity', models.PositiveIntegerField(blank=True, null=True)),
+                ('price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('sold', models.PositiveIntegerField(default=0)),
+                ('held', models.PositiveIntegerField(default=0)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pools', to='app.event')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('event', 'type'), name='ticketpool_event_type_unique')],
+            },
+        ),
+    ]
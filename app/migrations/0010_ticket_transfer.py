@@ -0,0 +1,56 @@
+# Generated by Django 5.2 on 2026-10-18 18:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0009_waitlist'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketTransfer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ticket_code', models.CharField(max_length=100)),
+                ('quantity', models.IntegerField()),
+                ('transferred_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['user', 'event', 'quantity'], name='ticket_user_event_idx'),
+        ),
+        migrations.AddField(
+            model_name='tickettransfer',
+            name='event',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ticket_transfers', to='app.event'),
+        ),
+        migrations.AddField(
+            model_name='tickettransfer',
+            name='from_user',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='transfers_sent', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='tickettransfer',
+            name='ticket',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='transfers', to='app.ticket'),
+        ),
+        migrations.AddField(
+            model_name='tickettransfer',
+            name='to_user',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='transfers_received', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='tickettransfer',
+            index=models.Index(fields=['ticket_code', 'transferred_at'], name='transfer_code_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tickettransfer',
+            index=models.Index(fields=['event', 'transferred_at'], name='transfer_event_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-18 18:42
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0012_event_scheduled_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='category_name_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['event', 'created_at'], name='comment_event_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['organizer', 'scheduled_at', 'id'], name='event_organizer_sched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['category', 'scheduled_at', 'id'], name='event_category_sched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['venue', 'scheduled_at', 'id'], name='event_venue_sched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='refoundrequest',
+            index=models.Index(fields=['ticket_code'], name='refound_ticket_code_idx'),
+        ),
+        # La tabla intermedia de Notification.users no tiene modelo propio. Con (user_id,
+        # notification_id) las notificaciones de un usuario salen solo del índice.
+        migrations.RunSQL(
+            sql='CREATE INDEX notification_users_user_idx ON app_notification_users (user_id, notification_id)',
+            reverse_sql='DROP INDEX notification_users_user_idx',
+        ),
+    ]
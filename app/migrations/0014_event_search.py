@@ -0,0 +1,55 @@
+from django.db import migrations
+
+# Tabla del índice de búsqueda de eventos (ver app/search.py). No tiene modelo: en SQLite
+# es una tabla virtual FTS5 y en Postgres una tabla con un tsvector y un índice GIN.
+
+
+def create_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            "CREATE TABLE app_event_search ("
+            "event_id bigint PRIMARY KEY REFERENCES app_event (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+            "document tsvector NOT NULL)"
+        )
+        schema_editor.execute("CREATE INDEX app_event_search_document_idx ON app_event_search USING GIN (document)")
+    else:
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE app_event_search USING fts5("
+            "title, description, venue, category, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+
+
+def drop_search_table(apps, schema_editor):
+    schema_editor.execute("DROP TABLE IF EXISTS app_event_search")
+
+
+def index_existing_events(apps, schema_editor):
+    Event = apps.get_model("app", "Event")
+    rows = Event.objects.order_by("pk").values_list("pk", "title", "description", "venue__name", "category__name")
+
+    with schema_editor.connection.cursor() as cursor:
+        for row in rows.iterator(chunk_size=500):
+            if schema_editor.connection.vendor == "postgresql":
+                cursor.execute(
+                    "INSERT INTO app_event_search (event_id, document) VALUES (%s, "
+                    "setweight(to_tsvector('spanish', %s), 'A') || setweight(to_tsvector('spanish', %s), 'C') || "
+                    "setweight(to_tsvector('spanish', %s), 'B') || setweight(to_tsvector('spanish', %s), 'B'))",
+                    row,
+                )
+            else:
+                cursor.execute(
+                    "INSERT INTO app_event_search (rowid, title, description, venue, category) VALUES (%s, %s, %s, %s, %s)",
+                    row,
+                )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0013_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table),
+        migrations.RunPython(index_existing_events, migrations.RunPython.noop),
+    ]
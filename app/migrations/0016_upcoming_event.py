@@ -0,0 +1,77 @@
+# Generated by Django 5.2 on 2026-10-18 19:08
+
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Avg, OuterRef, Subquery
+from django.db.models.functions import Round
+from django.utils import timezone
+
+
+def project_upcoming_events(apps, schema_editor):
+    """Proyecta los eventos próximos que ya existen (como UpcomingEvent.compact)."""
+    Event = apps.get_model("app", "Event")
+    Rating = apps.get_model("app", "Rating")
+    UpcomingEvent = apps.get_model("app", "UpcomingEvent")
+
+    average = Subquery(
+        Rating.objects.filter(event=OuterRef("pk")).values("event").annotate(average=Round(Avg("rating"), 2)).values("average")
+    )
+    rows = Event.objects.filter(scheduled_at__gte=timezone.now() - timedelta(hours=3)).order_by("pk").values(
+        "pk", "title", "scheduled_at", "category_id", "category__name", "venue_id", "venue__name",
+        "venue__city", "venue__capacity", "organizer_id", "organizer__username", "tickets_sold", "tickets_held",
+    ).annotate(average_rating=average)
+
+    UpcomingEvent.objects.bulk_create(
+        (
+            UpcomingEvent(
+                event_id=row["pk"],
+                title=row["title"],
+                scheduled_at=row["scheduled_at"],
+                category_id=row["category_id"],
+                category_name=row["category__name"],
+                venue_id=row["venue_id"],
+                venue_name=row["venue__name"],
+                venue_city=row["venue__city"],
+                organizer_id=row["organizer_id"],
+                organizer_username=row["organizer__username"],
+                average_rating=row["average_rating"],
+                remaining_capacity=max(row["venue__capacity"] - row["tickets_sold"] - row["tickets_held"], 0),
+            )
+            for row in rows.iterator(chunk_size=500)
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0015_venue_category_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UpcomingEvent',
+            fields=[
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='upcoming', serialize=False, to='app.event')),
+                ('title', models.CharField(max_length=200)),
+                ('scheduled_at', models.DateTimeField()),
+                ('category_id', models.IntegerField()),
+                ('category_name', models.CharField(max_length=200)),
+                ('venue_id', models.IntegerField()),
+                ('venue_name', models.CharField(max_length=200)),
+                ('venue_city', models.CharField(max_length=200)),
+                ('organizer_id', models.IntegerField()),
+                ('organizer_username', models.CharField(max_length=150)),
+                ('average_rating', models.FloatField(null=True)),
+                ('remaining_capacity', models.IntegerField()),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['scheduled_at', 'event'], name='upcoming_scheduled_idx'), models.Index(fields=['category_id', 'scheduled_at', 'event'], name='upcoming_category_sched_idx'), models.Index(fields=['venue_id', 'scheduled_at', 'event'], name='upcoming_venue_sched_idx')],
+            },
+        ),
+        migrations.RunPython(project_upcoming_events, migrations.RunPython.noop),
+    ]
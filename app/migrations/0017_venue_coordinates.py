@@ -0,0 +1,32 @@
+# Generated by Django 5.2 on 2026-10-18 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0016_upcoming_event'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='venue',
+            name='grid_cell',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='venue',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='venue',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='venue',
+            index=models.Index(fields=['grid_cell'], name='venue_grid_cell_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-18 20:10
+
+import math
+
+from django.db import migrations
+
+CELL_DEGREES = 0.1
+COLUMNS = 3600
+ROWS = 1800
+
+
+def step(degrees):
+    return math.floor(round(degrees / CELL_DEGREES, 9))
+
+
+def recompute_grid_cell(apps, schema_editor):
+    """Recalcula grid_cell con la cuenta corregida de app/geo.py para los puntos en los bordes."""
+    Venue = apps.get_model("app", "Venue")
+    changed = []
+    for venue in Venue.objects.filter(latitude__isnull=False, longitude__isnull=False).iterator(chunk_size=500):
+        cell = min(step(venue.latitude + 90), ROWS - 1) * COLUMNS + step(venue.longitude + 180) % COLUMNS
+        if cell != venue.grid_cell:
+            venue.grid_cell = cell
+            changed.append(venue)
+    Venue.objects.bulk_update(changed, ["grid_cell"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0017_venue_coordinates'),
+    ]
+
+    operations = [
+        migrations.RunPython(recompute_grid_cell, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-18 21:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0018_recompute_venue_grid_cell'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='waitlistentry',
+            name='waitlist_waiting_idx',
+        ),
+        migrations.AddIndex(
+            model_name='waitlistentry',
+            index=models.Index(condition=models.Q(('offered_at__isnull', True)), fields=['event', 'joined_at', 'id', 'type'], name='waitlist_waiting_idx'),
+        ),
+    ]
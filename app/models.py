@@ -1,12 +1,20 @@
+from collections import defaultdict
 from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
-from django.db.models import Avg
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import Avg, Exists, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Greatest, Round, Upper
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 
+from . import fragment_cache
+
 
 class User(AbstractUser):
     is_organizer = models.BooleanField(default=False)
@@ -38,9 +46,27 @@ class Venue(models.Model):
     city = models.CharField(max_length=200)
     capacity = models.IntegerField()
     contact = models.CharField(max_length=200)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Coordenadas para la búsqueda por cercanía (ver app/geo.py); se cargan con
+    # import_venue_coordinates
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    grid_cell = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["grid_cell"], name="venue_grid_cell_idx"),
+        ]
 
     def __str__(self):
         return self.name
+
+    def set_coordinates(self, latitude, longitude):
+        """Asigna las coordenadas y la celda de la grilla que les corresponde (sin guardar)."""
+        from . import geo
+        self.latitude = latitude
+        self.longitude = longitude
+        self.grid_cell = geo.grid_cell(latitude, longitude)
     
     @classmethod
     def validate(cls, name, address, city, capacity, contact):
@@ -67,6 +93,13 @@ class Category (models.Model):
     name = models.CharField(max_length=200)
     description = models.TextField()
     is_active = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Nombres repetidos sin distinguir mayúsculas (ver validate)
+            models.Index(Upper("name"), name="category_name_upper_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -90,7 +123,9 @@ class Category (models.Model):
         if len(description) > 1000:
             errors["description"] = "La descripción no puede tener más de 1000 caracteres."
 
-        qs = cls.objects.filter(name__iexact=name)
+        # UPPER() de los dos lados, como name__iexact en Postgres, pero en SQLite también
+        # usa category_name_upper_idx (iexact ahí es un LIKE que no usa índices)
+        qs = cls.objects.alias(name_upper=Upper("name")).filter(name_upper=Upper(Value(name)))
         if exclude_id:
             qs = qs.exclude(pk=exclude_id)
         if qs.exists():
@@ -132,6 +167,18 @@ class Event(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     category = models.ForeignKey(Category, on_delete=models.PROTECT, related_name="category_event")
+    tickets_sold = models.PositiveIntegerField(default=0)
+    tickets_held = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            # Paginación por cursor del listado de eventos (ver app/pagination.py)
+            models.Index(fields=["scheduled_at", "id"], name="event_scheduled_idx"),
+            # El mismo orden con los filtros del listado: organizador, categoría y ubicación
+            models.Index(fields=["organizer", "scheduled_at", "id"], name="event_organizer_sched_idx"),
+            models.Index(fields=["category", "scheduled_at", "id"], name="event_category_sched_idx"),
+            models.Index(fields=["venue", "scheduled_at", "id"], name="event_venue_sched_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -199,7 +246,133 @@ class Event(models.Model):
             self.venue = venue
         self.save()        
 
-        
+    def reserve_tickets(self, quantity, type=None):
+        """
+        Suma `quantity` al contador de entradas vendidas solo si entra en la capacidad del venue
+        (descontando las entradas retenidas). Es un único UPDATE condicional, por lo que dos
+        compras simultáneas no pueden sobrevender. Con `type` también se reserva en el cupo
+        de ese tipo de entrada (TicketPool), si el evento lo tiene.
+        Retorna True si se pudo reservar.
+        """
+        use_pool = type is not None and self.may_have_pools()
+        if use_pool and not TicketPool.reserve(self.pk, type, quantity):
+            return False
+
+        updated = Event.objects.filter(
+            pk=self.pk,
+            tickets_sold__lte=self.venue.capacity - quantity - F("tickets_held"),
+        ).update(tickets_sold=F("tickets_sold") + quantity)
+
+        if not updated:
+            if use_pool:
+                TicketPool.release(self.pk, type, quantity)
+            return False
+
+        self.tickets_sold += quantity
+        UpcomingEvent.refresh_capacity_on_commit(self.pk)
+        return True
+
+    def release_tickets(self, quantity, type=None):
+        """
+        Devuelve `quantity` entradas al contador de vendidas (nunca baja de 0).
+        """
+        Event.objects.filter(pk=self.pk).update(
+            tickets_sold=Greatest(F("tickets_sold") - quantity, 0)
+        )
+        self.tickets_sold = max(self.tickets_sold - quantity, 0)
+        UpcomingEvent.refresh_capacity_on_commit(self.pk)
+        if type is not None and self.may_have_pools():
+            TicketPool.release(self.pk, type, quantity)
+
+    def hold_tickets(self, quantity, type=None):
+        """
+        Igual que reserve_tickets pero suma al contador de entradas retenidas.
+        """
+        use_pool = type is not None and self.may_have_pools()
+        if use_pool and not TicketPool.hold(self.pk, type, quantity):
+            return False
+
+        updated = Event.objects.filter(
+            pk=self.pk,
+            tickets_held__lte=self.venue.capacity - quantity - F("tickets_sold"),
+        ).update(tickets_held=F("tickets_held") + quantity)
+
+        if not updated:
+            if use_pool:
+                TicketPool.release_held(self.pk, type, quantity)
+            return False
+
+        self.tickets_held += quantity
+        UpcomingEvent.refresh_capacity_on_commit(self.pk)
+        return True
+
+    @classmethod
+    def release_held_tickets(cls, event_id, quantity, sold=0, type=None):
+        """
+        Descuenta `quantity` de las entradas retenidas del evento. Si `sold` es mayor a 0,
+        esa cantidad pasa a vendidas en el mismo UPDATE.
+        """
+        cls.objects.filter(pk=event_id).update(
+            tickets_held=Greatest(F("tickets_held") - quantity, 0),
+            tickets_sold=F("tickets_sold") + sold,
+        )
+        UpcomingEvent.refresh_capacity_on_commit(event_id)
+        if type is not None:
+            TicketPool.release_held(event_id, type, quantity, sold=sold)
+
+    def may_have_pools(self):
+        """
+        False solo si el evento se cargó con la anotación `has_pools` (ver
+        Ticket.purchase_queryset) y no tiene cupos: así la compra no consulta TicketPool.
+        """
+        return getattr(self, "has_pools", True)
+
+    def available_tickets(self, type=None):
+        available = self.venue.capacity - self.tickets_sold - self.tickets_held
+        if type is None or not self.may_have_pools():
+            return available
+
+        pool = TicketPool.objects.filter(event=self, type=type).first()
+        return pool.available(available) if pool else available
+
+    def availability(self):
+        """
+        Disponibilidad y precio de cada tipo de entrada, con una sola consulta a los cupos.
+        Retorna una lista de dicts {type, label, available, price} en el orden de TICKET_TYPES.
+        """
+        available = self.available_tickets()
+        pools = {pool.type: pool for pool in self.pools.all()} if self.may_have_pools() else {}
+
+        result = []
+        for type, label in Ticket.TICKET_TYPES:
+            pool = pools.get(type)
+            result.append({
+                "type": type,
+                "label": label,
+                "available": max(pool.available(available) if pool else available, 0),
+                "price": pool.get_price() if pool else Ticket.DEFAULT_PRICES[type],
+            })
+        return result
+
+    @classmethod
+    def cached_availability(cls, event_id):
+        """
+        Entradas disponibles del evento y de cada tipo, compartidas entre todos los usuarios
+        durante TICKET_AVAILABILITY_CACHE_SECONDS. Es solo informativo: la compra siempre
+        valida contra los contadores. Retorna None si el evento no existe.
+        """
+        key = f"event-availability:{event_id}"
+        data = cache.get(key)
+        if data is None:
+            event = cls.objects.select_related("venue").filter(pk=event_id).first()
+            if event is None:
+                return None
+            data = {
+                "available": max(event.available_tickets(), 0),
+                "types": {tier["type"]: tier["available"] for tier in event.availability()},
+            }
+            cache.set(key, data, settings.TICKET_AVAILABILITY_CACHE_SECONDS)
+        return data
 
     def is_future(self):
         time_now = timezone.now() - timedelta(hours=3)
@@ -321,6 +494,10 @@ class RefoundRequest(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="user_refund")
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="refound_event")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["ticket_code"], name="refound_ticket_code_idx"),
+        ]
 
     def __str__(self):
         return self.ticket_code
@@ -373,12 +550,26 @@ class Ticket(models.Model):
         ("GENERAL", "GENERAL"),
         ("VIP", "VIP"),
     ]
+    # Precio por tipo cuando el evento no definió uno en su TicketPool
+    DEFAULT_PRICES = {
+        "GENERAL": 150000,
+        "VIP": 300000,
+    }
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="tickets")
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="tickets")
     buy_date = models.DateField()
     ticket_code = models.CharField(max_length=100, unique=True)
     quantity = models.IntegerField()
     type = models.CharField(max_length=10, choices=TICKET_TYPES)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Deltas de los snapshots de la puerta (app/gate_snapshot.py)
+            models.Index(fields=["event", "updated_at"], name="ticket_event_updated_idx"),
+            # Límite de 4 por usuario: la suma de cantidades se resuelve solo con el índice
+            models.Index(fields=["user", "event", "quantity"], name="ticket_user_event_idx"),
+        ]
 
     def __str__(self):
         return self.ticket_code
@@ -395,14 +586,12 @@ class Ticket(models.Model):
     @classmethod
     def validate_capacity(cls, event, quantity, exclude_ticket_id=None):
         """
-        Valida que haya suficiente capacidad disponible en el evento
+        Valida que haya suficiente capacidad disponible en el evento.
+        Usa el contador `Event.tickets_sold` en lugar de sumar todos los tickets.
         """
-        query = cls.objects.filter(event=event)
+        disponibles = event.available_tickets()
         if exclude_ticket_id:
-            query = query.exclude(id=exclude_ticket_id)
-        
-        tickets_vendidos = query.aggregate(total=models.Sum('quantity'))['total'] or 0
-        disponibles = event.venue.capacity - tickets_vendidos
+            disponibles += cls.objects.filter(id=exclude_ticket_id).values_list('quantity', flat=True).first() or 0
         
         if quantity > disponibles:
             return False, f"No hay suficientes entradas disponibles (quedan {disponibles})"
@@ -448,24 +637,246 @@ class Ticket(models.Model):
         if len(errors.keys()) > 0:
             return False, errors
 
-        Ticket.objects.create(
-            buy_date=buy_date,
-            ticket_code=ticket_code,
-            quantity=quantity,
-            type=type,
-            event=event,
-            user=user,
-        )
+        quantity = int(quantity)
+
+        # El contador y el ticket se escriben en la misma transacción
+        with transaction.atomic():
+            if not event.reserve_tickets(quantity, type):
+                event.refresh_from_db(fields=["tickets_sold", "tickets_held"])
+                return False, {
+                    "capacity": f"No hay suficientes entradas {type} disponibles (quedan {event.available_tickets(type)})"
+                }
+
+            Ticket.objects.create(
+                buy_date=buy_date,
+                ticket_code=ticket_code,
+                quantity=quantity,
+                type=type,
+                event=event,
+                user=user,
+            )
 
         return True, None
 
     def update(self, buy_date, ticket_code, quantity, type):
         self.buy_date = buy_date or self.buy_date
         self.ticket_code = ticket_code or self.ticket_code
-        self.quantity = quantity or self.quantity
-        self.type = type or self.type
 
-        self.save()
+        # update_quantity mueve las entradas de cupo si cambia el tipo
+        return self.update_quantity(quantity or self.quantity, type or self.type)
+
+    def update_quantity(self, quantity, type):
+        """
+        Cambia la cantidad y el tipo del ticket ajustando el contador de vendidas del evento.
+        Si la cantidad aumenta solo se reserva la diferencia.
+        """
+        quantity = int(quantity)
+        delta = quantity - self.quantity
+        event = self.event
+
+        with transaction.atomic():
+            # El cupo del tipo: si cambia el tipo se pasa toda la cantidad de un cupo al otro
+            pool_ok = True
+            if event.may_have_pools():
+                if type != self.type:
+                    pool_ok = TicketPool.reserve(event.pk, type, quantity)
+                    if pool_ok:
+                        TicketPool.release(event.pk, self.type, self.quantity)
+                elif delta > 0:
+                    pool_ok = TicketPool.reserve(event.pk, type, delta)
+                elif delta < 0:
+                    TicketPool.release(event.pk, type, -delta)
+
+            if not pool_ok:
+                event.refresh_from_db(fields=["tickets_sold", "tickets_held"])
+                disponibles = event.available_tickets(type) + (self.quantity if type == self.type else 0)
+                return False, {
+                    "capacity": f"La cantidad excede las entradas {type} disponibles. Máximo disponible: {disponibles}"
+                }
+
+            if delta > 0 and not event.reserve_tickets(delta):
+                event.refresh_from_db(fields=["tickets_sold", "tickets_held"])
+                disponibles = event.available_tickets() + quantity - delta
+                # Deshace el movimiento de cupos hecho arriba
+                transaction.set_rollback(True)
+                return False, {
+                    "capacity": f"La cantidad excede la capacidad disponible del evento. Máximo disponible: {disponibles}"
+                }
+            if delta < 0:
+                event.release_tickets(-delta)
+
+            self.quantity = quantity
+            self.type = type
+            self.save()
+
+        return True, None
+
+    def transfer(self, to_user):
+        """
+        Pasa el ticket a `to_user` en una sola transacción. Las entradas ya están vendidas,
+        así que el contador del evento no cambia: solo se controla el límite de 4 entradas
+        del destinatario y se deja registro en TicketTransfer.
+        Retorna (True, TicketTransfer) o (False, errores).
+        """
+        errors = {}
+        from_user_id = self.user_id
+
+        if to_user.pk == from_user_id:
+            errors["user"] = "El ticket ya pertenece a ese usuario"
+        elif to_user.is_organizer:
+            errors["user"] = "Los organizadores no pueden recibir entradas"
+
+        valid_date, error_msg = Ticket.validate_event_date(self.event)
+        if not valid_date:
+            errors["event_date"] = error_msg
+
+        if CheckIn.objects.filter(ticket_id=self.pk).exists():
+            errors["checkin"] = "No se puede transferir un ticket que ya ingresó al evento"
+
+        if len(errors.keys()) > 0:
+            return False, errors
+
+        with transaction.atomic():
+            # Dos transferencias simultáneas al mismo usuario se serializan en su fila, así
+            # no pueden pasar juntas el control del límite
+            list(User.objects.select_for_update().filter(pk=to_user.pk).values_list("pk", flat=True))
+
+            owned = Ticket.get_user_tickets_count(to_user, self.event) + TicketHold.get_user_held_count(to_user, self.event)
+            if owned + self.quantity > 4:
+                return False, {
+                    "quantity": f"El destinatario ya tiene {owned} entradas para este evento y superaría el límite de 4"
+                }
+
+            # Solo se transfiere si el ticket sigue siendo del remitente
+            moved = Ticket.objects.filter(pk=self.pk, user_id=from_user_id).update(
+                user_id=to_user.pk, updated_at=timezone.now()
+            )
+            if not moved:
+                return False, {"user": "El ticket ya no pertenece al usuario que lo transfiere"}
+
+            transfer = TicketTransfer.objects.create(
+                ticket_id=self.pk,
+                event_id=self.event_id,
+                ticket_code=self.ticket_code,
+                quantity=self.quantity,
+                from_user_id=from_user_id,
+                to_user_id=to_user.pk,
+            )
+            Ticket.forget_user_tickets(self.event_id, [from_user_id, to_user.pk])
+
+        self.user = to_user
+        return True, transfer
+
+    @classmethod
+    def new_batch(cls, orders, buy_date, next_code, organizer=None):
+        """
+        Procesa una lista de órdenes {"event", "user", "type", "quantity"} de una sola vez.
+        Eventos, usuarios y entradas previas se cargan con consultas agrupadas, la capacidad se
+        reserva con un UPDATE por evento y los tickets se insertan con bulk_create.
+        Una orden inválida no frena al resto. Si se pasa `organizer`, solo se aceptan
+        órdenes de sus eventos.
+        Retorna una lista de resultados en el mismo orden que `orders`.
+        """
+        results = [None] * len(orders)
+        valid_types = [choice[0] for choice in cls.TICKET_TYPES]
+        parsed = {}
+
+        for index, order in enumerate(orders):
+            try:
+                event_id = int(order["event"])
+                user_id = int(order["user"])
+                quantity = int(order["quantity"])
+            except (KeyError, TypeError, ValueError):
+                results[index] = {"success": False, "error": "La orden debe tener event, user y quantity numéricos"}
+                continue
+
+            ticket_type = order.get("type", "GENERAL")
+            if ticket_type not in valid_types:
+                results[index] = {"success": False, "error": "Tipo de entrada no válido"}
+            elif quantity <= 0:
+                results[index] = {"success": False, "error": "La cantidad de entradas debe ser mayor a 0"}
+            else:
+                parsed[index] = (event_id, user_id, quantity, ticket_type)
+
+        event_ids = {event_id for event_id, _, _, _ in parsed.values()}
+        user_ids = {user_id for _, user_id, _, _ in parsed.values()}
+        events = Event.objects.select_related("venue").annotate(
+            has_pools=Exists(TicketPool.objects.filter(event=OuterRef("pk")))
+        ).in_bulk(event_ids)
+        existing_users = set(User.objects.filter(pk__in=user_ids).values_list("pk", flat=True))
+
+        user_totals = defaultdict(int)
+        for row in (
+            cls.objects.filter(event_id__in=event_ids, user_id__in=user_ids)
+            .values("event_id", "user_id")
+            .annotate(total=Sum("quantity"))
+        ):
+            user_totals[(row["event_id"], row["user_id"])] = row["total"]
+
+        now = timezone.now()
+        accepted = defaultdict(list)
+
+        for index, (event_id, user_id, quantity, ticket_type) in parsed.items():
+            event = events.get(event_id)
+            error = None
+
+            if event is None:
+                error = "El evento no existe"
+            elif organizer is not None and event.organizer_id != organizer.pk:
+                error = "Solo puedes vender entradas de tus propios eventos"
+            elif now > event.scheduled_at:
+                error = "No se pueden gestionar entradas para eventos que ya ocurrieron"
+            elif user_id not in existing_users:
+                error = "El usuario no existe"
+            elif user_totals[(event_id, user_id)] + quantity > 4:
+                error = f"No puedes comprar más de 4 entradas por evento (ya has comprado {user_totals[(event_id, user_id)]}, lo que excedería el límite)"
+
+            if error:
+                results[index] = {"success": False, "error": error}
+                continue
+
+            user_totals[(event_id, user_id)] += quantity
+            accepted[(event_id, ticket_type)].append(
+                (index, cls(
+                    event_id=event_id,
+                    user_id=user_id,
+                    buy_date=buy_date,
+                    ticket_code=next_code(),
+                    quantity=quantity,
+                    type=ticket_type,
+                ))
+            )
+
+        for (event_id, ticket_type), group in accepted.items():
+            event = events[event_id]
+            rejected = []
+
+            with transaction.atomic():
+                # Si otra compra se llevó lugares entre la lectura y el UPDATE, se recalcula
+                # cuántas órdenes entran (respetando el orden del lote) y se reintenta.
+                while group and not event.reserve_tickets(sum(ticket.quantity for _, ticket in group), ticket_type):
+                    event.refresh_from_db(fields=["tickets_sold", "tickets_held"])
+                    available = event.available_tickets(ticket_type)
+                    fitting = []
+                    for index, ticket in group:
+                        if ticket.quantity <= available:
+                            available -= ticket.quantity
+                            fitting.append((index, ticket))
+                        else:
+                            rejected.append(index)
+                    if len(fitting) == len(group):
+                        rejected.append(fitting.pop()[0])
+                    group = fitting
+
+                cls.objects.bulk_create([ticket for _, ticket in group])
+                cls.forget_user_tickets(event_id, [ticket.user_id for _, ticket in group])
+
+            for index in rejected:
+                results[index] = {"success": False, "error": "No hay suficientes entradas disponibles"}
+            for index, ticket in group:
+                results[index] = {"success": True, "ticket_code": ticket.ticket_code}
+
+        return results
 
     @classmethod
     def validate_ticket_limit(cls, user, event, quantity):
@@ -490,19 +901,75 @@ class Ticket(models.Model):
         
         return errors
 
+    @classmethod
+    def purchase_queryset(cls, user, exclude_ticket_id=None):
+        """
+        Eventos listos para validar una compra en una sola consulta: trae el venue (capacidad),
+        los contadores de vendidas/retenidas y las entradas que `user` ya tiene en el evento.
+        """
+        user_tickets = cls.objects.filter(event=OuterRef("pk"), user=user)
+        if exclude_ticket_id:
+            user_tickets = user_tickets.exclude(pk=exclude_ticket_id)
+
+        user_tickets = user_tickets.values("event").annotate(total=Sum("quantity")).values("total")
+
+        return Event.objects.select_related("venue").annotate(
+            user_tickets=Coalesce(Subquery(user_tickets), 0),
+            user_tickets_owner=Value(user.pk),
+            has_pools=Exists(TicketPool.objects.filter(event=OuterRef("pk"))),
+        )
+
     @classmethod
     def get_user_tickets_count(cls, user, event):
         """
         Calcula el total de tickets que un usuario ya ha comprado para un evento.
+        Si el evento vino de purchase_queryset para ese usuario no hace otra consulta.
         """
-        from django.db.models import Sum
-        
+        if getattr(event, "user_tickets_owner", None) == user.pk:
+            return event.user_tickets
+
         result = cls.objects.filter(user=user, event=event).aggregate(
             total=Sum('quantity')
         )
         
         return result['total'] or 0
     
+    @staticmethod
+    def user_tickets_cache_key(event_id, user_id):
+        return f"ticket-limit:{event_id}:{user_id}"
+
+    @classmethod
+    def cached_user_tickets(cls, user_id, event_id):
+        """
+        Entradas del usuario en el evento ({ticket_id: cantidad}) y el organizador del evento,
+        desde la caché. Solo consulta la base si no están en caché. Retorna None si el evento
+        no existe.
+        """
+        key = cls.user_tickets_cache_key(event_id, user_id)
+        data = cache.get(key)
+        if data is None:
+            organizer_id = Event.objects.filter(pk=event_id).values_list("organizer_id", flat=True).first()
+            if organizer_id is None:
+                return None
+            data = {
+                "organizer_id": organizer_id,
+                "tickets": dict(cls.objects.filter(event_id=event_id, user_id=user_id).values_list("pk", "quantity")),
+            }
+            cache.set(key, data, settings.TICKET_LIMIT_CACHE_SECONDS)
+        return data
+
+    @classmethod
+    def forget_user_tickets(cls, event_id, user_ids):
+        """
+        Invalida la caché de cached_user_tickets. Se borra ya y otra vez al hacer commit, por
+        si una lectura concurrente la volvió a llenar con datos previos a la escritura.
+        Los save() y delete() la invalidan solos (ver forget_saved_ticket); hay que llamarla
+        a mano después de bulk_create o de un update() sobre tickets.
+        """
+        keys = [cls.user_tickets_cache_key(event_id, user_id) for user_id in set(user_ids)]
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
     @classmethod
     def validate_ticket_edit_limit(cls, user, event, new_quantity, ticket_being_edited):
         """
@@ -517,14 +984,17 @@ class Ticket(models.Model):
                 errors['quantity'] = "No puedes tener más de 4 entradas por evento (límite excedido)"
                 return errors
             
-            current_count = cls.objects.filter(
-                user=user, 
-                event=event
-            ).exclude(
-                id=ticket_being_edited.id
-            ).aggregate(
-                total=models.Sum('quantity')
-            )['total'] or 0
+            if getattr(event, "user_tickets_owner", None) == user.pk:
+                current_count = event.user_tickets
+            else:
+                current_count = cls.objects.filter(
+                    user=user, 
+                    event=event
+                ).exclude(
+                    id=ticket_being_edited.id
+                ).aggregate(
+                    total=models.Sum('quantity')
+                )['total'] or 0
             
             total = current_count + new_quantity
             if total > 4:
@@ -532,14 +1002,665 @@ class Ticket(models.Model):
         except ValueError:
             errors['quantity'] = "La cantidad debe ser un número válido"
 
+        return errors
+
             
 
+class TicketCodeSequence(models.Model):
+    """
+    Secuencia de la que app/ticket_codes.py reserva bloques de números para los códigos de ticket.
+    """
+    name = models.CharField(max_length=50, unique=True)
+    next_value = models.BigIntegerField(default=1)
+
+    def __str__(self):
+        return f"{self.name}: {self.next_value}"
+
+
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+def forget_saved_ticket(sender, instance, **kwargs):
+    Ticket.forget_user_tickets(instance.event_id, [instance.user_id])
+
+
+# Las entradas de un ticket borrado vuelven al evento y a su cupo. Va en un receiver y no en
+# Ticket.delete() porque los borrados en cascada (por ejemplo, al borrar el usuario) no
+# llaman a delete(). Corre dentro de la transacción del borrado.
+@receiver(post_delete, sender=Ticket)
+def release_deleted_ticket(sender, instance, **kwargs):
+    # Sin el evento cargado alcanza con el id: release_tickets solo hace UPDATEs
+    event = instance.event if Ticket.event.is_cached(instance) else Event(pk=instance.event_id)
+    event.release_tickets(instance.quantity, instance.type)
+
+
+# La baja queda registrada para los snapshots incrementales de la puerta (ver gate_snapshot.py)
+@receiver(post_delete, sender=Ticket)
+def tombstone_deleted_ticket(sender, instance, origin=None, **kwargs):
+    event_id, ticket_code = instance.event_id, instance.ticket_code
+    if isinstance(origin, Ticket) or getattr(origin, "model", None) is Ticket:
+        TicketTombstone.objects.create(event_id=event_id, ticket_code=ticket_code)
+        return
+
+    # En un borrado en cascada el evento puede estar borrándose en la misma operación (por
+    # ejemplo, al borrar a su organizador): la baja se registra al confirmar, si sigue existiendo
+    def create():
+        if Event.objects.filter(pk=event_id).exists():
+            TicketTombstone.objects.create(event_id=event_id, ticket_code=ticket_code)
+
+    transaction.on_commit(create)
+
+
+# Índice en memoria de la puerta (ver app/checkin.py), que importa este módulo
+@receiver(post_delete, sender=Ticket)
+def forget_gate_ticket(sender, instance, **kwargs):
+    from . import checkin
+    checkin.forget_ticket(instance.event_id, instance.ticket_code)
+
+
+# Índice de búsqueda de eventos (ver app/search.py). Se importa acá adentro porque
+# search importa este módulo.
+@receiver(post_save, sender=Event)
+def index_saved_event(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    from . import search
+    search.get_backend().index([instance.pk])
+
+
+@receiver(post_delete, sender=Event)
+def unindex_deleted_event(sender, instance, **kwargs):
+    from . import search
+    search.get_backend().remove([instance.pk])
+
+
+@receiver(post_save, sender=Venue)
+@receiver(post_save, sender=Category)
+def reindex_renamed_events(sender, instance, created=False, raw=False, **kwargs):
+    if created or raw:
+        return
+    from . import search
+    related = instance.events if sender is Venue else instance.category_event
+    search.get_backend().index(related.values_list("pk", flat=True))
+
+
+# Fragmentos HTML del catálogo (ver app/fragment_cache.py)
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=Venue)
+@receiver(post_delete, sender=Venue)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_catalog_fragments(sender, instance, **kwargs):
+    fragment_cache.bump_catalog_version()
+
+
+class TicketHold(models.Model):
+    """
+    Entradas retenidas temporalmente durante el checkout. Cuentan contra la capacidad
+    del evento (Event.tickets_held) hasta que se confirman o expiran.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="holds")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="ticket_holds")
+    quantity = models.IntegerField()
+    type = models.CharField(max_length=10, choices=Ticket.TICKET_TYPES)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.user} - {self.event} ({self.quantity})"
+
+    def is_expired(self):
+        return timezone.now() >= self.expires_at
+
+    @classmethod
+    def get_user_held_count(cls, user, event):
+        """
+        Calcula las entradas que el usuario tiene retenidas (sin expirar) para un evento.
+        """
+        result = cls.objects.filter(
+            user=user, event=event, expires_at__gt=timezone.now()
+        ).aggregate(total=Sum("quantity"))
+
+        return result["total"] or 0
+
+    @classmethod
+    def new(cls, event, user, quantity, type, ttl=None):
+        errors = Ticket.validate(quantity, type, user, event)
+
+        if not errors:
+            held = cls.get_user_held_count(user, event)
+            if held:
+                errors.update(Ticket.validate_ticket_limit(user, event, int(quantity) + held))
+
+        if len(errors.keys()) > 0:
+            return False, errors
+
+        quantity = int(quantity)
+
+        with transaction.atomic():
+            if not event.hold_tickets(quantity, type):
+                event.refresh_from_db(fields=["tickets_sold", "tickets_held"])
+                return False, {
+                    "capacity": f"No hay suficientes entradas {type} disponibles (quedan {event.available_tickets(type)})"
+                }
+
+            hold = cls.objects.create(
+                event=event,
+                user=user,
+                quantity=quantity,
+                type=type,
+                expires_at=timezone.now() + timedelta(seconds=ttl or settings.TICKET_HOLD_TTL),
+            )
+
+        return True, hold
+
+    def confirm(self, buy_date, ticket_code):
+        """
+        Convierte la retención en un Ticket. Las entradas pasan de retenidas a vendidas
+        sin volver a chequear la capacidad, porque ya estaban apartadas.
+        """
+        with transaction.atomic():
+            deleted, _ = TicketHold.objects.filter(
+                pk=self.pk, expires_at__gt=timezone.now()
+            ).delete()
+
+            if not deleted:
+                self.release()
+                return False, {"hold": "La reserva de entradas expiró. Por favor intente nuevamente."}
+
+            Event.release_held_tickets(self.event_id, self.quantity, sold=self.quantity, type=self.type)
+
+            ticket = Ticket.objects.create(
+                buy_date=buy_date,
+                ticket_code=ticket_code,
+                quantity=self.quantity,
+                type=self.type,
+                event_id=self.event_id,
+                user_id=self.user_id,
+            )
+
+        return True, ticket
+
+    def release(self):
+        """
+        Cancela la retención y devuelve las entradas al evento.
+        """
+        with transaction.atomic():
+            deleted, _ = TicketHold.objects.filter(pk=self.pk).delete()
+            if deleted:
+                Event.release_held_tickets(self.event_id, self.quantity, type=self.type)
+        return deleted > 0
+
+    @classmethod
+    def release_expired(cls, now=None, batch_size=500):
+        """
+        Libera en lotes las retenciones vencidas recorriendo el índice de expires_at.
+        Retorna la cantidad de retenciones liberadas.
+        """
+        now = now or timezone.now()
+        released = 0
+
+        while True:
+            with transaction.atomic():
+                expired = cls.objects.filter(expires_at__lte=now).order_by("expires_at")
+                if connection.features.has_select_for_update_skip_locked:
+                    expired = expired.select_for_update(skip_locked=True)
+
+                batch = list(expired.values_list("pk", "event_id", "type", "quantity")[:batch_size])
+                if not batch:
+                    break
+
+                cls.objects.filter(pk__in=[pk for pk, _, _, _ in batch]).delete()
+
+                per_event = defaultdict(int)
+                for _, event_id, type, quantity in batch:
+                    per_event[(event_id, type)] += quantity
+                for (event_id, type), quantity in per_event.items():
+                    Event.release_held_tickets(event_id, quantity, type=type)
+
+            released += len(batch)
+
+        return released
+
+
+class TicketPool(models.Model):
+    """
+    Cupo y precio de un tipo de entrada en un evento. Lleva sus propios contadores de
+    vendidas y retenidas, así agotar las VIP no bloquea las generales. Sin `capacity` el
+    tipo solo está limitado por la capacidad del venue. Los tipos sin TicketPool usan la
+    capacidad del venue y Ticket.DEFAULT_PRICES.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="pools")
+    type = models.CharField(max_length=10, choices=Ticket.TICKET_TYPES)
+    capacity = models.PositiveIntegerField(null=True, blank=True)
+    price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    sold = models.PositiveIntegerField(default=0)
+    held = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["event", "type"], name="ticketpool_event_type_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.event} - {self.type}"
+
+    def available(self, event_available):
+        """Entradas disponibles del tipo, sin superar las que le quedan al evento."""
+        if self.capacity is None:
+            return event_available
+        return min(event_available, self.capacity - self.sold - self.held)
+
+    def get_price(self):
+        return self.price if self.price is not None else Ticket.DEFAULT_PRICES[self.type]
+
+    @classmethod
+    def _take(cls, event_id, type, quantity, field, other):
+        updated = cls.objects.filter(event_id=event_id, type=type).filter(
+            Q(capacity__isnull=True) | Q(**{f"{field}__lte": F("capacity") - F(other) - quantity})
+        ).update(**{field: F(field) + quantity})
+
+        # Sin fila el tipo no tiene cupo propio: solo se consulta cuando el UPDATE falla
+        return updated == 1 or not cls.objects.filter(event_id=event_id, type=type).exists()
+
+    @classmethod
+    def reserve(cls, event_id, type, quantity):
+        """
+        UPDATE condicional sobre el cupo, como Event.reserve_tickets. Retorna True si se
+        pudo reservar o si el tipo no tiene cupo propio.
+        """
+        return cls._take(event_id, type, quantity, "sold", "held")
+
+    @classmethod
+    def hold(cls, event_id, type, quantity):
+        return cls._take(event_id, type, quantity, "held", "sold")
+
+    @classmethod
+    def release(cls, event_id, type, quantity):
+        cls.objects.filter(event_id=event_id, type=type).update(sold=Greatest(F("sold") - quantity, 0))
+
+    @classmethod
+    def release_held(cls, event_id, type, quantity, sold=0):
+        cls.objects.filter(event_id=event_id, type=type).update(
+            held=Greatest(F("held") - quantity, 0),
+            sold=F("sold") + sold,
+        )
+
+    @classmethod
+    def validate(cls, capacity, price):
+        errors = {}
+        if capacity not in (None, "") and (not str(capacity).isdigit()):
+            errors["capacity"] = "El cupo debe ser un número entero mayor o igual a 0"
+        if price not in (None, ""):
+            try:
+                price = Decimal(price)
+            except InvalidOperation:
+                price = None
+            if price is None or not price.is_finite() or price < 0:
+                errors["price"] = "El precio debe ser un número mayor o igual a 0"
+        return errors
+
+    @classmethod
+    def configure(cls, event, type, capacity, price):
+        """
+        Crea, actualiza o borra el cupo de `type`. Sin cupo ni precio se borra y el tipo
+        vuelve a compartir la capacidad del venue. Los contadores se recalculan a partir de
+        los tickets y retenciones existentes.
+        """
+        errors = cls.validate(capacity, price)
+        if errors:
+            return False, errors
+
+        capacity = int(capacity) if capacity not in (None, "") else None
+        price = Decimal(price) if price not in (None, "") else None
+
+        with transaction.atomic():
+            if capacity is None and price is None:
+                cls.objects.filter(event=event, type=type).delete()
+                return True, None
+
+            sold = Ticket.objects.filter(event=event, type=type).aggregate(total=Sum("quantity"))["total"] or 0
+            held = TicketHold.objects.filter(event=event, type=type).aggregate(total=Sum("quantity"))["total"] or 0
+            if capacity is not None and capacity < sold + held:
+                return False, {"capacity": f"Ya hay {sold + held} entradas {type} vendidas o retenidas"}
+
+            pool, _ = cls.objects.update_or_create(
+                event=event,
+                type=type,
+                defaults={"capacity": capacity, "price": price, "sold": sold, "held": held},
+            )
+
+        return True, pool
+
+
+class WaitlistEntry(models.Model):
+    """
+    Lugar en la lista de espera de un evento agotado. Cuando se liberan entradas,
+    promote() recorre la lista por orden de llegada y ofrece las entradas como una
+    TicketHold que el usuario tiene WAITLIST_OFFER_TTL segundos para confirmar.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="waitlist")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="waitlist_entries")
+    quantity = models.IntegerField()
+    type = models.CharField(max_length=10, choices=Ticket.TICKET_TYPES)
+    joined_at = models.DateTimeField(auto_now_add=True)
+    offered_at = models.DateTimeField(null=True, blank=True)
+    hold = models.ForeignKey(TicketHold, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+
+    class Meta:
+        indexes = [
+            # Solo las entradas en espera: promote() lee este índice por rangos, y con el
+            # tipo en el índice descarta los tipos bloqueados sin leer la tabla
+            models.Index(
+                fields=["event", "joined_at", "id", "type"],
+                name="waitlist_waiting_idx",
+                condition=Q(offered_at__isnull=True),
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "user"],
+                condition=Q(offered_at__isnull=True),
+                name="waitlist_one_waiting_per_user",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.event} ({self.quantity})"
+
+    @classmethod
+    def validate(cls, event, user, quantity, type):
+        errors = {}
+
+        try:
+            quantity = int(quantity)
+            if not 1 <= quantity <= 4:
+                errors["quantity"] = "La cantidad debe ser entre 1 y 4"
+        except (TypeError, ValueError):
+            errors["quantity"] = "La cantidad debe ser un número válido"
+
+        if type not in [choice[0] for choice in Ticket.TICKET_TYPES]:
+            errors["type"] = "Tipo de entrada no válido"
+
+        if cls.objects.filter(event=event, user=user, offered_at__isnull=True).exists():
+            errors["waitlist"] = "Ya estás en la lista de espera de este evento"
+
+        return errors
+
+    @classmethod
+    def new(cls, event, user, quantity, type):
+        errors = cls.validate(event, user, quantity, type)
+
+        if len(errors.keys()) > 0:
+            return False, errors
+
+        entry = cls.objects.create(event=event, user=user, quantity=int(quantity), type=type)
+        return True, entry
+
+    def position(self):
+        """Lugar en la fila, contando desde 1."""
+        return WaitlistEntry.objects.filter(
+            Q(joined_at__lt=self.joined_at) | Q(joined_at=self.joined_at, id__lte=self.id),
+            event_id=self.event_id,
+            offered_at__isnull=True,
+        ).count()
+
+    @classmethod
+    def promote(cls, event_id, batch_size=50):
+        """
+        Ofrece las entradas libres a la lista de espera en orden de llegada, de a
+        `batch_size` entradas por consulta. Cada lote sigue desde la última entrada leída
+        (joined_at, id), así la lista nunca se vuelve a recorrer desde el principio.
+        Un pedido que no entra en el cupo de su tipo bloquea a los que vienen detrás con el
+        mismo tipo, que ya no se leen; si lo que no alcanza es la capacidad del evento, no
+        se ofrece nada más. Retorna la cantidad de ofertas hechas.
+        """
+        event = Event.objects.select_related("venue").filter(pk=event_id).first()
+        if event is None or timezone.now() > event.scheduled_at:
+            return 0
+
+        offered = 0
+        blocked = set()
+        cursor = None
+        all_types = {choice[0] for choice in Ticket.TICKET_TYPES}
+
+        while blocked != all_types:
+            waiting = cls.objects.filter(event_id=event_id, offered_at__isnull=True).exclude(type__in=blocked)
+            if cursor is not None:
+                waiting = waiting.filter(
+                    Q(joined_at__gt=cursor[0]) | Q(joined_at=cursor[0], id__gt=cursor[1])
+                )
+            batch = list(waiting.select_related("user").order_by("joined_at", "id")[:batch_size])
+            if not batch:
+                break
+
+            for entry in batch:
+                if entry.type in blocked:
+                    continue
+                # La notificación de la oferta usa el título del evento ya leído
+                entry.event = event
+
+                success, result = TicketHold.new(
+                    event, entry.user, entry.quantity, entry.type, ttl=settings.WAITLIST_OFFER_TTL
+                )
+                if success:
+                    entry.offer(result)
+                    offered += 1
+                elif "capacity" in result:
+                    # Sin lugar en el evento no entra ningún pedido posterior, de ningún tipo
+                    if event.available_tickets() < entry.quantity:
+                        return offered
+                    blocked.add(entry.type)
+                else:
+                    # Ya no puede comprar (por ejemplo, llegó al límite por otra vía)
+                    entry.delete()
+
+            cursor = (batch[-1].joined_at, batch[-1].id)
+
+        return offered
+
+    def offer(self, hold):
+        self.offered_at = timezone.now()
+        self.hold = hold
+        self.save(update_fields=["offered_at", "hold"])
+
+        notification = Notification.objects.create(
+            title="Se liberaron entradas",
+            message=(
+                f"Se liberaron {hold.quantity} entradas {hold.type} para '{self.event.title}' y "
+                f"están reservadas a tu nombre hasta el {timezone.localtime(hold.expires_at):%d/%m/%Y %H:%M}. "
+                "Confirmá la compra desde la página del evento."
+            ),
+            priority=Notification.Priority.HIGH,
+            event_id=self.event_id,
+        )
+        notification.users.add(self.user)
+
+
+class IdempotencyKey(models.Model):
+    """
+    Resultado de un POST enviado con clave de idempotencia (ver app/idempotency.py).
+    Mientras la vista se ejecuta status_code es None y la fila funciona como lock;
+    al terminar guarda la respuesta para devolverla igual en los reintentos.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    scope = models.CharField(max_length=50)
+    key = models.CharField(max_length=100)
+    request_hash = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    content_type = models.CharField(max_length=100, blank=True)
+    location = models.CharField(max_length=500, blank=True)
+    body = models.BinaryField(blank=True, default=b"")
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "scope", "key"], name="idempotency_key_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.scope}:{self.key}"
+
+    def is_pending(self):
+        return self.status_code is None
+
+    @classmethod
+    def reserve(cls, user, scope, key, request_hash):
+        """
+        Reserva la clave con un INSERT: si dos reintentos llegan juntos solo uno lo logra.
+        Retorna (entrada, creada). Una clave vencida (por TTL o porque el intento que la
+        reservó nunca terminó) se descarta y se vuelve a reservar.
+        """
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                entry = cls.objects.create(
+                    user=user,
+                    scope=scope,
+                    key=key,
+                    request_hash=request_hash,
+                    expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_LOCK_SECONDS),
+                )
+            return entry, True
+        except IntegrityError:
+            pass
+
+        entry = cls.objects.filter(user=user, scope=scope, key=key).first()
+        if entry is None or entry.expires_at <= now:
+            cls.objects.filter(user=user, scope=scope, key=key, expires_at__lte=now).delete()
+            return cls.reserve(user, scope, key, request_hash)
+        return entry, False
+
+    def complete(self, response):
+        self.status_code = response.status_code
+        self.content_type = response.get("Content-Type", "")
+        self.location = response.get("Location", "")
+        self.body = response.content
+        self.expires_at = timezone.now() + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+        self.save(update_fields=["status_code", "content_type", "location", "body", "expires_at"])
+
+    @classmethod
+    def purge_expired(cls, now=None, batch_size=1000):
+        """
+        Borra en lotes las claves vencidas recorriendo el índice de expires_at.
+        Retorna la cantidad de claves borradas.
+        """
+        now = now or timezone.now()
+        purged = 0
+
+        while True:
+            batch = list(
+                cls.objects.filter(expires_at__lte=now).order_by("expires_at").values_list("pk", flat=True)[:batch_size]
+            )
+            if not batch:
+                break
+            cls.objects.filter(pk__in=batch).delete()
+            purged += len(batch)
+
+        return purged
+
+
+class TicketTombstone(models.Model):
+    """
+    Registro de un ticket eliminado, para que los snapshots incrementales de la puerta
+    puedan informar las bajas.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="ticket_tombstones")
+    ticket_code = models.CharField(max_length=100)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["event", "deleted_at"], name="tombstone_event_deleted_idx"),
+        ]
+
+    def __str__(self):
+        return self.ticket_code
+
+
+class TicketTransfer(models.Model):
+    """
+    Registro de cada cambio de dueño de un ticket. Se conserva aunque el ticket se borre,
+    para poder seguir la cadena de reventas de un código (ver chain()).
+    """
+    ticket = models.ForeignKey(Ticket, on_delete=models.SET_NULL, null=True, blank=True, related_name="transfers")
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="ticket_transfers")
+    ticket_code = models.CharField(max_length=100)
+    quantity = models.IntegerField()
+    from_user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name="transfers_sent")
+    to_user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name="transfers_received")
+    transferred_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["ticket_code", "transferred_at"], name="transfer_code_idx"),
+            models.Index(fields=["event", "transferred_at"], name="transfer_event_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.ticket_code}: {self.from_user} -> {self.to_user}"
+
+    @classmethod
+    def chain(cls, ticket_code):
+        """Transferencias de un código en orden cronológico."""
+        return list(
+            cls.objects.filter(ticket_code=ticket_code)
+            .select_related("from_user", "to_user")
+            .order_by("transferred_at", "id")
+        )
+
+
+class CheckIn(models.Model):
+    """
+    Ingreso de un ticket al evento. Un ticket solo puede ingresar una vez.
+    """
+    ticket = models.OneToOneField(Ticket, on_delete=models.CASCADE, related_name="checkin")
+    admitted_at = models.DateTimeField()
+    gate = models.CharField(max_length=50, blank=True)
+
+    def __str__(self):
+        return f"{self.ticket} - {self.admitted_at}"
+
+
+class WaitingRoom(models.Model):
+    """
+    Estado del token bucket de la sala de espera de un evento (ver app/waiting_room.py).
+    """
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, related_name="waiting_room")
+    last_number = models.PositiveIntegerField(default=0)
+    admitted_until = models.PositiveIntegerField(default=0)
+    tokens = models.FloatField(default=0)
+    refilled_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.event} ({self.admitted_until}/{self.last_number})"
+
+
+class WaitingRoomEntry(models.Model):
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="waiting_room_entries")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="waiting_room_entries")
+    number = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("event", "user")
+
+    def __str__(self):
+        return f"{self.user} - {self.event} #{self.number}"
+
+
 class Comment(models.Model):
     title = models.CharField(max_length=200)
     text = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="user_comments")
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="event_comments")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["event", "created_at"], name="comment_event_created_idx"),
+        ]
     
     def __str__(self):
         return self.title
@@ -652,3 +1773,178 @@ class Rating(models.Model):
             )
         
         return queryset.order_by('scheduled_at')
+
+
+class UpcomingEvent(models.Model):
+    """
+    Proyección desnormalizada de los eventos próximos para el listado de los asistentes:
+    todo lo que muestra el listado está en esta tabla, así que se lee con un rango sobre
+    scheduled_at sin joins.
+
+    Se mantiene al día sola: los receivers de abajo vuelven a proyectar un evento al
+    guardarlo o al modificar su ubicación, categoría, organizador o calificaciones, y los
+    contadores de entradas de Event actualizan la capacidad restante al hacer commit.
+    Los cambios hechos con update() o bulk_create no se ven hasta el próximo compact()
+    (comando compact_upcoming_events), que además quita los eventos que ya pasaron.
+    """
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, primary_key=True, related_name="upcoming")
+    title = models.CharField(max_length=200)
+    scheduled_at = models.DateTimeField()
+    # Ids sin clave foránea: la tabla no se une con las demás
+    category_id = models.IntegerField()
+    category_name = models.CharField(max_length=200)
+    venue_id = models.IntegerField()
+    venue_name = models.CharField(max_length=200)
+    venue_city = models.CharField(max_length=200)
+    organizer_id = models.IntegerField()
+    organizer_username = models.CharField(max_length=150)
+    average_rating = models.FloatField(null=True)
+    remaining_capacity = models.IntegerField()
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Las mismas consultas que los índices de Event, sobre esta tabla
+            models.Index(fields=["scheduled_at", "event"], name="upcoming_scheduled_idx"),
+            models.Index(fields=["category_id", "scheduled_at", "event"], name="upcoming_category_sched_idx"),
+            models.Index(fields=["venue_id", "scheduled_at", "event"], name="upcoming_venue_sched_idx"),
+        ]
+
+    def __str__(self):
+        return self.title
+
+    @property
+    def id(self):
+        """El id del evento, para usar la fila donde se espera un Event."""
+        return self.event_id
+
+    @staticmethod
+    def cutoff():
+        """Los eventos que empezaron hace más de 3 horas ya no son próximos (ver Event.is_future)."""
+        return timezone.now() - timedelta(hours=3)
+
+    @staticmethod
+    def average_rating_subquery():
+        return Subquery(
+            Rating.objects.filter(event=OuterRef("pk"))
+            .values("event")
+            .annotate(average=Round(Avg("rating"), 2))
+            .values("average")
+        )
+
+    @classmethod
+    def project(cls, events):
+        """Filas de la proyección (sin guardar) de un queryset de Event, con una sola consulta."""
+        rows = events.values(
+            "pk", "title", "scheduled_at", "category_id", "category__name", "venue_id", "venue__name",
+            "venue__city", "venue__capacity", "organizer_id", "organizer__username", "tickets_sold", "tickets_held",
+        ).annotate(average_rating=cls.average_rating_subquery())
+
+        return [
+            cls(
+                event_id=row["pk"],
+                title=row["title"],
+                scheduled_at=row["scheduled_at"],
+                category_id=row["category_id"],
+                category_name=row["category__name"],
+                venue_id=row["venue_id"],
+                venue_name=row["venue__name"],
+                venue_city=row["venue__city"],
+                organizer_id=row["organizer_id"],
+                organizer_username=row["organizer__username"],
+                average_rating=row["average_rating"],
+                remaining_capacity=max(row["venue__capacity"] - row["tickets_sold"] - row["tickets_held"], 0),
+            )
+            for row in rows
+        ]
+
+    PROJECTED_FIELDS = [
+        "title", "scheduled_at", "category_id", "category_name", "venue_id", "venue_name", "venue_city",
+        "organizer_id", "organizer_username", "average_rating", "remaining_capacity", "refreshed_at",
+    ]
+
+    @classmethod
+    def refresh(cls, event_ids, batch_size=500):
+        """
+        Vuelve a proyectar los eventos indicados: se agregan o reemplazan los próximos y se
+        quitan los que ya pasaron o no existen. Retorna la cantidad de filas proyectadas.
+
+        Los eventos se leen dentro de la transacción y las filas se escriben con un upsert,
+        así dos refresh simultáneos del mismo evento no chocan en la clave primaria.
+        """
+        event_ids = list(event_ids)
+        projected = 0
+        for start in range(0, len(event_ids), batch_size):
+            batch = event_ids[start:start + batch_size]
+            with transaction.atomic():
+                rows = cls.project(Event.objects.filter(pk__in=batch, scheduled_at__gte=cls.cutoff()))
+                cls.objects.bulk_create(
+                    rows, update_conflicts=True, unique_fields=["event"], update_fields=cls.PROJECTED_FIELDS
+                )
+                # Solo se borran los que ya pasaron o no existen
+                cls.objects.filter(event_id__in=batch).exclude(event_id__in=[row.event_id for row in rows]).delete()
+            projected += len(rows)
+        return projected
+
+    @classmethod
+    def refresh_capacity(cls, event_id):
+        """Actualiza solo la capacidad restante, con un UPDATE desde los contadores de Event."""
+        remaining = Event.objects.filter(pk=event_id).annotate(
+            remaining=Greatest(F("venue__capacity") - F("tickets_sold") - F("tickets_held"), Value(0))
+        ).values("remaining")
+        cls.objects.filter(event_id=event_id).update(remaining_capacity=Subquery(remaining))
+
+    @classmethod
+    def refresh_capacity_on_commit(cls, event_id):
+        transaction.on_commit(lambda: cls.refresh_capacity(event_id))
+
+    @classmethod
+    def refresh_rating(cls, event_id):
+        average = Event.objects.filter(pk=event_id).annotate(
+            average=cls.average_rating_subquery()
+        ).values("average")
+        cls.objects.filter(event_id=event_id).update(average_rating=Subquery(average))
+
+    @classmethod
+    def compact(cls, batch_size=500):
+        """
+        Quita los eventos que ya pasaron y vuelve a proyectar todos los demás, para corregir lo
+        que se haya modificado sin pasar por los receivers. Retorna (quitados, proyectados).
+        """
+        cutoff = cls.cutoff()
+        removed, _ = cls.objects.filter(scheduled_at__lt=cutoff).delete()
+
+        event_ids = set(Event.objects.filter(scheduled_at__gte=cutoff).values_list("pk", flat=True))
+        event_ids.update(cls.objects.values_list("event_id", flat=True))
+        projected = cls.refresh(sorted(event_ids), batch_size=batch_size)
+        return removed, projected
+
+
+@receiver(post_save, sender=Event)
+def project_saved_event(sender, instance, raw=False, **kwargs):
+    if not raw:
+        UpcomingEvent.refresh([instance.pk])
+
+
+@receiver(post_save, sender=Venue)
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=User)
+def project_related_events(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    if created or raw:
+        return
+    if sender is User:
+        # Al iniciar sesión se guarda solo last_login
+        if update_fields is not None and "username" not in update_fields:
+            return
+        filters = {"organizer_id": instance.pk}
+    elif sender is Venue:
+        filters = {"venue_id": instance.pk}
+    else:
+        filters = {"category_id": instance.pk}
+    UpcomingEvent.refresh(UpcomingEvent.objects.filter(**filters).values_list("event_id", flat=True))
+
+
+@receiver(post_save, sender=Rating)
+@receiver(post_delete, sender=Rating)
+def project_event_rating(sender, instance, **kwargs):
+    UpcomingEvent.refresh_rating(instance.event_id)
@@ -0,0 +1,62 @@
+"""
+Paginación por cursor (keyset) para listados ordenados por una fecha.
+
+En vez de OFFSET, cada página pide las filas posteriores a la última que vio el cliente:
+WHERE (fecha, id) > (última fecha, último id). Con un índice sobre (fecha, id) la página
+N cuesta lo mismo que la primera, y un evento creado mientras se pagina no corre las
+páginas siguientes.
+
+El cursor es opaco para el cliente: JSON en base64 urlsafe con la fecha y el id de la
+última fila de la página.
+"""
+
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(moment, pk):
+    raw = json.dumps([moment.isoformat(), pk], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor):
+    """Retorna (fecha, id). Lanza InvalidCursor si el cursor no es válido."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, pk = json.loads(raw)
+        moment = parse_datetime(value)
+    except (binascii.Error, TypeError, ValueError):
+        raise InvalidCursor("Cursor de paginación inválido") from None
+
+    if moment is None or not isinstance(pk, int):
+        raise InvalidCursor("Cursor de paginación inválido")
+    return moment, pk
+
+
+def paginate(queryset, cursor=None, page_size=20, field="scheduled_at"):
+    """
+    Retorna (filas de la página, cursor de la siguiente o None si es la última).
+    Se lee una fila de más para saber si hay otra página sin hacer un COUNT. Acepta también
+    querysets con values() que incluyan `field` y "pk".
+    """
+    if cursor:
+        moment, pk = decode_cursor(cursor)
+        queryset = queryset.filter(Q(**{f"{field}__gt": moment}) | Q(**{field: moment, "pk__gt": pk}))
+
+    rows = list(queryset.order_by(field, "pk")[:page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+
+    rows = rows[:page_size]
+    last = rows[-1]
+    if isinstance(last, dict):
+        return rows, encode_cursor(last[field], last["pk"])
+    return rows, encode_cursor(getattr(last, field), last.pk)
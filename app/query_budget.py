@@ -0,0 +1,71 @@
+"""
+Presupuesto de consultas por vista.
+
+Una vista declara cuántas consultas puede hacer como máximo con @query_budget(n), sin
+importar cuántas filas muestre. QueryBudgetMiddleware cuenta las consultas de cada request
+(incluido el render del template) y, si la vista se pasa, lo registra en el log; con
+QUERY_BUDGET_STRICT lanza QueryBudgetExceeded, así un N+1 nuevo hace fallar los tests.
+
+El conteo usa connection.execute_wrapper, así que funciona también con DEBUG=False.
+"""
+
+import logging
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def query_budget(limit, **methods):
+    """
+    `limit` vale para todos los métodos; los que hacen más trabajo se declaran aparte, por
+    ejemplo @query_budget(7, POST=20).
+    """
+    def decorator(view):
+        view.query_budget = limit
+        view.query_budget_methods = methods
+        return view
+
+    return decorator
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class QueryBudgetMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+
+        limit = getattr(request, "query_budget", None)
+        if limit is not None and counter.count > limit:
+            message = (
+                f"{request.method} {request.path} hizo {counter.count} consultas "
+                f"(presupuesto: {limit})"
+            )
+            if settings.QUERY_BUDGET_STRICT:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        limit = getattr(view_func, "query_budget", None)
+        limit = getattr(view_func, "query_budget_methods", {}).get(request.method, limit)
+        if limit is not None:
+            request.query_budget = limit
+        return None
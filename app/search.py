@@ -0,0 +1,231 @@
+"""
+Búsqueda de eventos por palabras clave con ranking de relevancia.
+
+Se indexan el título y la descripción del evento y los nombres de su ubicación y categoría
+en la tabla app_event_search, que crea la migración 0014 según la base:
+- SQLiteSearchBackend: tabla virtual FTS5 (rowid = id del evento), ranking bm25.
+- PostgresSearchBackend: columna tsvector con índice GIN, ranking ts_rank_cd.
+
+El backend se elige con settings.EVENT_SEARCH_BACKEND, que por defecto sigue a DB_ENGINE.
+Los receivers de models.py mantienen el índice al día cuando se guarda o borra un evento o
+se renombra su ubicación o categoría; reindex_event_search lo reconstruye completo.
+
+Cada palabra de la búsqueda se busca como prefijo y todas tienen que aparecer.
+"""
+
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from .models import Event
+
+TABLE = "app_event_search"
+CHUNK_SIZE = 500
+
+TERM = re.compile(r"\w+")
+
+
+def terms(query):
+    """Palabras de la búsqueda, sin la sintaxis de consulta de cada motor."""
+    return TERM.findall((query or "").lower())
+
+
+def _documents(event_ids=None):
+    events = Event.objects.order_by("pk")
+    if event_ids is not None:
+        events = events.filter(pk__in=event_ids)
+    rows = events.values_list("pk", "title", "description", "venue__name", "category__name")
+    return rows.iterator(chunk_size=CHUNK_SIZE)
+
+
+def _chunks(rows):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class SearchBackend:
+    def index(self, event_ids):
+        """Vuelve a indexar los eventos indicados (los que ya no existen se quitan)."""
+        event_ids = list(event_ids)
+        if not event_ids:
+            return
+        self.remove(event_ids)
+        self._insert(_documents(event_ids))
+
+    def rebuild(self):
+        """Reconstruye el índice completo. Retorna la cantidad de eventos indexados."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE}")
+        return self._insert(_documents())
+
+    def remove(self, event_ids):
+        raise NotImplementedError
+
+    def _insert(self, rows):
+        raise NotImplementedError
+
+    def ranked_ids(self, query, events, limit):
+        """
+        Ids de `events` (un queryset de Event, con los filtros que tenga) que coinciden con
+        `query`, del más relevante al menos relevante: [(id, relevancia), ...].
+        """
+        raise NotImplementedError
+
+    def matching_sql(self, query):
+        """(sql, params) de una subconsulta con los ids de todos los eventos que coinciden."""
+        raise NotImplementedError
+
+
+class SQLiteSearchBackend(SearchBackend):
+    # Pesos de bm25 por columna: title, description, venue, category
+    WEIGHTS = (10.0, 1.0, 4.0, 4.0)
+
+    def remove(self, event_ids):
+        event_ids = list(event_ids)
+        placeholders = ", ".join(["%s"] * len(event_ids))
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE} WHERE rowid IN ({placeholders})", event_ids)
+
+    def _insert(self, rows):
+        count = 0
+        with connection.cursor() as cursor:
+            for chunk in _chunks(rows):
+                cursor.executemany(
+                    f"INSERT INTO {TABLE} (rowid, title, description, venue, category) VALUES (%s, %s, %s, %s, %s)",
+                    chunk,
+                )
+                count += len(chunk)
+        return count
+
+    def match_expression(self, query):
+        return " ".join(f'"{term}"*' for term in terms(query))
+
+    def matching_sql(self, query):
+        return f"SELECT rowid FROM {TABLE} WHERE {TABLE} MATCH %s", [self.match_expression(query)]
+
+    def ranked_ids(self, query, events, limit):
+        expression = self.match_expression(query)
+        if not expression:
+            return []
+
+        events_sql, events_params = events.order_by().values("pk").query.sql_with_params()
+        weights = ", ".join(str(weight) for weight in self.WEIGHTS)
+        # bm25 es más negativo cuanto más relevante
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid, -bm25({TABLE}, {weights}) AS rank FROM {TABLE} "
+                f"WHERE {TABLE} MATCH %s AND rowid IN ({events_sql}) "
+                "ORDER BY rank DESC, rowid LIMIT %s",
+                [expression, *events_params, limit],
+            )
+            return cursor.fetchall()
+
+
+class PostgresSearchBackend(SearchBackend):
+    CONFIG = "spanish"
+    # Peso de cada campo en ts_rank_cd: A (título), B (ubicación y categoría), C (descripción)
+    DOCUMENT = (
+        "setweight(to_tsvector(%(config)s, coalesce(%%s, '')), 'A') || "
+        "setweight(to_tsvector(%(config)s, coalesce(%%s, '')), 'C') || "
+        "setweight(to_tsvector(%(config)s, coalesce(%%s, '')), 'B') || "
+        "setweight(to_tsvector(%(config)s, coalesce(%%s, '')), 'B')"
+    )
+
+    def remove(self, event_ids):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE} WHERE event_id = ANY(%s)", [list(event_ids)])
+
+    def _insert(self, rows):
+        document = self.DOCUMENT % {"config": f"'{self.CONFIG}'"}
+        count = 0
+        with connection.cursor() as cursor:
+            for chunk in _chunks(rows):
+                cursor.executemany(
+                    f"INSERT INTO {TABLE} (event_id, document) VALUES (%s, {document}) "
+                    "ON CONFLICT (event_id) DO UPDATE SET document = EXCLUDED.document",
+                    chunk,
+                )
+                count += len(chunk)
+        return count
+
+    def tsquery(self, query):
+        return " & ".join(f"{term}:*" for term in terms(query))
+
+    def matching_sql(self, query):
+        return f"SELECT event_id FROM {TABLE} WHERE document @@ to_tsquery('{self.CONFIG}', %s)", [self.tsquery(query)]
+
+    def ranked_ids(self, query, events, limit):
+        tsquery = self.tsquery(query)
+        if not tsquery:
+            return []
+
+        events_sql, events_params = events.order_by().values("pk").query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT event_id, ts_rank_cd(document, query) AS rank "
+                f"FROM {TABLE}, to_tsquery('{self.CONFIG}', %s) AS query "
+                f"WHERE document @@ query AND event_id IN ({events_sql}) "
+                "ORDER BY rank DESC, event_id LIMIT %s",
+                [tsquery, *events_params, limit],
+            )
+            return cursor.fetchall()
+
+
+def get_backend():
+    return import_string(settings.EVENT_SEARCH_BACKEND)()
+
+
+def matching(query, events):
+    """
+    Filtra `events` a todos los que coinciden con `query`, sin ranking ni límite (por
+    ejemplo, para contar resultados por categoría).
+    """
+    if not terms(query):
+        return events.none()
+    sql, params = get_backend().matching_sql(query)
+    return events.filter(pk__in=RawSQL(sql, params))
+
+
+def search(query, events=None, limit=None):
+    """
+    Busca `query` entre `events` (por defecto todos). Retorna la lista de eventos ordenada
+    por relevancia, cada uno con su `search_rank`.
+    """
+    if events is None:
+        events = Event.objects.all()
+    ranked = get_backend().ranked_ids(query, events, limit or settings.EVENT_SEARCH_LIMIT)
+
+    by_id = events.in_bulk([event_id for event_id, _ in ranked])
+    results = []
+    for event_id, rank in ranked:
+        event = by_id.get(event_id)
+        if event is not None:
+            event.search_rank = rank
+            results.append(event)
+    return results
+
+
+def search_values(query, events, fields, limit=None):
+    """
+    Como search, pero con las filas de events.values(*fields) en vez de modelos: dicts en
+    orden de relevancia, cada uno con su "search_rank". `fields` tiene que incluir "pk".
+    """
+    ranked = get_backend().ranked_ids(query, events, limit or settings.EVENT_SEARCH_LIMIT)
+
+    by_id = {row["pk"]: row for row in events.filter(pk__in=[event_id for event_id, _ in ranked]).values(*fields)}
+    results = []
+    for event_id, rank in ranked:
+        row = by_id.get(event_id)
+        if row is not None:
+            row["search_rank"] = rank
+            results.append(row)
+    return results
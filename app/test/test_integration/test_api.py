@@ -0,0 +1,116 @@
+import datetime
+import json
+
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, User, Venue
+
+
+@override_settings(QUERY_BUDGET_STRICT=True)
+class EventsApiIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.regular_user = User.objects.create_user(
+            username="regular",
+            email="regular@test.com",
+            password="password123",
+            is_organizer=False,
+        )
+
+        self.category = Category.objects.create(name="Música", description="desc")
+        self.venue = Venue.objects.create(
+            name="TestVenue",
+            address="Calle Falsa 123",
+            city="Ciudad",
+            capacity=100,
+            contact="contacto@prueba.com",
+        )
+        self.events = [
+            Event.objects.create(
+                title=f"Evento {i}",
+                description="Descripción",
+                scheduled_at=timezone.now() + datetime.timedelta(days=i + 1),
+                organizer=self.organizer,
+                category=self.category,
+                venue=self.venue,
+            )
+            for i in range(5)
+        ]
+
+        self.client = Client()
+        self.client.login(username="regular", password="password123")
+
+    def test_list_pages(self):
+        """Test que verifica el listado paginado por cursor"""
+        response = self.client.get(reverse("api_events"), {"limit": 3})
+        data = json.loads(response.content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([event["title"] for event in data["events"]], ["Evento 0", "Evento 1", "Evento 2"])
+        self.assertEqual(data["events"][0]["venue"]["name"], "TestVenue")
+
+        data = json.loads(self.client.get(reverse("api_events"), {"limit": 3, "cursor": data["next_cursor"]}).content)
+        self.assertEqual([event["title"] for event in data["events"]], ["Evento 3", "Evento 4"])
+        self.assertIsNone(data["next_cursor"])
+
+    def test_list_not_modified(self):
+        """Test que verifica que con el mismo ETag se responde 304 y que cambia al editar un evento"""
+        response = self.client.get(reverse("api_events"))
+        etag = response["ETag"]
+
+        response = self.client.get(reverse("api_events"), headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        self.events[2].title = "Evento editado"
+        self.events[2].save()
+        response = self.client.get(reverse("api_events"), headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_filters_and_search(self):
+        """Test que verifica que el listado usa los filtros y la búsqueda del listado HTML"""
+        other = Category.objects.create(name="Teatro", description="desc")
+        self.events[4].category = other
+        self.events[4].save()
+
+        data = json.loads(self.client.get(reverse("api_events"), {"category": other.id}).content)
+        self.assertEqual([event["id"] for event in data["events"]], [self.events[4].id])
+
+        data = json.loads(self.client.get(reverse("api_events"), {"q": "teatro"}).content)
+        self.assertEqual([event["id"] for event in data["events"]], [self.events[4].id])
+
+    def test_invalid_cursor(self):
+        """Test que verifica que un cursor inválido responde 400"""
+        response = self.client.get(reverse("api_events"), {"cursor": "no-es-un-cursor"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_detail(self):
+        """Test que verifica el detalle de un evento y su respuesta condicional"""
+        url = reverse("api_event_detail", kwargs={"id": self.events[0].id})
+        response = self.client.get(url)
+        data = json.loads(response.content)
+
+        self.assertEqual(data["event"]["description"], "Descripción")
+        self.assertEqual(data["event"]["venue"]["address"], "Calle Falsa 123")
+
+        self.assertEqual(self.client.get(url, headers={"If-None-Match": response["ETag"]}).status_code, 304)
+
+        self.venue.address = "Otra calle 456"
+        self.venue.save()
+        self.assertEqual(self.client.get(url, headers={"If-None-Match": response["ETag"]}).status_code, 200)
+
+    def test_detail_not_found(self):
+        """Test que verifica que un evento inexistente responde 404 en JSON"""
+        response = self.client.get(reverse("api_event_detail", kwargs={"id": 9999}))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(json.loads(response.content)["success"])
@@ -0,0 +1,145 @@
+import datetime
+
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+
+from app import ical
+from app.models import Category, Event, Ticket, User, Venue
+
+
+class CalendarFeedsIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.regular_user = User.objects.create_user(
+            username="regular",
+            email="regular@test.com",
+            password="password123",
+            is_organizer=False,
+        )
+
+        self.category = Category.objects.create(name="Música", description="desc")
+        self.venue = Venue.objects.create(
+            name="TestVenue",
+            address="Calle Falsa 123",
+            city="Ciudad",
+            capacity=100,
+            contact="contacto@prueba.com",
+        )
+        self.ticketed = self.create_event("Con entrada", days=5)
+        self.other = self.create_event("Sin entrada", days=6)
+        self.past = self.create_event("Pasado", days=-10)
+        Ticket.objects.create(
+            buy_date=timezone.now(), ticket_code="ICAL1", quantity=1, type="GENERAL",
+            event=self.ticketed, user=self.regular_user,
+        )
+
+        # Las aplicaciones de calendario no tienen sesión
+        self.client = Client()
+
+    def create_event(self, title, days):
+        return Event.objects.create(
+            title=title,
+            description="Descripción",
+            scheduled_at=timezone.now() + datetime.timedelta(days=days),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue,
+        )
+
+    def feed(self, name, user, headers=None, **kwargs):
+        url = reverse(name, kwargs={"token": ical.feed_token(user), **kwargs})
+        return self.client.get(url, headers=headers or {})
+
+    def body(self, response):
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_tickets_feed(self):
+        """Test que verifica que el calendario de entradas tiene solo los eventos con entradas del usuario"""
+        response = self.feed("calendar_tickets", self.regular_user)
+        body = self.body(response)
+
+        self.assertEqual(response["Content-Type"], "text/calendar; charset=utf-8")
+        self.assertIn("SUMMARY:Con entrada", body)
+        self.assertNotIn("SUMMARY:Sin entrada", body)
+
+    def test_organizer_feed(self):
+        """Test que verifica que el calendario del organizador tiene todos sus eventos"""
+        body = self.body(self.feed("calendar_organizer", self.organizer))
+
+        self.assertEqual(body.count("BEGIN:VEVENT"), 3)
+        self.assertEqual(self.feed("calendar_organizer", self.regular_user).status_code, 404)
+
+    def test_category_feed(self):
+        """Test que verifica que el calendario de una categoría tiene solo sus próximos eventos"""
+        body = self.body(self.feed("calendar_category", self.regular_user, category_id=self.category.pk))
+
+        self.assertIn("X-WR-CALNAME:Música", body)
+        self.assertEqual(body.count("BEGIN:VEVENT"), 2)
+        self.assertNotIn("SUMMARY:Pasado", body)
+
+    def test_invalid_token(self):
+        """Test que verifica que un token inválido responde 404"""
+        response = self.client.get(reverse("calendar_tickets", kwargs={"token": f"{self.regular_user.pk}:falso"}))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_not_modified(self):
+        """Test que verifica que con el ETag o la fecha de la última versión se responde 304"""
+        response = self.feed("calendar_organizer", self.organizer)
+        etag = response["ETag"]
+
+        with self.assertNumQueries(2):  # usuario del token y versión del calendario
+            response = self.feed("calendar_organizer", self.organizer, {"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+        since = http_date(timezone.now().timestamp() + 60)
+        self.assertEqual(self.feed("calendar_organizer", self.organizer, {"If-Modified-Since": since}).status_code, 304)
+
+    def test_changes_invalidate(self):
+        """Test que verifica que editar o quitar un evento cambia la versión del calendario"""
+        etag = self.feed("calendar_tickets", self.regular_user)["ETag"]
+
+        self.ticketed.title = "Con entrada reprogramado"
+        self.ticketed.save()
+        response = self.feed("calendar_tickets", self.regular_user, {"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("SUMMARY:Con entrada reprogramado", self.body(response))
+
+        etag = response["ETag"]
+        Ticket.objects.filter(user=self.regular_user).delete()
+        self.assertEqual(self.feed("calendar_tickets", self.regular_user, {"If-None-Match": etag}).status_code, 200)
+
+    def test_swapped_events_invalidate(self):
+        """Test que verifica que cambiar un evento del calendario por otro cambia la versión"""
+        older = self.create_event("Modificado antes", days=7)
+        Event.objects.filter(pk=older.pk).update(updated_at=timezone.now() - datetime.timedelta(days=30))
+        Ticket.objects.create(
+            buy_date=timezone.now(), ticket_code="ICAL2", quantity=1, type="GENERAL",
+            event=self.other, user=self.regular_user,
+        )
+        etag = self.feed("calendar_tickets", self.regular_user)["ETag"]
+
+        Ticket.objects.filter(event=self.ticketed).delete()
+        Ticket.objects.create(
+            buy_date=timezone.now(), ticket_code="ICAL3", quantity=1, type="GENERAL",
+            event=older, user=self.regular_user,
+        )
+        response = self.feed("calendar_tickets", self.regular_user, {"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("SUMMARY:Modificado antes", self.body(response))
+
+    def test_events_page_links_feed(self):
+        """Test que verifica que el listado de eventos muestra el enlace al calendario"""
+        self.client.login(username="regular", password="password123")
+        response = self.client.get(reverse("events"))
+
+        self.assertContains(response, reverse("calendar_tickets", kwargs={"token": ical.feed_token(self.regular_user)}))
@@ -0,0 +1,92 @@
+import json
+
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app import checkin
+from app.models import Category, CheckIn, Event, Ticket, User, Venue
+
+
+class CheckInIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=Category.objects.create(name="Test Category", description="Test Description"),
+            venue=Venue.objects.create(
+                name="Test Venue", address="Test Address", city="Test City", capacity=100, contact="123"
+            ),
+        )
+
+        Ticket.objects.create(
+            event=self.event,
+            user=self.user,
+            buy_date=timezone.now().date(),
+            ticket_code="ABC123",
+            quantity=2,
+            type="GENERAL",
+        )
+
+        self.client = Client()
+        self.addCleanup(checkin.close_gate, self.event.pk)
+
+    def scan(self, code):
+        response = self.client.post(reverse("checkin_scan", kwargs={"event_id": self.event.pk}), {"code": code})
+        return json.loads(response.content)
+
+    def test_gate_flow(self):
+        """Test que verifica abrir la puerta, escanear dos veces el mismo código y cerrar"""
+        self.client.login(username="organizer", password="password123")
+
+        response = self.client.post(reverse("gate_open", kwargs={"event_id": self.event.pk}))
+        self.assertEqual(json.loads(response.content)["valid"], 1)
+
+        self.assertEqual(self.scan("ABC123")["status"], "admitted")
+        self.assertEqual(self.scan("ABC123")["status"], "duplicate")
+        self.assertEqual(self.scan("ZZZ999")["status"], "invalid")
+
+        response = self.client.post(reverse("gate_close", kwargs={"event_id": self.event.pk}))
+        self.assertEqual(json.loads(response.content)["flushed"], 1)
+        self.assertTrue(CheckIn.objects.filter(ticket__ticket_code="ABC123").exists())
+
+    def test_gate_status_flushes_pending_admissions(self):
+        """Test que verifica que consultar el estado de la puerta guarda los ingresos vencidos"""
+        self.client.login(username="organizer", password="password123")
+        self.client.post(reverse("gate_open", kwargs={"event_id": self.event.pk}))
+        gate = checkin.peek_gate(self.event.pk)
+        gate.flush_seconds = 60
+        self.scan("ABC123")
+
+        status_url = reverse("gate_status", kwargs={"event_id": self.event.pk})
+        self.assertEqual(json.loads(self.client.get(status_url).content)["pending"], 1)
+
+        gate.last_flush -= 60
+        data = json.loads(self.client.get(status_url).content)
+        self.assertEqual((data["flushed"], data["pending"]), (1, 0))
+        self.assertTrue(CheckIn.objects.filter(ticket__ticket_code="ABC123").exists())
+
+    def test_only_organizer_can_scan(self):
+        """Test que verifica que un asistente no puede registrar ingresos"""
+        self.client.login(username="regular_user", password="password123")
+
+        response = self.client.post(reverse("checkin_scan", kwargs={"event_id": self.event.pk}), {"code": "ABC123"})
+        self.assertEqual(response.status_code, 403)
+        # Sin permisos no se llega a cargar el índice del evento
+        self.assertIsNone(checkin.peek_gate(self.event.pk))
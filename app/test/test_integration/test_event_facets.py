@@ -0,0 +1,95 @@
+import datetime
+
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, User, Venue
+
+
+class EventFacetsIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+
+        self.regular_user = User.objects.create_user(
+            username="regular",
+            email="regular@test.com",
+            password="password123",
+            is_organizer=False,
+        )
+
+        self.rock = Category.objects.create(name="Rock", description="desc")
+        self.jazz = Category.objects.create(name="Jazz", description="desc")
+        self.empty = Category.objects.create(name="Teatro", description="desc")
+        self.venue = Venue.objects.create(
+            name="TestVenue",
+            address="Calle Falsa 123",
+            city="Ciudad",
+            capacity=100,
+            contact="contacto@prueba.com",
+        )
+        self.unused_venue = Venue.objects.create(
+            name="Sin eventos",
+            address="Calle Falsa 456",
+            city="Ciudad",
+            capacity=100,
+            contact="contacto@prueba.com",
+        )
+
+        self.create_event("Festival de rock", self.rock, days=5)
+        self.create_event("Rock nacional", self.rock, days=6)
+        self.create_event("Noche de jazz", self.jazz, days=7)
+        self.create_event("Rock del año pasado", self.rock, days=-30)
+
+        self.client = Client()
+        self.client.login(username="regular", password="password123")
+
+    def create_event(self, title, category, days):
+        return Event.objects.create(
+            title=title,
+            description="Descripción",
+            scheduled_at=timezone.now() + datetime.timedelta(days=days),
+            organizer=self.organizer,
+            category=category,
+            venue=self.venue,
+        )
+
+    def option_counts(self, options):
+        return {option.name: option.event_count for option in options}
+
+    def test_counts_and_empty_options(self):
+        """Test que verifica que los filtros muestran cantidades y ocultan opciones sin eventos"""
+        response = self.client.get(reverse("events"))
+
+        self.assertEqual(self.option_counts(response.context["categories"]), {"Rock": 2, "Jazz": 1})
+        self.assertEqual(self.option_counts(response.context["venues"]), {"TestVenue": 3})
+        self.assertEqual(sum(month["event_count"] for month in response.context["months"]), 3)
+        self.assertContains(response, "Rock (2)")
+        self.assertNotContains(response, "Teatro")
+
+    def test_selected_option_is_kept(self):
+        """Test que verifica que la opción elegida se muestra aunque no tenga eventos"""
+        response = self.client.get(reverse("events"), {"category": self.empty.id})
+
+        self.assertEqual(list(response.context["events"]), [])
+        self.assertEqual(self.option_counts(response.context["categories"]), {"Rock": 2, "Jazz": 1, "Teatro": 0})
+        self.assertEqual(self.option_counts(response.context["venues"]), {})
+
+    def test_month_filter(self):
+        """Test que verifica el filtro por mes"""
+        month = (timezone.now() + datetime.timedelta(days=7)).strftime("%Y-%m")
+        response = self.client.get(reverse("events"), {"month": month})
+
+        self.assertIn("Noche de jazz", [event.title for event in response.context["events"]])
+        self.assertEqual(response.context["selected_month"].strftime("%Y-%m"), month)
+
+    def test_counts_follow_search(self):
+        """Test que verifica que las cantidades se calculan sobre los resultados de la búsqueda"""
+        response = self.client.get(reverse("events"), {"q": "rock"})
+
+        self.assertEqual(self.option_counts(response.context["categories"]), {"Rock": 2})
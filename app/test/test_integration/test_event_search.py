@@ -0,0 +1,67 @@
+import datetime
+import json
+
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, User, Venue
+
+
+class EventSearchIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+
+        self.regular_user = User.objects.create_user(
+            username="regular",
+            email="regular@test.com",
+            password="password123",
+            is_organizer=False,
+        )
+
+        self.category = Category.objects.create(name="Música", description="desc")
+        self.venue = Venue.objects.create(
+            name="TestVenue",
+            address="Calle Falsa 123",
+            city="Ciudad",
+            capacity=100,
+            contact="contacto@prueba.com",
+        )
+
+        self.rock = self.create_event("Festival de rock", "Bandas nacionales", days=5)
+        self.jazz = self.create_event("Noche de jazz", "Con un invitado de rock", days=1)
+        self.past = self.create_event("Rock del año pasado", "Ya ocurrió", days=-30)
+
+        self.client = Client()
+        self.client.login(username="regular", password="password123")
+
+    def create_event(self, title, description, days):
+        return Event.objects.create(
+            title=title,
+            description=description,
+            scheduled_at=timezone.now() + datetime.timedelta(days=days),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue,
+        )
+
+    def test_events_view_search(self):
+        """Test que verifica que el listado muestra los resultados por relevancia y solo eventos futuros"""
+        response = self.client.get(reverse("events"), {"q": "rock"})
+
+        self.assertEqual([event.id for event in response.context["events"]], [self.rock.id, self.jazz.id])
+        self.assertIsNone(response.context["next_query"])
+        self.assertContains(response, 'value="rock"')
+
+    def test_events_json_search(self):
+        """Test que verifica la búsqueda desde el endpoint JSON"""
+        response = self.client.get(reverse("events_json"), {"q": "jazz"})
+        data = json.loads(response.content)
+
+        self.assertEqual([event["title"] for event in data["events"]], ["Noche de jazz"])
+        self.assertIsNone(data["next_cursor"])
@@ -0,0 +1,81 @@
+import datetime
+
+from django.core.cache import cache
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app import fragment_cache
+from app.models import Category, Event, User, Venue
+
+
+class EventsFragmentCacheIntegrationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.regular_user = User.objects.create_user(
+            username="regular",
+            email="regular@test.com",
+            password="password123",
+            is_organizer=False,
+        )
+
+        self.category = Category.objects.create(name="Música", description="desc")
+        self.venue = Venue.objects.create(
+            name="TestVenue",
+            address="Calle Falsa 123",
+            city="Ciudad",
+            capacity=100,
+            contact="contacto@prueba.com",
+        )
+        self.event = Event.objects.create(
+            title="Concierto de prueba",
+            description="Descripción",
+            scheduled_at=timezone.now() + datetime.timedelta(days=5),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue,
+        )
+
+        self.client = Client()
+        self.client.login(username="regular", password="password123")
+        fragment_cache.reset_stats()
+
+    def test_listing_is_cached_per_filters(self):
+        """Test que verifica que el listado se sirve desde la caché sin consultar los eventos"""
+        self.client.get(reverse("events"))
+        self.client.get(reverse("events"), {"category": self.category.id})
+
+        with self.assertNumQueries(3):  # sesión, usuario y notificaciones sin leer del menú
+            response = self.client.get(reverse("events"))
+
+        self.assertContains(response, "Concierto de prueba")
+        self.assertEqual(fragment_cache.stats()["hits"], 1)
+        self.assertEqual(fragment_cache.stats()["misses"], 2)
+
+    def test_event_change_invalidates_listing(self):
+        """Test que verifica que editar un evento se ve en el listado siguiente"""
+        self.client.get(reverse("events"))
+
+        self.event.title = "Concierto reprogramado"
+        self.event.save()
+        response = self.client.get(reverse("events"))
+
+        self.assertContains(response, "Concierto reprogramado")
+
+    def test_organizer_listing_is_not_cached(self):
+        """Test que verifica que el listado del organizador no pasa por la caché"""
+        client = Client()
+        client.login(username="organizador", password="password123")
+
+        client.get(reverse("events"))
+        response = client.get(reverse("events"))
+
+        self.assertContains(response, "csrfmiddlewaretoken")
+        self.assertEqual(fragment_cache.stats(), {"hits": 0, "misses": 0, "hit_rate": 0.0})
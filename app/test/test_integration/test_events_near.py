@@ -0,0 +1,94 @@
+import datetime
+
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, User, Venue
+
+
+class EventsNearIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.regular_user = User.objects.create_user(
+            username="regular",
+            email="regular@test.com",
+            password="password123",
+            is_organizer=False,
+        )
+
+        self.category = Category.objects.create(name="Música", description="desc")
+        self.cordoba = self.create_venue("Estadio Kempes", "Córdoba", -31.3689, -64.2464)
+        self.buenos_aires = self.create_venue("Luna Park", "Buenos Aires", -34.6025, -58.3686)
+        self.without_coordinates = self.create_venue("Sin coordenadas", "Córdoba", None, None)
+
+        self.create_event("Recital en Córdoba", self.cordoba)
+        self.create_event("Recital en Buenos Aires", self.buenos_aires)
+        self.create_event("Recital sin coordenadas", self.without_coordinates)
+
+        self.client = Client()
+        self.client.login(username="regular", password="password123")
+
+    def create_venue(self, name, city, latitude, longitude):
+        venue = Venue(name=name, address="Calle Falsa 123", city=city, capacity=100, contact="contacto@prueba.com")
+        venue.set_coordinates(latitude, longitude)
+        venue.save()
+        return venue
+
+    def create_event(self, title, venue):
+        return Event.objects.create(
+            title=title,
+            description="Descripción",
+            scheduled_at=timezone.now() + datetime.timedelta(days=5),
+            organizer=self.organizer,
+            category=self.category,
+            venue=venue,
+        )
+
+    def titles(self, response):
+        return [event.title for event in response.context["events"]]
+
+    def test_events_near(self):
+        """Test que verifica que el listado muestra solo los eventos cercanos al punto"""
+        response = self.client.get(reverse("events"), {"lat": "-31.42", "lng": "-64.19", "km": "25"})
+
+        self.assertEqual(self.titles(response), ["Recital en Córdoba"])
+        self.assertEqual(self.option_names(response.context["venues"]), ["Estadio Kempes"])
+        self.assertContains(response, 'value="-31.42"')
+
+    def test_invalid_point_is_ignored(self):
+        """Test que verifica que sin radio o con coordenadas inválidas no se filtra por cercanía"""
+        response = self.client.get(reverse("events"), {"lat": "-31.42", "lng": "-64.19", "km": ""})
+        self.assertEqual(len(self.titles(response)), 3)
+
+        response = self.client.get(reverse("events"), {"lat": "-131.42", "lng": "-64.19", "km": "25"})
+        self.assertEqual(len(self.titles(response)), 3)
+
+    def test_events_json_near(self):
+        """Test que verifica que events/json acepta el filtro de cercanía"""
+        response = self.client.get(reverse("events_json"), {"lat": "-34.60", "lng": "-58.38", "km": "10"})
+
+        self.assertEqual([event["title"] for event in response.json()["events"]], ["Recital en Buenos Aires"])
+
+    def test_venue_edit_clears_coordinates(self):
+        """Test que verifica que al cambiar la dirección se borran las coordenadas anteriores"""
+        self.client.login(username="organizador", password="password123")
+        self.client.post(reverse("venue_edit", args=[self.cordoba.id]), {
+            "location_name": "Estadio Kempes",
+            "address": "Otra dirección 1",
+            "city": "Córdoba",
+            "capacity": "100",
+            "contact": "contacto@prueba.com",
+        })
+
+        self.cordoba.refresh_from_db()
+        self.assertIsNone(self.cordoba.latitude)
+        self.assertIsNone(self.cordoba.grid_cell)
+
+    def option_names(self, options):
+        return [option.name for option in options]
@@ -0,0 +1,125 @@
+import datetime
+import json
+
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, User, Venue
+
+
+@override_settings(EVENTS_PAGE_SIZE=5)
+class EventsPaginationIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+
+        self.regular_user = User.objects.create_user(
+            username="regular",
+            email="regular@test.com",
+            password="password123",
+            is_organizer=False,
+        )
+
+        self.category = Category.objects.create(name="TestCat", description="desc")
+        self.other_category = Category.objects.create(name="OtraCat", description="desc")
+        self.venue = Venue.objects.create(
+            name="TestVenue",
+            address="Calle Falsa 123",
+            city="Ciudad",
+            capacity=100,
+            contact="contacto@prueba.com",
+        )
+
+        self.events = [
+            Event.objects.create(
+                title=f"Evento {i}",
+                description="Descripción",
+                scheduled_at=timezone.now() + datetime.timedelta(days=i + 1),
+                organizer=self.organizer,
+                category=self.other_category if i % 3 == 0 else self.category,
+                venue=self.venue,
+            )
+            for i in range(12)
+        ]
+
+        self.client = Client()
+        self.client.login(username="regular", password="password123")
+
+    def listed_ids(self, response):
+        return [event.id for event in response.context["events"]]
+
+    def test_events_view_paginates(self):
+        """Test que verifica que el listado muestra una página y el enlace a la siguiente"""
+        response = self.client.get(reverse("events"))
+
+        self.assertEqual(self.listed_ids(response), [event.id for event in self.events[:5]])
+        self.assertIsNotNone(response.context["next_query"])
+        self.assertIsNone(response.context["first_query"])
+
+        response = self.client.get(reverse("events") + "?" + response.context["next_query"])
+
+        self.assertEqual(self.listed_ids(response), [event.id for event in self.events[5:10]])
+        self.assertEqual(response.context["first_query"], "")
+
+    def test_next_page_keeps_filters(self):
+        """Test que verifica que el cursor respeta el filtro de categoría"""
+        filtered = [event for event in self.events if event.category == self.category]
+        response = self.client.get(reverse("events"), {"category": self.category.pk})
+        self.assertIn(f"category={self.category.pk}", response.context["next_query"])
+
+        response = self.client.get(reverse("events") + "?" + response.context["next_query"])
+
+        self.assertEqual(self.listed_ids(response), [event.id for event in filtered[5:]])
+        self.assertIsNone(response.context["next_query"])
+
+    def test_date_filter(self):
+        """Test que verifica que el filtro de fecha incluye los eventos de ese día en adelante"""
+        day = timezone.localtime(self.events[10].scheduled_at).date()
+
+        response = self.client.get(reverse("events"), {"date": day.isoformat()})
+
+        self.assertEqual(self.listed_ids(response), [event.id for event in self.events[10:]])
+
+    def test_invalid_cursor_shows_first_page(self):
+        """Test que verifica que un cursor inválido vuelve a la primera página"""
+        response = self.client.get(reverse("events"), {"cursor": "roto"})
+
+        self.assertEqual(self.listed_ids(response), [event.id for event in self.events[:5]])
+
+    def test_json_pages(self):
+        """Test que verifica que el endpoint JSON recorre todos los eventos con el cursor"""
+        titles = []
+        params = {"limit": 4}
+        while True:
+            data = json.loads(self.client.get(reverse("events_json"), params).content)
+            titles.extend(event["title"] for event in data["events"])
+            if data["next_cursor"] is None:
+                break
+            params["cursor"] = data["next_cursor"]
+
+        self.assertEqual(titles, [event.title for event in self.events])
+
+    def test_json_invalid_cursor(self):
+        """Test que verifica que el endpoint JSON rechaza un cursor inválido"""
+        response = self.client.get(reverse("events_json"), {"cursor": "roto"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_json_page_cost_does_not_grow(self):
+        """Test que verifica que una página avanzada hace las mismas consultas que la primera"""
+        with CaptureQueriesContext(connection) as first_page:
+            data = json.loads(self.client.get(reverse("events_json"), {"limit": 2}).content)
+        for _ in range(3):
+            data = json.loads(self.client.get(reverse("events_json"), {"limit": 2, "cursor": data["next_cursor"]}).content)
+        with CaptureQueriesContext(connection) as later_page:
+            self.client.get(reverse("events_json"), {"limit": 2, "cursor": data["next_cursor"]})
+
+        self.assertEqual(len(later_page), len(first_page))
+        self.assertNotIn("OFFSET", later_page.captured_queries[-1]["sql"].upper())
@@ -0,0 +1,121 @@
+import csv
+import io
+import json
+
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, Ticket, User, Venue
+
+
+class ExportsIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+        self.other_organizer = User.objects.create_user(
+            username="other_organizer",
+            email="other@test.com",
+            password="password123",
+            is_organizer=True
+        )
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        category = Category.objects.create(name="Test Category", description="Test Description")
+        venue = Venue.objects.create(
+            name="Test Venue", address="Test Address", city="Test City", capacity=100, contact="123"
+        )
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=category,
+            venue=venue,
+        )
+        Event.objects.create(
+            title="Otro organizador",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.other_organizer,
+            category=category,
+            venue=venue,
+        )
+        Ticket.objects.create(
+            event=self.event,
+            user=self.user,
+            buy_date=timezone.now().date(),
+            ticket_code="ABC123",
+            quantity=2,
+            type="GENERAL",
+        )
+
+        self.client = Client()
+
+    def body(self, response):
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_event_export_permissions(self):
+        """Test que verifica que solo el organizador del evento puede exportarlo"""
+        url = reverse("event_export", kwargs={"event_id": self.event.pk, "kind": "tickets", "fmt": "csv"})
+
+        self.client.login(username="regular_user", password="password123")
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.login(username="other_organizer", password="password123")
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.login(username="organizer", password="password123")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn(f'filename="evento-{self.event.pk}-tickets.csv"', response["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(self.body(response))))
+        self.assertEqual([(row["ticket_code"], row["username"]) for row in rows], [("ABC123", "regular_user")])
+
+    def test_attendees_jsonl(self):
+        """Test que verifica la exportación de asistentes en JSONL"""
+        self.client.login(username="organizer", password="password123")
+        response = self.client.get(
+            reverse("event_export", kwargs={"event_id": self.event.pk, "kind": "attendees", "fmt": "jsonl"})
+        )
+
+        lines = [json.loads(line) for line in self.body(response).splitlines()]
+        self.assertEqual(lines, [{
+            "user_id": self.user.pk,
+            "username": "regular_user",
+            "email": "user@test.com",
+            "first_name": "",
+            "last_name": "",
+            "tickets": 1,
+            "quantity": 2,
+        }])
+
+    def test_unknown_export(self):
+        """Test que verifica que un tipo o formato desconocido responde 404"""
+        self.client.login(username="organizer", password="password123")
+
+        for kind, fmt in [("events", "csv"), ("tickets", "xml")]:
+            url = reverse("event_export", kwargs={"event_id": self.event.pk, "kind": kind, "fmt": fmt})
+            self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_events_export(self):
+        """Test que verifica que el organizador exporta solo sus eventos"""
+        url = reverse("events_export", kwargs={"fmt": "csv"})
+
+        self.client.login(username="regular_user", password="password123")
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.login(username="organizer", password="password123")
+        rows = list(csv.DictReader(io.StringIO(self.body(self.client.get(url)))))
+        self.assertEqual([row["title"] for row in rows], ["Test Event"])
@@ -0,0 +1,91 @@
+import json
+
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app import checkin, gate_snapshot
+from app.models import Category, CheckIn, Event, Ticket, User, Venue
+
+
+class GateSnapshotIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=Category.objects.create(name="Test Category", description="Test Description"),
+            venue=Venue.objects.create(
+                name="Test Venue", address="Test Address", city="Test City", capacity=100, contact="123"
+            ),
+        )
+
+        self.ticket = Ticket.objects.create(
+            event=self.event,
+            user=self.user,
+            buy_date=timezone.now().date(),
+            ticket_code="ABC123",
+            quantity=2,
+            type="GENERAL",
+        )
+
+        self.client = Client()
+        self.addCleanup(checkin.close_gate, self.event.pk)
+
+    def test_snapshot_download(self):
+        """Test que verifica que el organizador descarga el snapshot y otros usuarios no"""
+        url = reverse("gate_snapshot", kwargs={"event_id": self.event.pk})
+
+        self.client.login(username="regular_user", password="password123")
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.login(username="organizer", password="password123")
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Snapshot-Version"], str(gate_snapshot.VERSION))
+        _, records = gate_snapshot.read(b"".join(response.streaming_content))
+        self.assertEqual(records, [("ABC123", 2)])
+
+        self.assertEqual(self.client.get(url, {"since": "ayer"}).status_code, 400)
+
+    def test_sync_offline_admissions(self):
+        """Test que verifica que los ingresos sin conexión se guardan una sola vez"""
+        self.client.login(username="organizer", password="password123")
+        gate = checkin.open_gate(self.event.pk)
+        url = reverse("gate_sync", kwargs={"event_id": self.event.pk})
+        body = json.dumps({
+            "admissions": [
+                {"code": "abc123", "admitted_at": gate_snapshot.to_millis(timezone.now()), "gate": "A"},
+                {"code": "NOPE", "admitted_at": gate_snapshot.to_millis(timezone.now())},
+            ]
+        })
+
+        response = self.client.post(url, body, content_type="application/json")
+        data = json.loads(response.content)
+
+        self.assertEqual(data["created"], 1)
+        self.assertEqual(data["unknown"], ["NOPE"])
+        self.assertEqual(CheckIn.objects.get(ticket=self.ticket).gate, "A")
+        self.assertEqual(gate.scan("ABC123"), (checkin.DUPLICATE, 2))
+
+        response = self.client.post(url, body, content_type="application/json")
+        self.assertEqual(json.loads(response.content)["created"], 0)
+
+        response = self.client.post(url, "{}", content_type="application/json")
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,133 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, IdempotencyKey, RefoundRequest, Ticket, User, Venue
+
+
+class IdempotencyIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.venue = Venue.objects.create(
+            name="Test Venue",
+            address="Test Address",
+            city="Test City",
+            capacity=10,
+            contact="123456789"
+        )
+
+        self.category = Category.objects.create(
+            name="Test Category",
+            description="Test Description",
+            is_active=True
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+        self.client = Client()
+        self.client.login(username="regular_user", password="password123")
+        self.purchase_url = reverse("purchase_ticket", kwargs={"event_id": self.event.pk})
+
+    def test_purchase_retry_is_replayed(self):
+        """Test que verifica que reintentar una compra con la misma clave no crea otro ticket"""
+        data = {"cantidad": "2", "tipoEntrada": "GENERAL"}
+
+        first = self.client.post(self.purchase_url, data, HTTP_IDEMPOTENCY_KEY="compra-1")
+        retry = self.client.post(self.purchase_url, data, HTTP_IDEMPOTENCY_KEY="compra-1")
+
+        self.assertEqual(first.status_code, 302)
+        self.assertEqual(retry.status_code, 302)
+        self.assertEqual(retry["Location"], first["Location"])
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(Ticket.objects.filter(user=self.user).count(), 1)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 2)
+
+    def test_form_field_key(self):
+        """Test que verifica que el formulario de compra trae una clave y que se respeta"""
+        response = self.client.get(self.purchase_url)
+        key = response.wsgi_request.idempotency_key
+        self.assertContains(response, f'name="idempotency_key" value="{key}"')
+
+        data = {"cantidad": "1", "tipoEntrada": "GENERAL", "idempotency_key": key}
+        self.client.post(self.purchase_url, data)
+        self.client.post(self.purchase_url, data)
+
+        self.assertEqual(Ticket.objects.filter(user=self.user).count(), 1)
+
+    def test_key_reused_with_other_data(self):
+        """Test que verifica que reusar la clave con otros datos se rechaza"""
+        self.client.post(self.purchase_url, {"cantidad": "1", "tipoEntrada": "GENERAL"}, HTTP_IDEMPOTENCY_KEY="compra-1")
+
+        response = self.client.post(self.purchase_url, {"cantidad": "2", "tipoEntrada": "GENERAL"}, HTTP_IDEMPOTENCY_KEY="compra-1")
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(Ticket.objects.filter(user=self.user).count(), 1)
+
+    def test_retry_while_processing(self):
+        """Test que verifica que un reintento mientras el original se procesa recibe 409"""
+        data = {"cantidad": "1", "tipoEntrada": "GENERAL"}
+        self.client.post(self.purchase_url, data, HTTP_IDEMPOTENCY_KEY="compra-1")
+        IdempotencyKey.objects.update(status_code=None)
+
+        response = self.client.post(self.purchase_url, data, HTTP_IDEMPOTENCY_KEY="compra-1")
+
+        self.assertEqual(response.status_code, 409)
+
+    def test_without_key_each_post_is_processed(self):
+        """Test que verifica que sin clave el comportamiento no cambia"""
+        data = {"cantidad": "1", "tipoEntrada": "GENERAL"}
+        self.client.post(self.purchase_url, data)
+        self.client.post(self.purchase_url, data)
+
+        self.assertEqual(Ticket.objects.filter(user=self.user).count(), 2)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+    def test_refund_retry_is_replayed(self):
+        """Test que verifica que reintentar una solicitud de reembolso devuelve el resultado original"""
+        Ticket.objects.create(
+            buy_date=timezone.now(), ticket_code="REFUND1", quantity=1, type="GENERAL", event=self.event, user=self.user
+        )
+        data = {"ticket_code": "REFUND1", "reason": "No voy a poder asistir"}
+
+        first = self.client.post(reverse("refound_request"), data, HTTP_IDEMPOTENCY_KEY="reembolso-1")
+        retry = self.client.post(reverse("refound_request"), data, HTTP_IDEMPOTENCY_KEY="reembolso-1")
+
+        self.assertRedirects(first, reverse("events"))
+        self.assertEqual(retry.status_code, 302)
+        self.assertEqual(retry["Location"], first["Location"])
+        self.assertEqual(RefoundRequest.objects.count(), 1)
+
+    def test_purge_command(self):
+        """Test que verifica que el comando borra las claves vencidas"""
+        self.client.post(self.purchase_url, {"cantidad": "1", "tipoEntrada": "GENERAL"}, HTTP_IDEMPOTENCY_KEY="compra-1")
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timezone.timedelta(seconds=1))
+
+        out = StringIO()
+        call_command("purge_idempotency_keys", stdout=out)
+
+        self.assertIn("1 claves", out.getvalue())
+        self.assertFalse(IdempotencyKey.objects.exists())
@@ -0,0 +1,37 @@
+import os
+from unittest import skipUnless
+
+from django.conf import settings
+from django.test import LiveServerTestCase, tag
+
+from app import loadtest
+
+
+def concurrent_database():
+    """
+    Con SQLite en memoria los threads del servidor comparten la conexión del test, así que
+    las compras no corren en paralelo: hace falta la base de tests en un archivo.
+    """
+    database = settings.DATABASES["default"]
+    return "sqlite" not in database["ENGINE"] or bool(database.get("TEST", {}).get("NAME"))
+
+
+@tag("loadtest")
+@skipUnless(os.getenv("EVENTHUB_LOADTEST"), "Definir EVENTHUB_LOADTEST=1 para correr las pruebas de carga")
+@skipUnless(concurrent_database(), "Con SQLite, definir DB_SQLITE_WAL=1 para usar una base de tests en archivo")
+class FlashSaleLoadTest(LiveServerTestCase):
+    """
+    DB_SQLITE_WAL=1 EVENTHUB_LOADTEST=1 python manage.py test --tag loadtest (o con Postgres).
+    """
+
+    def test_concurrent_buyers_never_oversell(self):
+        """Test que verifica que compradores concurrentes no superan la capacidad del evento"""
+        event, usernames = loadtest.seed(capacity=30, buyers=60)
+
+        result = loadtest.run(self.live_server_url, event.pk, usernames, quantity=2, concurrency=20)
+
+        self.assertEqual(result["oversell"], 0)
+        self.assertEqual(result["counter_drift"], 0)
+        self.assertEqual(result["operations"]["purchase"]["errors"], 0)
+        self.assertGreater(result["sold"], 0)
+        self.assertLessEqual(result["sold"], 30)
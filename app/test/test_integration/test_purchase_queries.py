@@ -0,0 +1,113 @@
+from unittest.mock import patch
+
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app import ticket_codes
+from app.models import Category, Event, Ticket, User, Venue
+
+
+def local_code_generator():
+    next_block = [1]
+
+    def allocator(size):
+        start = next_block[0]
+        next_block[0] += size
+        return start, start + size
+
+    return ticket_codes.TicketCodeGenerator(allocator=allocator)
+
+
+class PurchaseQueryCountTest(TestCase):
+    # sesión + usuario, evento con contadores y entradas del usuario, savepoint,
+    # UPDATE condicional del contador, INSERT del ticket, release del savepoint
+    PURCHASE_QUERIES = 7
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=Category.objects.create(name="Test Category", description="Test Description"),
+            venue=Venue.objects.create(
+                name="Test Venue", address="Test Address", city="Test City", capacity=1000, contact="123"
+            ),
+        )
+
+        self.client = Client()
+        self.client.login(username="regular_user", password="password123")
+
+        # Evita que la reserva de un bloque de códigos sume consultas a la medición
+        generator_patch = patch("app.ticket_codes._generator", local_code_generator())
+        generator_patch.start()
+        self.addCleanup(generator_patch.stop)
+
+    def purchase(self, quantity):
+        return self.client.post(
+            reverse("purchase_ticket", kwargs={"event_id": self.event.pk}),
+            {"cantidad": str(quantity), "tipoEntrada": "GENERAL"},
+        )
+
+    def test_purchase_query_count_is_fixed(self):
+        """Test que verifica que una compra exitosa hace siempre la misma cantidad de consultas"""
+        with self.assertNumQueries(self.PURCHASE_QUERIES):
+            self.purchase(1)
+
+        buyers = [
+            User(username=f"buyer{i}", email=f"buyer{i}@test.com") for i in range(50)
+        ]
+        User.objects.bulk_create(buyers)
+        Ticket.objects.bulk_create([
+            Ticket(
+                event=self.event,
+                user=buyer,
+                buy_date=timezone.now().date(),
+                ticket_code=f"BULK{i}",
+                quantity=2,
+                type="GENERAL",
+            )
+            for i, buyer in enumerate(User.objects.filter(username__startswith="buyer"))
+        ])
+
+        with self.assertNumQueries(self.PURCHASE_QUERIES):
+            self.purchase(2)
+
+        self.assertEqual(Ticket.objects.filter(user=self.user).count(), 2)
+
+    def test_edit_ticket_uses_purchase_queryset(self):
+        """Test que verifica que editar respeta el límite de 4 usando la misma consulta"""
+        self.purchase(2)
+        self.purchase(1)
+        ticket = Ticket.objects.filter(user=self.user).order_by("pk").first()
+
+        self.client.post(
+            reverse("edit_ticket", kwargs={"event_id": self.event.pk, "ticket_id": ticket.pk}),
+            {"ticket_type": "VIP", "quantity": "4"},
+        )
+        ticket.refresh_from_db()
+        self.assertEqual(ticket.quantity, 2)
+
+        self.client.post(
+            reverse("edit_ticket", kwargs={"event_id": self.event.pk, "ticket_id": ticket.pk}),
+            {"ticket_type": "VIP", "quantity": "3"},
+        )
+        ticket.refresh_from_db()
+        self.assertEqual((ticket.quantity, ticket.type), (3, "VIP"))
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 4)
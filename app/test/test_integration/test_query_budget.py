@@ -0,0 +1,154 @@
+import datetime
+
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import (
+    Category,
+    Comment,
+    Event,
+    Notification,
+    RefoundRequest,
+    Ticket,
+    User,
+    Venue,
+    WaitlistEntry,
+)
+
+ROWS = 15
+
+
+@override_settings(QUERY_BUDGET_STRICT=True)
+class QueryBudgetIntegrationTest(TestCase):
+    """
+    Cada listado se carga con ROWS filas: si alguna vista vuelve a consultar por fila,
+    supera su @query_budget y el middleware hace fallar el request.
+    """
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+
+        self.category = Category.objects.create(name="TestCat", description="desc")
+        self.venue = Venue.objects.create(
+            name="TestVenue",
+            address="Calle Falsa 123",
+            city="Ciudad",
+            capacity=1000,
+            contact="contacto@prueba.com",
+        )
+
+        self.users = [
+            User.objects.create_user(username=f"usuario{i}", email=f"usuario{i}@test.com", password="password123")
+            for i in range(ROWS)
+        ]
+        self.user = self.users[0]
+
+        self.events = [
+            Event.objects.create(
+                title=f"Evento {i}",
+                description="Descripción",
+                scheduled_at=timezone.now() + datetime.timedelta(days=i + 1),
+                organizer=self.organizer,
+                category=Category.objects.create(name=f"Cat {i}", description="desc"),
+                venue=self.venue,
+            )
+            for i in range(ROWS)
+        ]
+        self.event = self.events[0]
+
+        for i, user in enumerate(self.users):
+            Ticket.objects.create(
+                buy_date=timezone.now(), ticket_code=f"QB{i}", quantity=1, type="GENERAL", event=self.event, user=user
+            )
+            Comment.objects.create(title="Comentario", text="Texto", user=user, event=self.events[i])
+            RefoundRequest.objects.create(
+                ticket_code=f"QB{i}", reason="No voy a poder ir", user=self.user, event=self.events[i]
+            )
+            notification = Notification.objects.create(
+                title=f"Aviso {i}", message="Mensaje", event=self.events[i]
+            )
+            notification.users.add(self.user, user)
+
+        self.client = Client()
+        self.client.login(username="usuario0", password="password123")
+        self.organizer_client = Client()
+        self.organizer_client.login(username="organizador", password="password123")
+
+    def assert_within_budget(self, client, url, data=None):
+        response = client.get(url, data)
+        self.assertEqual(response.status_code, 200, url)
+        return response
+
+    def test_events(self):
+        """Test que verifica que el listado de eventos no consulta por fila"""
+        with self.settings(EVENTS_PAGE_SIZE=ROWS):
+            response = self.assert_within_budget(self.client, reverse("events"))
+        self.assertEqual(len(response.context["events"]), ROWS)
+        self.assert_within_budget(self.organizer_client, reverse("events"))
+        self.assert_within_budget(self.client, reverse("events_json") + f"?limit={ROWS}")
+
+    def test_events_search(self):
+        """Test que verifica el listado de eventos con búsqueda y todos los filtros"""
+        query = {"q": "Evento", "category": self.event.category_id, "venue": self.venue.pk, "date": "2030-01-01"}
+        self.assert_within_budget(self.client, reverse("events"), query)
+        self.assert_within_budget(self.organizer_client, reverse("events"), query)
+
+    def test_view_ticket_delete(self):
+        """Test que verifica que borrar un ticket y ofrecer sus entradas a la lista de espera entra en el presupuesto"""
+        venue = Venue.objects.create(name="Chico", address="-", city="-", capacity=4, contact="-")
+        event = Event.objects.create(
+            title="Agotado",
+            description="Descripción",
+            scheduled_at=timezone.now() + datetime.timedelta(days=3),
+            organizer=self.organizer,
+            category=self.category,
+            venue=venue,
+        )
+        success, ticket = Ticket.new(
+            buy_date=timezone.now(), ticket_code="QBFULL", quantity=4, type="GENERAL", event=event, user=self.user
+        )
+        self.assertTrue(success)
+        ticket = Ticket.objects.get(ticket_code="QBFULL")
+        # Un ticket libera hasta 4 entradas: a lo sumo 4 ofertas de una entrada
+        for user in self.users[1:5]:
+            self.assertTrue(WaitlistEntry.new(event, user, 1, "GENERAL")[0])
+
+        response = self.organizer_client.post(
+            reverse("view_ticket", kwargs={"event_id": event.pk}), {"ticket_id": ticket.pk}
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(WaitlistEntry.objects.filter(event=event, offered_at__isnull=False).count(), 4)
+
+        response = self.client.post(
+            reverse("view_ticket", kwargs={"event_id": self.event.pk}),
+            {"ticket_id": Ticket.objects.get(ticket_code="QB0").pk},
+        )
+        self.assertEqual(response.status_code, 302)
+
+    def test_comments(self):
+        """Test que verifica que el listado de comentarios no consulta por fila"""
+        self.assert_within_budget(self.client, reverse("comments"))
+
+    def test_refounds(self):
+        """Test que verifica que el listado de reembolsos no consulta por fila"""
+        self.assert_within_budget(self.client, reverse("refounds"))
+
+    def test_view_ticket(self):
+        """Test que verifica que la lista de tickets del organizador no consulta por fila"""
+        self.assert_within_budget(self.organizer_client, reverse("view_ticket", kwargs={"event_id": self.event.pk}))
+
+    def test_notifications(self):
+        """Test que verifica que los listados de notificaciones no consultan por fila"""
+        response = self.assert_within_budget(self.organizer_client, reverse("notifications"))
+        self.assertContains(response, "Todos (2)")
+        self.assert_within_budget(self.client, reverse("user_notifications"))
+
+    def test_events_users(self):
+        """Test que verifica que los compradores de un evento se leen en una consulta"""
+        self.assert_within_budget(self.organizer_client, reverse("events_users", kwargs={"id": self.event.pk}))
@@ -0,0 +1,135 @@
+import datetime
+
+from django.db import connection
+from django.db.models import Sum, Value
+from django.db.models.functions import Upper
+from django.test import TestCase
+from django.utils import timezone
+
+from app.models import (
+    Category,
+    Comment,
+    Event,
+    Notification,
+    RefoundRequest,
+    Ticket,
+    UpcomingEvent,
+    User,
+    Venue,
+)
+
+
+class QueryIndexesTest(TestCase):
+    """
+    Verifica con EXPLAIN que las consultas más usadas se resuelven con sus índices.
+    En Postgres se desactiva el seq scan: con tablas de prueba tan chicas el planner
+    preferiría recorrer la tabla aunque el índice exista.
+    """
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.user = User.objects.create_user(username="regular", email="regular@test.com", password="password123")
+        self.category = Category.objects.create(name="Música", description="desc")
+        self.venue = Venue.objects.create(
+            name="TestVenue",
+            address="Calle Falsa 123",
+            city="Ciudad",
+            capacity=100,
+            contact="contacto@prueba.com",
+        )
+        self.event = Event.objects.create(
+            title="Evento",
+            description="Descripción",
+            scheduled_at=timezone.now() + datetime.timedelta(days=1),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue,
+        )
+
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, f"El plan no usa {index_name}:\n{plan}")
+
+    def test_organizer_events(self):
+        """Test que verifica el índice del listado de eventos de un organizador"""
+        events = Event.objects.filter(organizer=self.organizer).order_by("scheduled_at", "id")
+
+        self.assertUsesIndex(events, "event_organizer_sched_idx")
+
+    def test_upcoming_events(self):
+        """Test que verifica el índice del listado de próximos eventos"""
+        events = Event.objects.filter(scheduled_at__gte=timezone.now()).order_by("scheduled_at", "id")
+
+        self.assertUsesIndex(events, "event_scheduled_idx")
+
+    def test_upcoming_events_by_category(self):
+        """Test que verifica el índice del listado filtrado por categoría"""
+        events = Event.objects.filter(
+            category=self.category, scheduled_at__gte=timezone.now()
+        ).order_by("scheduled_at", "id")
+
+        self.assertUsesIndex(events, "event_category_sched_idx")
+
+    def test_upcoming_events_by_venue(self):
+        """Test que verifica el índice del listado filtrado por ubicación"""
+        events = Event.objects.filter(
+            venue=self.venue, scheduled_at__gte=timezone.now()
+        ).order_by("scheduled_at", "id")
+
+        self.assertUsesIndex(events, "event_venue_sched_idx")
+
+    def test_projected_upcoming_events(self):
+        """Test que verifica los índices del listado de los asistentes sobre la proyección"""
+        events = UpcomingEvent.objects.filter(scheduled_at__gte=timezone.now()).order_by("scheduled_at", "pk")
+        self.assertUsesIndex(events, "upcoming_scheduled_idx")
+
+        events = UpcomingEvent.objects.filter(
+            category_id=self.category.pk, scheduled_at__gte=timezone.now()
+        ).order_by("scheduled_at", "pk")
+        self.assertUsesIndex(events, "upcoming_category_sched_idx")
+
+    def test_user_tickets_sum(self):
+        """Test que verifica el índice de la suma de entradas de un usuario en un evento"""
+        tickets = Ticket.objects.filter(user=self.user, event=self.event)
+
+        plan = tickets.explain()
+        self.assertIn("ticket_user_event_idx", plan)
+        # La suma se resuelve sin leer la tabla
+        if connection.vendor == "sqlite":
+            self.assertIn("COVERING INDEX", tickets.values("quantity").explain())
+        self.assertEqual(tickets.aggregate(total=Sum("quantity"))["total"], None)
+
+    def test_unread_notifications(self):
+        """Test que verifica el índice de las notificaciones de un usuario"""
+        notifications = Notification.objects.filter(users=self.user, is_read=False)
+
+        self.assertUsesIndex(notifications, "notification_users_user_idx")
+
+    def test_event_comments(self):
+        """Test que verifica el índice de los comentarios de un evento"""
+        comments = Comment.objects.filter(event=self.event).order_by("created_at")
+
+        self.assertUsesIndex(comments, "comment_event_created_idx")
+
+    def test_refound_by_ticket_code(self):
+        """Test que verifica el índice de la búsqueda de reembolsos por código"""
+        self.assertUsesIndex(RefoundRequest.objects.filter(ticket_code="ABC123"), "refound_ticket_code_idx")
+
+    def test_category_name_case_insensitive(self):
+        """Test que verifica el índice de la validación de nombres de categoría repetidos"""
+        categories = Category.objects.alias(name_upper=Upper("name")).filter(name_upper=Upper(Value("música")))
+
+        self.assertUsesIndex(categories, "category_name_upper_idx")
+        # SQLite solo pasa a mayúsculas ASCII (igual que el LIKE de name__iexact)
+        self.assertIn("name", Category.validate("MúSICA", "Una descripción válida"))
+        self.assertIn("name", Category.validate("música", "Una descripción válida"))
+        self.assertNotIn("name", Category.validate("Teatro", "Una descripción válida"))
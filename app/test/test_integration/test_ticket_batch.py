@@ -0,0 +1,74 @@
+import json
+
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, Ticket, User, Venue
+
+
+class TicketBatchIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=Category.objects.create(name="Test Category", description="Test Description"),
+            venue=Venue.objects.create(
+                name="Test Venue", address="Test Address", city="Test City", capacity=100, contact="123"
+            ),
+        )
+
+        self.client = Client()
+
+    def post_batch(self, payload):
+        return self.client.post(
+            reverse("purchase_tickets_batch"),
+            data=json.dumps(payload),
+            content_type="application/json",
+        )
+
+    def test_organizer_can_submit_batch(self):
+        """Test que verifica que la boletería crea tickets por lote y recibe un resultado por orden"""
+        self.client.login(username="organizer", password="password123")
+
+        response = self.post_batch({"orders": [
+            {"event": self.event.pk, "user": self.user.pk, "type": "VIP", "quantity": 2},
+            {"event": self.event.pk, "user": 9999, "type": "GENERAL", "quantity": 1},
+        ]})
+
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(data["created"], 1)
+        self.assertTrue(data["results"][0]["success"])
+        self.assertEqual(data["results"][1]["error"], "El usuario no existe")
+        self.assertEqual(Ticket.objects.get().ticket_code, data["results"][0]["ticket_code"])
+
+    def test_regular_user_cannot_submit_batch(self):
+        """Test que verifica que un usuario común no puede usar el endpoint de lotes"""
+        self.client.login(username="regular_user", password="password123")
+
+        response = self.post_batch({"orders": []})
+        self.assertEqual(response.status_code, 403)
+
+    def test_invalid_body_returns_400(self):
+        """Test que verifica que un cuerpo mal formado devuelve 400"""
+        self.client.login(username="organizer", password="password123")
+
+        response = self.post_batch({"pedidos": []})
+        self.assertEqual(response.status_code, 400)
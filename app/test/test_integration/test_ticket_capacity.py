@@ -0,0 +1,107 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app import ticket_codes
+from app.models import Category, Event, Ticket, UpcomingEvent, User, Venue
+
+
+class TicketCapacityIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.venue = Venue.objects.create(
+            name="Test Venue",
+            address="Test Address",
+            city="Test City",
+            capacity=3,
+            contact="123456789"
+        )
+
+        self.category = Category.objects.create(
+            name="Test Category",
+            description="Test Description",
+            is_active=True
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+        self.client = Client()
+
+    def test_purchase_updates_counter_and_blocks_oversell(self):
+        """Test que verifica que la compra usa el contador y rechaza cuando se agota"""
+        self.client.login(username="regular_user", password="password123")
+
+        self.client.post(
+            reverse("purchase_ticket", kwargs={"event_id": self.event.pk}),
+            {"cantidad": "2", "tipoEntrada": "GENERAL"},
+        )
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 2)
+        self.assertTrue(ticket_codes.is_valid(Ticket.objects.get(event=self.event).ticket_code))
+
+        self.client.post(
+            reverse("purchase_ticket", kwargs={"event_id": self.event.pk}),
+            {"cantidad": "2", "tipoEntrada": "GENERAL"},
+        )
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 2)
+        self.assertEqual(Ticket.objects.filter(event=self.event).count(), 1)
+
+    def test_delete_ticket_releases_capacity(self):
+        """Test que verifica que eliminar un ticket desde la vista libera el lugar"""
+        self.client.login(username="regular_user", password="password123")
+        self.client.post(
+            reverse("purchase_ticket", kwargs={"event_id": self.event.pk}),
+            {"cantidad": "3", "tipoEntrada": "GENERAL"},
+        )
+        ticket = Ticket.objects.get(event=self.event)
+
+        self.client.post(
+            reverse("view_ticket", kwargs={"event_id": self.event.pk}),
+            {"ticket_id": ticket.pk},
+        )
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 0)
+
+    def test_rebuild_ticket_counters_command(self):
+        """Test que verifica que el comando reconstruye el contador desde los tickets"""
+        Ticket.objects.create(
+            event=self.event,
+            user=self.user,
+            buy_date=timezone.now().date(),
+            ticket_code="ABC123",
+            quantity=2,
+            type="GENERAL"
+        )
+        self.assertEqual(Event.objects.get(pk=self.event.pk).tickets_sold, 0)
+
+        out = StringIO()
+        call_command("rebuild_ticket_counters", stdout=out)
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 2)
+        self.assertIn("1 con diferencias", out.getvalue())
+        self.assertEqual(UpcomingEvent.objects.get(event=self.event).remaining_capacity, 1)
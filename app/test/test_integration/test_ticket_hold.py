@@ -0,0 +1,95 @@
+import json
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, Ticket, TicketHold, User, Venue
+
+
+class TicketHoldIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.venue = Venue.objects.create(
+            name="Test Venue",
+            address="Test Address",
+            city="Test City",
+            capacity=10,
+            contact="123456789"
+        )
+
+        self.category = Category.objects.create(
+            name="Test Category",
+            description="Test Description",
+            is_active=True
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+        self.client = Client()
+        self.client.login(username="regular_user", password="password123")
+
+    def test_hold_then_purchase_with_hold_id(self):
+        """Test que verifica el checkout completo: retener y luego comprar con el hold_id"""
+        response = self.client.post(
+            reverse("hold_tickets", kwargs={"event_id": self.event.pk}),
+            {"cantidad": "2", "tipoEntrada": "GENERAL"},
+        )
+        data = json.loads(response.content)
+        self.assertTrue(data["success"])
+
+        response = self.client.post(
+            reverse("purchase_ticket", kwargs={"event_id": self.event.pk}),
+            {"cantidad": "2", "tipoEntrada": "GENERAL", "hold_id": data["hold_id"]},
+        )
+        self.assertRedirects(response, reverse("view_ticket", kwargs={"event_id": self.event.pk}))
+
+        ticket = Ticket.objects.get(event=self.event)
+        self.assertEqual(ticket.quantity, 2)
+        self.event.refresh_from_db()
+        self.assertEqual((self.event.tickets_sold, self.event.tickets_held), (2, 0))
+
+    def test_release_hold_endpoint(self):
+        """Test que verifica que el usuario puede cancelar su retención"""
+        _, hold = TicketHold.new(self.event, self.user, 2, "GENERAL")
+
+        response = self.client.post(reverse("release_hold", kwargs={"hold_id": hold.pk}))
+        self.assertTrue(json.loads(response.content)["success"])
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_held, 0)
+
+    def test_release_expired_holds_command(self):
+        """Test que verifica el comando que barre las retenciones vencidas"""
+        _, hold = TicketHold.new(self.event, self.user, 3, "GENERAL")
+        TicketHold.objects.filter(pk=hold.pk).update(expires_at=timezone.now() - timedelta(minutes=1))
+
+        out = StringIO()
+        call_command("release_expired_holds", stdout=out)
+
+        self.assertIn("1 retenciones", out.getvalue())
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_held, 0)
@@ -0,0 +1,120 @@
+import json
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, Ticket, TicketPool, User, Venue
+
+
+class TicketLimitCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=Category.objects.create(name="Test Category", description="Test Description"),
+            venue=Venue.objects.create(
+                name="Test Venue", address="Test Address", city="Test City", capacity=100, contact="123"
+            ),
+        )
+
+        self.client = Client()
+        self.client.login(username="regular_user", password="password123")
+        self.url = reverse("check_ticket_limit", kwargs={"event_id": self.event.pk})
+
+    def buy(self, quantity):
+        return Ticket.new(
+            buy_date=timezone.now().date(),
+            ticket_code=f"CODE{quantity}",
+            quantity=quantity,
+            type="GENERAL",
+            event=self.event,
+            user=self.user,
+        )
+
+    def app_queries(self, response_callable):
+        with CaptureQueriesContext(connection) as context:
+            response = response_callable()
+        return response, [
+            query["sql"]
+            for query in context.captured_queries
+            if '"app_ticket"' in query["sql"] or '"app_event"' in query["sql"]
+        ]
+
+    def test_repeated_polls_are_answered_from_cache(self):
+        """Test que verifica que las consultas repetidas no tocan tickets ni eventos y responden 304"""
+        first = self.client.get(self.url, {"cantidad": 1})
+        etag = first["ETag"]
+
+        response, queries = self.app_queries(
+            lambda: self.client.get(self.url, {"cantidad": 1}, HTTP_IF_NONE_MATCH=etag)
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(queries, [])
+
+    def test_purchase_invalidates_cache(self):
+        """Test que verifica que una compra actualiza la respuesta cacheada"""
+        first = self.client.get(self.url, {"cantidad": 1})
+        self.assertEqual(json.loads(first.content)["current_count"], 0)
+
+        self.buy(3)
+
+        response = self.client.get(self.url, {"cantidad": 1}, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["current_count"], 3)
+
+        Ticket.objects.get(user=self.user).delete()
+        response = self.client.get(self.url, {"cantidad": 1})
+        self.assertEqual(json.loads(response.content)["current_count"], 0)
+
+    def test_edit_limit_excludes_ticket(self):
+        """Test que verifica que el límite al editar descuenta el ticket editado"""
+        self.buy(3)
+        ticket = Ticket.objects.get(user=self.user)
+
+        response = self.client.get(
+            reverse("check_ticket_limit_for_edit", kwargs={"event_id": self.event.pk, "ticket_id": ticket.pk}),
+            {"cantidad": 4},
+        )
+
+        data = json.loads(response.content)
+        self.assertTrue(data["success"])
+        self.assertEqual(data["current_count"], 0)
+
+    def test_allowance_combines_user_and_event(self):
+        """Test que verifica que el endpoint combinado informa el límite del usuario y la capacidad"""
+        TicketPool.objects.create(event=self.event, type="VIP", capacity=1)
+        self.buy(3)
+
+        response = self.client.get(reverse("ticket_allowance", kwargs={"event_id": self.event.pk}))
+        data = json.loads(response.content)
+
+        self.assertEqual(data["user_remaining"], 1)
+        self.assertEqual(data["event_remaining"], 97)
+        self.assertEqual(data["types"], {"GENERAL": 97, "VIP": 1})
+        self.assertEqual(data["can_buy"], 1)
+
+        response = self.client.get(reverse("ticket_allowance", kwargs={"event_id": 999}))
+        self.assertEqual(response.status_code, 404)
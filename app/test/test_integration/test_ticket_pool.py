@@ -0,0 +1,66 @@
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, TicketPool, User, Venue
+
+
+class TicketPoolIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=Category.objects.create(name="Test Category", description="Test Description"),
+            venue=Venue.objects.create(
+                name="Test Venue", address="Test Address", city="Test City", capacity=100, contact="123"
+            ),
+        )
+
+        self.client = Client()
+
+    def test_organizer_configures_pools(self):
+        """Test que verifica que el organizador define cupo y precio por tipo"""
+        self.client.login(username="organizer", password="password123")
+
+        response = self.client.post(
+            reverse("event_pools", kwargs={"id": self.event.pk}),
+            {"capacity_VIP": "10", "price_VIP": "450000", "capacity_GENERAL": "", "price_GENERAL": ""},
+        )
+
+        self.assertRedirects(response, reverse("event_detail", kwargs={"id": self.event.pk}))
+        pool = TicketPool.objects.get(event=self.event)
+        self.assertEqual((pool.type, pool.capacity, pool.price), ("VIP", 10, 450000))
+
+        response = self.client.post(
+            reverse("event_pools", kwargs={"id": self.event.pk}),
+            {"capacity_VIP": "-1", "price_VIP": "", "capacity_GENERAL": "5", "price_GENERAL": ""},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("capacity_VIP", response.context["errors"])
+        self.assertFalse(TicketPool.objects.filter(event=self.event, type="GENERAL").exists())
+
+    def test_purchase_page_shows_sold_out_tier(self):
+        """Test que verifica que la página de compra muestra la disponibilidad de cada tipo"""
+        TicketPool.objects.create(event=self.event, type="VIP", capacity=2, sold=2)
+        self.client.login(username="regular_user", password="password123")
+
+        response = self.client.get(reverse("purchase_ticket", kwargs={"event_id": self.event.pk}))
+
+        self.assertContains(response, "agotada")
+        self.assertContains(response, "quedan 100")
@@ -0,0 +1,105 @@
+import json
+
+from django.core.cache import cache
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, Ticket, TicketTransfer, User, Venue
+
+
+class TicketTransferIntegrationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.seller = User.objects.create_user(
+            username="seller",
+            email="seller@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.buyer = User.objects.create_user(
+            username="buyer",
+            email="buyer@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.venue = Venue.objects.create(
+            name="Test Venue",
+            address="Test Address",
+            city="Test City",
+            capacity=10,
+            contact="123456789"
+        )
+
+        self.category = Category.objects.create(
+            name="Test Category",
+            description="Test Description",
+            is_active=True
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+        self.ticket = Ticket.objects.create(
+            buy_date=timezone.now(), ticket_code="TRANSFER1", quantity=3, type="GENERAL", event=self.event, user=self.seller
+        )
+
+        self.client = Client()
+        self.client.login(username="seller", password="password123")
+
+    def transfer_url(self):
+        return reverse("transfer_ticket", kwargs={"event_id": self.event.pk, "ticket_id": self.ticket.pk})
+
+    def test_transfer_by_email(self):
+        """Test que verifica la transferencia desde la lista de tickets usando el email del destinatario"""
+        response = self.client.post(self.transfer_url(), {"destinatario": "BUYER@test.com"})
+
+        self.assertRedirects(response, reverse("view_ticket", kwargs={"event_id": self.event.pk}))
+        self.assertEqual(Ticket.objects.get(pk=self.ticket.pk).user, self.buyer)
+        self.assertEqual(TicketTransfer.objects.get().to_user, self.buyer)
+
+    def test_transfer_unknown_user(self):
+        """Test que verifica el error cuando el destinatario no existe"""
+        response = self.client.post(self.transfer_url(), {"destinatario": "nadie"}, follow=True)
+
+        self.assertIn("No existe un usuario con ese nombre o email", [str(m) for m in response.context["messages"]])
+        self.assertEqual(Ticket.objects.get(pk=self.ticket.pk).user, self.seller)
+
+    def test_only_owner_can_transfer(self):
+        """Test que verifica que otro usuario no puede transferir un ticket ajeno"""
+        client = Client()
+        client.login(username="buyer", password="password123")
+
+        response = client.post(self.transfer_url(), {"destinatario": "buyer"})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_transfer_invalidates_limit_cache(self):
+        """Test que verifica que el límite cacheado de ambos usuarios se actualiza tras la transferencia"""
+        buyer_client = Client()
+        buyer_client.login(username="buyer", password="password123")
+        limit_url = reverse("check_ticket_limit", kwargs={"event_id": self.event.pk})
+
+        self.assertTrue(json.loads(buyer_client.get(limit_url, {"cantidad": 2}).content)["success"])
+        self.assertFalse(json.loads(self.client.get(limit_url, {"cantidad": 2}).content)["success"])
+
+        self.client.post(self.transfer_url(), {"destinatario": "buyer"})
+
+        self.assertFalse(json.loads(buyer_client.get(limit_url, {"cantidad": 2}).content)["success"])
+        self.assertTrue(json.loads(self.client.get(limit_url, {"cantidad": 2}).content)["success"])
@@ -0,0 +1,73 @@
+import datetime
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Category, Event, User, Venue
+
+
+class UpcomingEventsListingIntegrationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.regular_user = User.objects.create_user(
+            username="regular",
+            email="regular@test.com",
+            password="password123",
+            is_organizer=False,
+        )
+
+        self.category = Category.objects.create(name="Música", description="desc")
+        self.venue = Venue.objects.create(
+            name="TestVenue",
+            address="Calle Falsa 123",
+            city="Ciudad",
+            capacity=100,
+            contact="contacto@prueba.com",
+        )
+        self.upcoming = self.create_event("Próximo", days=5)
+        self.past = self.create_event("Pasado", days=-5)
+
+    def create_event(self, title, days):
+        return Event.objects.create(
+            title=title,
+            description="Descripción",
+            scheduled_at=timezone.now() + datetime.timedelta(days=days),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue,
+        )
+
+    def test_attendee_listing_reads_projection(self):
+        """Test que verifica que el listado de los asistentes lee solo la proyección, sin joins"""
+        client = Client()
+        client.login(username="regular", password="password123")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse("events"))
+
+        self.assertEqual([event.id for event in response.context["events"]], [self.upcoming.id])
+        self.assertContains(response, "organizador")
+        listing = [query["sql"] for query in queries if "ORDER BY" in query["sql"] and "app_upcomingevent" in query["sql"]]
+        self.assertEqual(len(listing), 1)
+        self.assertNotIn("JOIN", listing[0])
+
+    def test_organizer_listing_keeps_past_events(self):
+        """Test que verifica que el organizador sigue viendo todos sus eventos"""
+        client = Client()
+        client.login(username="organizador", password="password123")
+
+        response = client.get(reverse("events"))
+
+        self.assertEqual({event.id for event in response.context["events"]}, {self.upcoming.id, self.past.id})
+        self.assertContains(response, "TestVenue")
@@ -0,0 +1,96 @@
+import json
+
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from app import waiting_room
+from app.models import Category, Event, IdempotencyKey, Ticket, User, Venue
+
+WAITING_ROOM_TEST = {
+    "ENABLED": True,
+    "STORE": "app.waiting_room.MemoryQueueStore",
+    "RATE": 0,
+    "BURST": 1,
+}
+
+
+@override_settings(WAITING_ROOM=WAITING_ROOM_TEST)
+class WaitingRoomIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.first = User.objects.create_user(username="first", email="first@test.com", password="password123")
+        self.second = User.objects.create_user(username="second", email="second@test.com", password="password123")
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=Category.objects.create(name="Test Category", description="Test Description"),
+            venue=Venue.objects.create(
+                name="Test Venue", address="Test Address", city="Test City", capacity=100, contact="123"
+            ),
+        )
+        self.client = Client()
+        waiting_room.reset_store()
+
+    def test_purchase_page_queues_when_not_admitted(self):
+        """Test que verifica que el segundo comprador queda en la sala de espera"""
+        self.client.login(username="first", password="password123")
+        response = self.client.get(reverse("purchase_ticket", kwargs={"event_id": self.event.pk}))
+        self.assertTemplateUsed(response, "app/purchase_ticket.html")
+
+        self.client.login(username="second", password="password123")
+        response = self.client.get(reverse("purchase_ticket", kwargs={"event_id": self.event.pk}))
+        self.assertTemplateUsed(response, "app/waiting_room.html")
+        self.assertEqual(response.context["queue_status"]["position"], 1)
+
+    def test_queue_status_does_not_query_tickets(self):
+        """Test que verifica que el endpoint de posición no hace consultas de tickets"""
+        self.client.login(username="second", password="password123")
+        self.client.get(reverse("purchase_ticket", kwargs={"event_id": self.event.pk}))
+
+        # Solo las consultas de sesión y usuario del login_required
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("queue_status", kwargs={"event_id": self.event.pk}))
+
+        data = json.loads(response.content)
+        self.assertTrue(data["joined"])
+        self.assertTrue(data["admitted"])
+
+    def test_check_ticket_limit_blocked_while_queued(self):
+        """Test que verifica que el chequeo de límite no consulta tickets si el usuario espera"""
+        self.client.login(username="first", password="password123")
+        self.client.get(reverse("purchase_ticket", kwargs={"event_id": self.event.pk}))
+        self.client.login(username="second", password="password123")
+        self.client.get(reverse("purchase_ticket", kwargs={"event_id": self.event.pk}))
+
+        response = self.client.get(reverse("check_ticket_limit", kwargs={"event_id": self.event.pk}))
+        data = json.loads(response.content)
+        self.assertTrue(data["queued"])
+        self.assertEqual(data["position"], 1)
+
+    def test_queued_purchase_is_not_stored_under_idempotency_key(self):
+        """Test que verifica que reintentar con la misma clave después de ser admitido compra"""
+        url = reverse("purchase_ticket", kwargs={"event_id": self.event.pk})
+        data = {"cantidad": "1", "tipoEntrada": "GENERAL"}
+        self.client.login(username="first", password="password123")
+        self.client.get(url)
+
+        self.client.login(username="second", password="password123")
+        response = self.client.post(url, data, HTTP_IDEMPOTENCY_KEY="compra-en-fila")
+        self.assertTemplateUsed(response, "app/waiting_room.html")
+        self.assertFalse(IdempotencyKey.objects.filter(key="compra-en-fila").exists())
+
+        waiting_room.get_store().rooms[self.event.pk].admitted_until = 2
+        response = self.client.post(url, data, HTTP_IDEMPOTENCY_KEY="compra-en-fila")
+
+        self.assertRedirects(response, reverse("view_ticket", kwargs={"event_id": self.event.pk}))
+        self.assertTrue(Ticket.objects.filter(event=self.event, user=self.second).exists())
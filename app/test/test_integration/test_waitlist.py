@@ -0,0 +1,164 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import (
+    Category,
+    Event,
+    RefoundRequest,
+    Ticket,
+    TicketHold,
+    User,
+    Venue,
+    WaitlistEntry,
+)
+
+
+class WaitlistIntegrationTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.buyer = User.objects.create_user(
+            username="buyer",
+            email="buyer@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.venue = Venue.objects.create(
+            name="Test Venue",
+            address="Test Address",
+            city="Test City",
+            capacity=2,
+            contact="123456789"
+        )
+
+        self.category = Category.objects.create(
+            name="Test Category",
+            description="Test Description",
+            is_active=True
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+        Ticket.new(
+            buy_date=timezone.now(),
+            ticket_code="SOLDOUT",
+            quantity=2,
+            type="GENERAL",
+            event=self.event,
+            user=self.buyer,
+        )
+        self.ticket = Ticket.objects.get(ticket_code="SOLDOUT")
+
+        self.client = Client()
+        self.client.login(username="regular_user", password="password123")
+
+    def test_sold_out_purchase_offers_waitlist(self):
+        """Test que verifica que una compra sin capacidad muestra el formulario de la lista de espera"""
+        response = self.client.post(
+            reverse("purchase_ticket", kwargs={"event_id": self.event.pk}),
+            {"cantidad": "1", "tipoEntrada": "GENERAL"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, reverse("join_waitlist", kwargs={"event_id": self.event.pk}))
+
+    def test_join_waitlist(self):
+        """Test que verifica que el usuario queda anotado en la lista de espera"""
+        response = self.client.post(
+            reverse("join_waitlist", kwargs={"event_id": self.event.pk}),
+            {"cantidad": "1", "tipoEntrada": "GENERAL"},
+        )
+
+        self.assertRedirects(response, reverse("event_detail", kwargs={"id": self.event.pk}))
+        entry = WaitlistEntry.objects.get(user=self.user)
+        self.assertEqual(entry.quantity, 1)
+        self.assertIsNone(entry.offered_at)
+
+    def test_leave_waitlist(self):
+        """Test que verifica que el usuario puede salir de la lista de espera"""
+        _, entry = WaitlistEntry.new(self.event, self.user, 1, "GENERAL")
+
+        self.client.post(reverse("leave_waitlist", kwargs={"entry_id": entry.pk}))
+
+        self.assertFalse(WaitlistEntry.objects.exists())
+
+    def test_approved_refund_promotes_waitlist(self):
+        """Test que verifica que aprobar un reembolso ofrece las entradas a la lista de espera"""
+        _, entry = WaitlistEntry.new(self.event, self.user, 2, "GENERAL")
+        refound = RefoundRequest.objects.create(
+            ticket_code="SOLDOUT", reason="No puedo ir", user=self.buyer, event=self.event
+        )
+
+        organizer_client = Client()
+        organizer_client.login(username="organizer", password="password123")
+        organizer_client.get(
+            reverse("accept_reject_refound_request", kwargs={"refound_id": refound.pk, "action": "approve"})
+        )
+
+        self.assertFalse(Ticket.objects.filter(pk=self.ticket.pk).exists())
+        entry.refresh_from_db()
+        self.assertIsNotNone(entry.hold)
+
+        # El usuario ve la oferta en la compra y la confirma con el hold_id
+        response = self.client.get(reverse("purchase_ticket", kwargs={"event_id": self.event.pk}))
+        self.assertContains(response, f'name="hold_id" value="{entry.hold.pk}"')
+
+        self.client.post(
+            reverse("purchase_ticket", kwargs={"event_id": self.event.pk}),
+            {"cantidad": "2", "tipoEntrada": "GENERAL", "hold_id": entry.hold.pk},
+        )
+        self.assertEqual(Ticket.objects.get(user=self.user).quantity, 2)
+
+    def test_refund_of_transferred_ticket_is_not_approved(self):
+        """Test que verifica que no se aprueba el reembolso de un ticket que ya se transfirió"""
+        refound = RefoundRequest.objects.create(
+            ticket_code="SOLDOUT", reason="No puedo ir", user=self.buyer, event=self.event
+        )
+        success, _ = self.ticket.transfer(self.user)
+        self.assertTrue(success)
+
+        organizer_client = Client()
+        organizer_client.login(username="organizer", password="password123")
+        organizer_client.get(
+            reverse("accept_reject_refound_request", kwargs={"refound_id": refound.pk, "action": "approve"})
+        )
+
+        self.assertEqual(Ticket.objects.get(pk=self.ticket.pk).user, self.user)
+        refound.refresh_from_db()
+        self.assertIsNone(refound.approved)
+        self.assertFalse(TicketHold.objects.exists())
+
+    def test_promote_waitlist_command(self):
+        """Test que verifica que el comando ofrece las entradas liberadas por fuera de las vistas"""
+        WaitlistEntry.new(self.event, self.user, 1, "GENERAL")
+        self.ticket.update_quantity(1, "GENERAL")
+
+        out = StringIO()
+        call_command("promote_waitlist", stdout=out)
+
+        self.assertIn("1 ofertas", out.getvalue())
+        self.assertTrue(TicketHold.objects.filter(user=self.user).exists())
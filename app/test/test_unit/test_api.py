@@ -0,0 +1,74 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from app import api
+from app.models import Category, Event, User, Venue
+
+
+class ApiSerializerTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+        self.venue = Venue.objects.create(
+            name="Estadio", address="Av. Siempre Viva 742", city="Córdoba", capacity=100, contact="123456789"
+        )
+        self.category = Category.objects.create(name="Música", description="Conciertos en vivo")
+        self.event = Event.objects.create(
+            title="Concierto",
+            description="Descripción",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+    def row(self, fields=api.LIST_FIELDS):
+        return Event.objects.filter(pk=self.event.pk).values(*fields).get()
+
+    def test_event_summary(self):
+        """Test que verifica el formato de un evento en el listado"""
+        data = api.event_summary(self.row())
+
+        self.assertEqual(data["id"], self.event.pk)
+        self.assertEqual(data["scheduled_at"], self.event.scheduled_at.isoformat())
+        self.assertEqual(data["category"], {"id": self.category.pk, "name": "Música"})
+        self.assertEqual(data["venue"], {"id": self.venue.pk, "name": "Estadio", "city": "Córdoba"})
+
+    def test_event_detail(self):
+        """Test que verifica que el detalle agrega la descripción y los datos de la ubicación"""
+        data = api.event_detail(self.row(api.DETAIL_FIELDS))
+
+        self.assertEqual(data["description"], "Descripción")
+        self.assertEqual(data["venue"]["address"], "Av. Siempre Viva 742")
+        self.assertEqual(data["category"]["description"], "Conciertos en vivo")
+
+    def test_etag_follows_related_changes(self):
+        """Test que verifica que el ETag cambia al modificar el evento, su categoría o su ubicación"""
+        etags = {api.etag([self.row()])}
+
+        self.event.title = "Otro título"
+        self.event.save()
+        etags.add(api.etag([self.row()]))
+
+        self.category.name = "Rock"
+        self.category.save()
+        etags.add(api.etag([self.row()]))
+
+        self.venue.name = "Club"
+        self.venue.save()
+        etags.add(api.etag([self.row()]))
+
+        self.assertEqual(len(etags), 4)
+        self.assertEqual(api.etag([self.row()]), api.etag([self.row()]))
+
+    def test_etag_depends_on_rows_and_extra(self):
+        """Test que verifica que el ETag depende de qué filas hay y de los valores extra"""
+        row = self.row()
+
+        self.assertNotEqual(api.etag([row]), api.etag([]))
+        self.assertNotEqual(api.etag([row], "cursor-a"), api.etag([row], "cursor-b"))
+        self.assertTrue(api.etag([row]).startswith('"'))
@@ -0,0 +1,157 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from app import checkin
+from app.models import Category, CheckIn, Event, Ticket, User, Venue
+
+
+class GateIndexTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=Category.objects.create(name="Test Category", description="Test Description"),
+            venue=Venue.objects.create(
+                name="Test Venue", address="Test Address", city="Test City", capacity=100, contact="123"
+            ),
+        )
+
+        self.tickets = [
+            Ticket.objects.create(
+                event=self.event,
+                user=self.user,
+                buy_date=timezone.now().date(),
+                ticket_code=f"CODE{i}",
+                quantity=i + 1,
+                type="GENERAL",
+            )
+            for i in range(3)
+        ]
+
+    def test_scan_admits_once_and_rejects_duplicates(self):
+        """Test que verifica que un código ingresa una sola vez y los inválidos se rechazan"""
+        gate = checkin.GateIndex.load(self.event.pk, flush_size=10, flush_seconds=60)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(gate.scan("CODE1"), (checkin.ADMITTED, 2))
+            self.assertEqual(gate.scan("code1"), (checkin.DUPLICATE, 2))
+
+        self.assertEqual(gate.scan("NOPE"), (checkin.INVALID, 0))
+
+    def test_scans_are_flushed_in_batches(self):
+        """Test que verifica que los ingresos se guardan recién al completar un lote"""
+        gate = checkin.GateIndex.load(self.event.pk, flush_size=2, flush_seconds=60)
+
+        gate.scan("CODE0")
+        self.assertEqual(CheckIn.objects.count(), 0)
+
+        gate.scan("CODE1")
+        self.assertEqual(CheckIn.objects.count(), 2)
+
+        gate.scan("CODE2")
+        self.assertEqual(gate.flush(), 1)
+        self.assertEqual(CheckIn.objects.count(), 3)
+
+    def test_load_includes_previous_admissions_and_late_tickets(self):
+        """Test que verifica que al recargar se respetan los ingresos previos y se aceptan tickets nuevos"""
+        CheckIn.objects.create(ticket=self.tickets[0], admitted_at=timezone.now())
+        gate = checkin.GateIndex.load(self.event.pk)
+
+        self.assertEqual(gate.scan("CODE0")[0], checkin.DUPLICATE)
+
+        Ticket.objects.create(
+            event=self.event,
+            user=self.user,
+            buy_date=timezone.now().date(),
+            ticket_code="LATE",
+            quantity=1,
+            type="VIP",
+        )
+        self.assertEqual(gate.scan("LATE")[0], checkin.ADMITTED)
+
+    def test_deleted_ticket_is_forgotten(self):
+        """Test que verifica que un ticket borrado con la puerta abierta deja de ser válido"""
+        gate = checkin.open_gate(self.event.pk)
+        self.addCleanup(checkin.close_gate, self.event.pk)
+        gate.flush_size = 10
+
+        self.assertEqual(gate.scan("CODE0")[0], checkin.ADMITTED)
+        self.tickets[0].delete()
+
+        self.assertEqual(gate.scan("CODE0"), (checkin.INVALID, 0))
+        self.assertEqual(gate.stats()["pending"], 0)
+
+    def test_flush_skips_tickets_deleted_elsewhere(self):
+        """Test que verifica que un ticket borrado desde otro proceso no hace perder el lote"""
+        gate = checkin.GateIndex.load(self.event.pk, flush_size=10, flush_seconds=60)
+
+        gate.scan("CODE0")
+        gate.scan("CODE1")
+        # Índice fuera de checkin._indexes: no se entera del borrado, como en otro worker
+        self.tickets[0].delete()
+
+        gate.flush()
+        self.assertEqual(list(CheckIn.objects.values_list("ticket_id", flat=True)), [self.tickets[1].pk])
+
+    def test_unknown_codes_are_remembered(self):
+        """Test que verifica que un código inexistente se busca en la base una sola vez por plazo"""
+        gate = checkin.GateIndex.load(self.event.pk, flush_size=10, flush_seconds=60, miss_seconds=5)
+
+        self.assertEqual(gate.scan("NOPE"), (checkin.INVALID, 0))
+        with self.assertNumQueries(0):
+            self.assertEqual(gate.scan("NOPE"), (checkin.INVALID, 0))
+
+        # Vencido el plazo se vuelve a buscar: pudo venderse después de abrir la puerta
+        gate.misses["NOPE"] = 0
+        Ticket.objects.create(
+            event=self.event,
+            user=self.user,
+            buy_date=timezone.now().date(),
+            ticket_code="NOPE",
+            quantity=1,
+            type="GENERAL",
+        )
+        self.assertEqual(gate.scan("NOPE"), (checkin.ADMITTED, 1))
+
+    def test_unknown_code_is_looked_up_without_the_lock(self):
+        """Test que verifica que la consulta de un código desconocido no bloquea los demás escaneos"""
+        gate = checkin.GateIndex.load(self.event.pk, flush_size=10, flush_seconds=60)
+        held = []
+        query = checkin.Ticket.objects.filter
+
+        def filter_without_lock(*args, **kwargs):
+            held.append(gate.lock.locked())
+            return query(*args, **kwargs)
+
+        with patch("app.checkin.Ticket.objects.filter", side_effect=filter_without_lock):
+            gate.scan("NOPE")
+
+        self.assertEqual(held, [False])
+
+    def test_flush_if_due(self):
+        """Test que verifica que los ingresos pendientes se guardan al vencer el plazo aunque no haya escaneos"""
+        gate = checkin.GateIndex.load(self.event.pk, flush_size=10, flush_seconds=60)
+        gate.scan("CODE0")
+
+        self.assertEqual(gate.flush_if_due(), 0)
+        gate.last_flush -= 60
+        self.assertEqual(gate.flush_if_due(), 1)
+        self.assertEqual(CheckIn.objects.count(), 1)
@@ -0,0 +1,104 @@
+import csv
+import io
+import json
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from app import exports
+from app.models import Category, CheckIn, Event, Ticket, User, Venue
+
+
+class ExportsTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+        self.buyers = [
+            User.objects.create_user(
+                username=f"buyer{i}", email=f"buyer{i}@test.com", password="password123", first_name=f"Nombre {i}"
+            )
+            for i in range(3)
+        ]
+        self.event = Event.objects.create(
+            title="Festival, edición 2030",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=Category.objects.create(name="Test Category", description="Test Description"),
+            venue=Venue.objects.create(
+                name="Test Venue", address="Test Address", city="Test City", capacity=100, contact="123"
+            ),
+        )
+
+        self.tickets = []
+        for i, (buyer, quantity) in enumerate([(0, 2), (0, 1), (1, 4), (2, 1)]):
+            self.tickets.append(Ticket.objects.create(
+                event=self.event,
+                user=self.buyers[buyer],
+                buy_date=timezone.now().date(),
+                ticket_code=f"EXP{i}",
+                quantity=quantity,
+                type="GENERAL",
+            ))
+        CheckIn.objects.create(ticket=self.tickets[0], admitted_at=timezone.now(), gate="A")
+
+    def test_tickets_csv(self):
+        """Test que verifica el CSV de entradas con el comprador y el ingreso"""
+        export = exports.Export("tickets", "csv", exports.tickets_rows(self.event.pk))
+        rows = list(csv.DictReader(io.StringIO("".join(export))))
+
+        self.assertEqual([row["ticket_code"] for row in rows], ["EXP0", "EXP1", "EXP2", "EXP3"])
+        self.assertEqual(rows[0]["username"], "buyer0")
+        self.assertEqual(rows[0]["email"], "buyer0@test.com")
+        self.assertNotEqual(rows[0]["admitted_at"], "")
+        self.assertEqual(rows[1]["admitted_at"], "")
+        self.assertEqual(export.rows, 4)
+
+    def test_attendees_jsonl(self):
+        """Test que verifica que los asistentes se agrupan por usuario"""
+        export = exports.Export("attendees", "jsonl", exports.attendees_rows(self.event.pk))
+        lines = [json.loads(line) for line in "".join(export).splitlines()]
+
+        self.assertEqual(
+            [(line["username"], line["tickets"], line["quantity"]) for line in lines],
+            [("buyer0", 2, 3), ("buyer1", 1, 4), ("buyer2", 1, 1)],
+        )
+        self.assertEqual(lines[0]["first_name"], "Nombre 0")
+
+    def test_events_csv_quotes_values(self):
+        """Test que verifica que los valores con comas se escriben entre comillas"""
+        body = "".join(exports.Export("events", "csv", exports.events_rows(self.organizer)))
+
+        self.assertIn('"Festival, edición 2030"', body)
+        self.assertEqual(list(exports.events_rows(self.buyers[0])), [])
+
+    def test_streams_in_chunks(self):
+        """Test que verifica que el contenido se genera de a bloques y con una sola consulta"""
+        with mock.patch.object(exports, "CHUNK_SIZE", 2), self.assertNumQueries(1):
+            chunks = list(exports.Export("tickets", "jsonl", exports.tickets_rows(self.event.pk)))
+
+        self.assertEqual(len(chunks), 2)
+        self.assertTrue(all(chunk.count("\n") == 2 for chunk in chunks))
+
+    def test_unknown_kind_or_format(self):
+        """Test que verifica que se rechazan los tipos y formatos desconocidos"""
+        with self.assertRaises(ValueError):
+            exports.Export("users", "csv", exports.tickets_rows(self.event.pk))
+        with self.assertRaises(ValueError):
+            exports.Export("tickets", "xml", exports.tickets_rows(self.event.pk))
+
+    def test_command(self):
+        """Test que verifica que el comando escribe la exportación e informa las filas por segundo"""
+        out = io.StringIO()
+        err = io.StringIO()
+        call_command("export_event_data", "attendees", "--event", str(self.event.pk), stdout=out, stderr=err)
+
+        self.assertEqual(len(list(csv.DictReader(io.StringIO(out.getvalue())))), 3)
+        self.assertIn("3 filas", err.getvalue())
+        self.assertIn("filas/s", err.getvalue())
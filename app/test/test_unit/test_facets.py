@@ -0,0 +1,88 @@
+import datetime
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from app import facets
+from app.models import Category, Event, User, Venue
+
+
+class FacetsTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.rock = Category.objects.create(name="Rock", description="Recitales")
+        self.jazz = Category.objects.create(name="Jazz", description="Recitales")
+        self.stadium = Venue.objects.create(
+            name="Estadio", address="Test Address", city="Test City", capacity=100, contact="123456789"
+        )
+        self.club = Venue.objects.create(
+            name="Club", address="Test Address", city="Test City", capacity=100, contact="123456789"
+        )
+
+        self.november = datetime.date(2030, 11, 1)
+        self.december = datetime.date(2030, 12, 1)
+        self.create_event(self.rock, self.stadium, self.november)
+        self.create_event(self.rock, self.stadium, self.november)
+        self.create_event(self.rock, self.club, self.december)
+        self.create_event(self.jazz, self.club, self.december)
+
+    def create_event(self, category, venue, month):
+        return Event.objects.create(
+            title="Evento",
+            description="Descripción",
+            scheduled_at=timezone.make_aware(datetime.datetime(month.year, month.month, 15, 21)),
+            organizer=self.organizer,
+            category=category,
+            venue=venue
+        )
+
+    def test_counts_without_filters(self):
+        """Test que verifica las cantidades por categoría, ubicación y mes sin filtros"""
+        counts = facets.counts(Event.objects.all(), {})
+
+        self.assertEqual(counts["category"], {self.rock.id: 3, self.jazz.id: 1})
+        self.assertEqual(counts["venue"], {self.stadium.id: 2, self.club.id: 2})
+        self.assertEqual(counts["month"], {self.november: 2, self.december: 2})
+
+    def test_counts_ignore_own_filter(self):
+        """Test que verifica que cada faceta cuenta con los filtros de las otras y no con el propio"""
+        counts = facets.counts(Event.objects.all(), {"category": str(self.jazz.id), "month": "2030-12"})
+
+        self.assertEqual(counts["category"], {self.rock.id: 1, self.jazz.id: 1})
+        self.assertEqual(counts["venue"], {self.club.id: 1})
+        self.assertEqual(counts["month"], {self.december: 1})
+
+    def test_counts_in_one_query(self):
+        """Test que verifica que las cantidades salen de una sola consulta"""
+        for _ in range(10):
+            self.create_event(Category.objects.create(name="Otra", description="desc"), self.club, self.november)
+
+        with CaptureQueriesContext(connection) as queries:
+            facets.counts(Event.objects.all(), {"venue": str(self.club.id)})
+
+        self.assertEqual(len(queries), 1)
+
+    def test_apply(self):
+        """Test que verifica que se aplican los filtros elegidos, incluido el rango del mes"""
+        events = facets.apply(Event.objects.all(), {"category": str(self.rock.id), "month": "2030-12"})
+        self.assertEqual(events.count(), 1)
+
+        last = self.create_event(self.jazz, self.club, self.december)
+        last.scheduled_at = timezone.make_aware(datetime.datetime(2030, 12, 31, 23, 59))
+        last.save()
+        self.assertEqual(facets.apply(Event.objects.all(), {"month": "2030-12"}).count(), 3)
+
+    def test_invalid_values_are_ignored(self):
+        """Test que verifica que los valores inválidos no filtran"""
+        filters = {"category": "abc", "venue": "", "month": "2030-13"}
+
+        self.assertEqual(facets.apply(Event.objects.all(), filters).count(), 4)
+        self.assertEqual(facets.selected(filters), {"category": None, "venue": None, "month": None})
@@ -0,0 +1,118 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.http import QueryDict
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from app import fragment_cache
+from app.models import Category, Event, User, Venue
+
+
+class FragmentCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.renders = 0
+
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+        self.category = Category.objects.create(name="Música", description="Conciertos")
+        self.venue = Venue.objects.create(
+            name="Estadio", address="Test Address", city="Test City", capacity=100, contact="123456789"
+        )
+        self.event = Event.objects.create(
+            title="Concierto",
+            description="Descripción",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+    def render(self):
+        self.renders += 1
+        return f"<p>{self.renders}</p>"
+
+    def get(self, params=None):
+        return fragment_cache.get_or_render("test", params or {}, self.render)
+
+    def test_hit_and_miss(self):
+        """Test que verifica que el fragmento se genera una vez y después se lee de la caché"""
+        fragment_cache.reset_stats()
+
+        self.assertEqual(self.get(), "<p>1</p>")
+        self.assertEqual(self.get(), "<p>1</p>")
+        self.assertEqual(self.get({"category": "1"}), "<p>2</p>")
+
+        self.assertEqual(fragment_cache.stats(), {"hits": 1, "misses": 2, "hit_rate": 1 / 3})
+
+    def test_key_ignores_parameter_order(self):
+        """Test que verifica que el orden de los parámetros no cambia la clave"""
+        self.assertEqual(
+            fragment_cache.fragment_key("test", QueryDict("venue=1&category=2")),
+            fragment_cache.fragment_key("test", {"category": "2", "venue": "1"}),
+        )
+
+    def test_catalog_changes_invalidate(self):
+        """Test que verifica que guardar o borrar un evento, ubicación o categoría invalida los fragmentos"""
+        self.get()
+
+        self.event.title = "Otro título"
+        self.event.save()
+        self.assertEqual(self.get(), "<p>2</p>")
+
+        self.venue.name = "Club"
+        self.venue.save()
+        self.assertEqual(self.get(), "<p>3</p>")
+
+        self.category.name = "Rock"
+        self.category.save()
+        self.assertEqual(self.get(), "<p>4</p>")
+
+        self.event.delete()
+        self.assertEqual(self.get(), "<p>5</p>")
+        self.assertEqual(self.get(), "<p>5</p>")
+
+    def test_lost_version_does_not_reuse_fragments(self):
+        """Test que verifica que si se pierde la versión no se leen fragmentos anteriores"""
+        self.get()
+        cache.delete(fragment_cache.VERSION_KEY)
+
+        self.assertEqual(self.get(), "<p>2</p>")
+
+    @override_settings(EVENTS_FRAGMENT_CACHE_SECONDS=0)
+    def test_disabled(self):
+        """Test que verifica que con 0 segundos no se usa la caché"""
+        self.get()
+        self.get()
+
+        self.assertEqual(self.renders, 2)
+
+    def test_stats_command(self):
+        """Test que verifica que el comando muestra y reinicia los contadores"""
+        fragment_cache.reset_stats()
+        self.get()
+        self.get()
+
+        out = StringIO()
+        call_command("fragment_cache_stats", "--reset", stdout=out)
+
+        self.assertIn("1 aciertos, 1 fallos (50% de aciertos)", out.getvalue())
+        self.assertEqual(fragment_cache.stats()["hits"], 0)
+
+
+@override_settings(CACHES={
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.path.join(tempfile.gettempdir(), "eventhub-test-fragments"),
+    }
+})
+class FileBasedFragmentCacheTestCase(FragmentCacheTestCase):
+    """Los mismos tests con la caché en archivos, que se comparte entre procesos."""
@@ -0,0 +1,100 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from app import gate_snapshot
+from app.models import Category, Event, Ticket, TicketTombstone, User, Venue
+
+
+class GateSnapshotTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=Category.objects.create(name="Test Category", description="Test Description"),
+            venue=Venue.objects.create(
+                name="Test Venue", address="Test Address", city="Test City", capacity=100, contact="123"
+            ),
+        )
+
+        self.tickets = [
+            Ticket.objects.create(
+                event=self.event,
+                user=self.user,
+                buy_date=timezone.now().date(),
+                ticket_code=code,
+                quantity=quantity,
+                type="GENERAL",
+            )
+            for code, quantity in [("CCC", 1), ("AAA", 3), ("BBB", 2)]
+        ]
+
+    def build(self, **kwargs):
+        return gate_snapshot.read(b"".join(gate_snapshot.generate(self.event.pk, **kwargs)))
+
+    def test_full_snapshot_is_sorted(self):
+        """Test que verifica que el snapshot completo tiene todos los códigos ordenados"""
+        header, records = self.build()
+
+        self.assertEqual(header["kind"], gate_snapshot.FULL)
+        self.assertEqual(header["event_id"], self.event.pk)
+        self.assertEqual(records, [("AAA", 3), ("BBB", 2), ("CCC", 1)])
+
+    def test_delta_includes_changes_and_removals(self):
+        """Test que verifica que el delta trae los tickets modificados y los borrados"""
+        header, records = self.build()
+        since = gate_snapshot.from_millis(header["generated_at"]) + timedelta(milliseconds=1)
+        codes = gate_snapshot.apply({}, records)
+
+        ticket_b, ticket_c = self.tickets[2], self.tickets[0]
+        ticket_b.update_quantity(4, "GENERAL")
+        ticket_c.delete()
+
+        header, records = self.build(since=since)
+
+        self.assertEqual(header["kind"], gate_snapshot.DELTA)
+        self.assertEqual(records, [("BBB", 4), ("CCC", 0)])
+        self.assertEqual(gate_snapshot.apply(codes, records), {"AAA": 3, "BBB": 4})
+
+    def test_deleting_user_tombstones_tickets(self):
+        """Test que verifica que los tickets borrados en cascada con su usuario quedan como bajas"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+
+        self.assertEqual(
+            sorted(TicketTombstone.objects.filter(event=self.event).values_list("ticket_code", flat=True)),
+            ["AAA", "BBB", "CCC"],
+        )
+
+    def test_deleting_organizer_leaves_no_tombstones(self):
+        """Test que verifica que al borrar el evento en la misma cascada no quedan bajas huérfanas"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.organizer.delete()
+
+        self.assertFalse(Event.objects.filter(pk=self.event.pk).exists())
+        self.assertFalse(TicketTombstone.objects.exists())
+
+    def test_corrupt_snapshot_is_rejected(self):
+        """Test que verifica que un snapshot alterado no pasa la verificación"""
+        data = bytearray(b"".join(gate_snapshot.generate(self.event.pk)))
+        data[gate_snapshot.HEADER.size] ^= 0xFF
+
+        with self.assertRaises(ValueError):
+            gate_snapshot.read(bytes(data))
@@ -0,0 +1,116 @@
+import io
+import os
+import tempfile
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from app import geo
+from app.models import Venue
+
+
+class GeoTestCase(TestCase):
+    def setUp(self):
+        self.cordoba = self.create_venue("Estadio Kempes", "Av. Cárcano s/n", "Córdoba", -31.3689, -64.2464)
+        self.carlos_paz = self.create_venue("Anfiteatro", "Av. Libertad 50", "Villa Carlos Paz", -31.4241, -64.4978)
+        self.buenos_aires = self.create_venue("Luna Park", "Bouchard 465", "Buenos Aires", -34.6025, -58.3686)
+        self.without_coordinates = self.create_venue("Sin coordenadas", "Calle 1", "Córdoba", None, None)
+
+    def create_venue(self, name, address, city, latitude, longitude):
+        venue = Venue(name=name, address=address, city=city, capacity=100, contact="123456789")
+        venue.set_coordinates(latitude, longitude)
+        venue.save()
+        return venue
+
+    def test_grid_cell(self):
+        """Test que verifica que la celda de la grilla sale de las coordenadas"""
+        self.assertIsNone(geo.grid_cell(None, None))
+        self.assertEqual(geo.grid_cell(-90, -180), 0)
+        self.assertEqual(geo.grid_cell(90, 180), geo.ROWS * geo.COLUMNS - geo.COLUMNS)
+        self.assertEqual(self.cordoba.grid_cell, geo.grid_cell(-31.3689, -64.2464))
+
+    def test_grid_cell_edges(self):
+        """Test que verifica que los puntos sobre una línea de la grilla caen en la celda de arriba"""
+        self.assertEqual(geo.grid_cell(-31.4, 0) // geo.COLUMNS, 586)
+        self.assertEqual(geo.grid_cell(0.3, 0) // geo.COLUMNS, 903)
+        self.assertEqual(geo.grid_cell(0, -64.3) % geo.COLUMNS, 1157)
+        self.assertEqual(geo.grid_cell(0, 180), geo.grid_cell(0, -180))
+
+    def test_nearby_venue_on_cell_edge(self):
+        """Test que verifica que una ubicación sobre el borde de una celda se encuentra"""
+        edge = self.create_venue("Borde", "Calle 3", "Córdoba", -31.4, -64.3)
+
+        self.assertIn(edge, geo.nearby_venues(-31.4, -64.3, 0.5))
+
+    def test_parse_point(self):
+        """Test que verifica la validación de los parámetros de cercanía"""
+        self.assertEqual(geo.parse_point("-31.42", "-64.19", "10"), (-31.42, -64.19, 10.0))
+        self.assertEqual(geo.parse_point("-31.42", "-64.19", "5000"), (-31.42, -64.19, geo.MAX_RADIUS_KM))
+        self.assertIsNone(geo.parse_point("-31.42", None, "10"))
+        self.assertIsNone(geo.parse_point("100", "-64.19", "10"))
+        self.assertIsNone(geo.parse_point("-31.42", "-64.19", "0"))
+        self.assertIsNone(geo.parse_point("-31.42", "abc", "10"))
+
+    def test_cell_ranges_cover_circle(self):
+        """Test que verifica que las celdas del rectángulo incluyen los puntos del círculo"""
+        ranges = geo.cell_ranges(-31.42, -64.19, 50)
+        cell = geo.grid_cell(-31.42 + 0.4, -64.19 - 0.5)
+
+        self.assertTrue(any(start <= cell <= end for start, end in ranges))
+        self.assertLessEqual(len(ranges), 11)
+
+    def test_cell_ranges_cross_antimeridian(self):
+        """Test que verifica que el rectángulo que cruza el antimeridiano se parte en dos rangos"""
+        ranges = geo.cell_ranges(-17.0, 179.95, 20)
+        west = geo.grid_cell(-17.0, -179.95)
+
+        self.assertTrue(any(start <= west <= end for start, end in ranges))
+        self.assertEqual(len({start // geo.COLUMNS for start, end in ranges}) * 2, len(ranges))
+
+    def test_nearby_venues(self):
+        """Test que verifica que se filtra por la distancia exacta y se calcula en la base"""
+        venues = geo.nearby_venues(-31.4201, -64.1888, 40)
+        distances = {venue.name: venue.distance for venue in venues}
+
+        self.assertEqual(set(distances), {"Estadio Kempes", "Anfiteatro"})
+        self.assertAlmostEqual(
+            distances["Anfiteatro"], geo.distance_km(-31.4201, -64.1888, -31.4241, -64.4978), places=3
+        )
+        self.assertEqual(
+            [venue.name for venue in geo.nearby_venues(-31.4201, -64.1888, 10)], ["Estadio Kempes"]
+        )
+
+    def test_nearby_venues_across_antimeridian(self):
+        """Test que verifica la búsqueda de ubicaciones a ambos lados del antimeridiano"""
+        east = self.create_venue("Este", "Calle 1", "Fiyi", -17.0, 179.98)
+        west = self.create_venue("Oeste", "Calle 2", "Fiyi", -17.0, -179.98)
+
+        self.assertEqual(set(geo.nearby_venues(-17.0, 179.99, 10)), {east, west})
+
+    def test_import_command(self):
+        """Test que verifica la carga de coordenadas desde el archivo CSV"""
+        Venue.objects.update(latitude=None, longitude=None, grid_cell=None)
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", encoding="utf-8", delete=False) as lookup:
+            lookup.write("city,address,latitude,longitude\n")
+            lookup.write("córdoba,AV.  CÁRCANO S/N,-31.3689,-64.2464\n")
+            lookup.write("Córdoba,,-31.4201,-64.1888\n")
+        self.addCleanup(os.remove, lookup.name)
+
+        out = io.StringIO()
+        call_command("import_venue_coordinates", lookup.name, stdout=out)
+
+        self.cordoba.refresh_from_db()
+        self.without_coordinates.refresh_from_db()
+        self.assertEqual((self.cordoba.latitude, self.cordoba.longitude), (-31.3689, -64.2464))
+        self.assertEqual(self.cordoba.grid_cell, geo.grid_cell(-31.3689, -64.2464))
+        # La fila sin dirección vale para el resto de la ciudad
+        self.assertEqual((self.without_coordinates.latitude, self.without_coordinates.longitude), (-31.4201, -64.1888))
+        self.assertIn("2 ubicaciones actualizadas", out.getvalue())
+        self.assertIn("2 ubicaciones sin coordenadas", out.getvalue())
+
+    def test_read_lookup_invalid(self):
+        """Test que verifica que un archivo mal formado se rechaza"""
+        with self.assertRaises(ValueError):
+            geo.read_lookup(io.StringIO("city,latitude,longitude\nCórdoba,-31,-64\n"))
+        with self.assertRaises(ValueError):
+            geo.read_lookup(io.StringIO("city,address,latitude,longitude\nCórdoba,,200,-64\n"))
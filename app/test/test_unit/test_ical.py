@@ -0,0 +1,64 @@
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from app import ical
+from app.models import Category, Event, User, Venue
+
+
+class ICalTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+        self.venue = Venue.objects.create(
+            name="Estadio", address="Av. Colón 1, Centro", city="Córdoba", capacity=100, contact="123456789"
+        )
+        self.category = Category.objects.create(name="Música", description="Conciertos")
+        self.event = Event.objects.create(
+            title="Concierto; edición especial",
+            description="Primera línea\nSegunda línea",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+    def test_token(self):
+        """Test que verifica que el token identifica al usuario y no se puede alterar"""
+        token = ical.feed_token(self.organizer)
+
+        self.assertEqual(ical.user_from_token(token), self.organizer)
+        self.assertIsNone(ical.user_from_token(token[:-1] + ("A" if token[-1] != "A" else "B")))
+        self.assertIsNone(ical.user_from_token("1:abc"))
+
+    def test_escape(self):
+        """Test que verifica el escape de los caracteres especiales de iCalendar"""
+        self.assertEqual(ical.escape("a,b;c\\d\ne"), "a\\,b\\;c\\\\d\\ne")
+
+    def test_fold(self):
+        """Test que verifica que las líneas largas se cortan en 75 bytes sin romper caracteres"""
+        line = "DESCRIPTION:" + "ñ" * 100
+        folded = ical.fold(line)
+
+        self.assertTrue(folded.endswith("\r\n"))
+        physical = folded[:-2].split("\r\n")
+        self.assertTrue(all(len(part.encode()) <= 75 for part in physical))
+        self.assertEqual("".join(part[1:] if i else part for i, part in enumerate(physical)), line)
+        self.assertEqual(ical.fold("SUMMARY:corto"), "SUMMARY:corto\r\n")
+
+    def test_calendar(self):
+        """Test que verifica el contenido del calendario"""
+        request = RequestFactory().get("/", HTTP_HOST="testserver")
+        body = "".join(ical.calendar(Event.objects.all(), "Mis eventos", request))
+
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertTrue(body.endswith("END:VCALENDAR\r\n"))
+        self.assertIn(f"UID:event-{self.event.pk}@testserver\r\n", body)
+        self.assertIn("SUMMARY:Concierto\\; edición especial\r\n", body)
+        self.assertIn("DESCRIPTION:Primera línea\\nSegunda línea\r\n", body)
+        self.assertIn("LOCATION:Estadio\\, Av. Colón 1\\, Centro\\, Córdoba\r\n", body)
+        self.assertIn(f"URL:http://testserver/events/{self.event.pk}/\r\n", body)
+        self.assertIn(f"DTSTART:{ical.format_datetime(self.event.scheduled_at)}\r\n", body)
@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+from django.http import HttpResponseRedirect
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from app.idempotency import request_fingerprint
+from app.models import IdempotencyKey, User
+
+
+@override_settings(IDEMPOTENCY_KEY_TTL=3600, IDEMPOTENCY_LOCK_SECONDS=30)
+class IdempotencyKeyTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+    def test_reserve_once(self):
+        """Test que verifica que una clave solo se puede reservar una vez"""
+        entry, created = IdempotencyKey.reserve(self.user, "purchase", "abc", "hash")
+        again, created_again = IdempotencyKey.reserve(self.user, "purchase", "abc", "hash")
+
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertEqual(again.pk, entry.pk)
+        self.assertTrue(again.is_pending())
+
+    def test_same_key_in_other_scope(self):
+        """Test que verifica que la misma clave en otra operación es independiente"""
+        IdempotencyKey.reserve(self.user, "purchase", "abc", "hash")
+
+        self.assertTrue(IdempotencyKey.reserve(self.user, "refund", "abc", "hash")[1])
+
+    def test_abandoned_reservation_expires(self):
+        """Test que verifica que una reserva que nunca terminó se libera al vencer el lock"""
+        entry, _ = IdempotencyKey.reserve(self.user, "purchase", "abc", "hash")
+        self.assertTrue(entry.expires_at <= timezone.now() + timedelta(seconds=30))
+        IdempotencyKey.objects.filter(pk=entry.pk).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        _, created = IdempotencyKey.reserve(self.user, "purchase", "abc", "hash")
+
+        self.assertTrue(created)
+
+    def test_complete_stores_response(self):
+        """Test que verifica que se guarda la respuesta y se extiende el vencimiento"""
+        entry, _ = IdempotencyKey.reserve(self.user, "purchase", "abc", "hash")
+
+        entry.complete(HttpResponseRedirect("/events/1/viewTickets/"))
+
+        entry.refresh_from_db()
+        self.assertEqual(entry.status_code, 302)
+        self.assertEqual(entry.location, "/events/1/viewTickets/")
+        self.assertTrue(entry.expires_at > timezone.now() + timedelta(seconds=3500))
+
+    def test_purge_expired_in_batches(self):
+        """Test que verifica que solo se borran las claves vencidas"""
+        past = timezone.now() - timedelta(minutes=1)
+        for i in range(5):
+            IdempotencyKey.objects.create(user=self.user, scope="purchase", key=f"old-{i}", request_hash="h", expires_at=past)
+        IdempotencyKey.reserve(self.user, "purchase", "fresh", "h")
+
+        purged = IdempotencyKey.purge_expired(batch_size=2)
+
+        self.assertEqual(purged, 5)
+        self.assertEqual(list(IdempotencyKey.objects.values_list("key", flat=True)), ["fresh"])
+
+    def test_fingerprint_ignores_csrf_and_key(self):
+        """Test que verifica que el token CSRF y la clave no cambian la huella del pedido"""
+        factory = RequestFactory()
+        first = factory.post("/events/1/purchase/", {"cantidad": "2", "csrfmiddlewaretoken": "a", "idempotency_key": "k1"})
+        retry = factory.post("/events/1/purchase/", {"cantidad": "2", "csrfmiddlewaretoken": "b", "idempotency_key": "k2"})
+        other = factory.post("/events/1/purchase/", {"cantidad": "3", "csrfmiddlewaretoken": "a"})
+
+        self.assertEqual(request_fingerprint(first), request_fingerprint(retry))
+        self.assertNotEqual(request_fingerprint(first), request_fingerprint(other))
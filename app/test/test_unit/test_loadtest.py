@@ -0,0 +1,22 @@
+from django.test import SimpleTestCase
+
+from app import loadtest
+
+
+class LoadTestSummaryTestCase(SimpleTestCase):
+    def test_percentiles_use_nearest_rank(self):
+        """Test que verifica los percentiles por rango más cercano"""
+        values = [i / 1000 for i in range(1, 101)]
+
+        self.assertEqual(loadtest.percentile(values, 0.50), 0.050)
+        self.assertEqual(loadtest.percentile(values, 0.99), 0.099)
+        self.assertEqual(loadtest.percentile([], 0.95), 0.0)
+
+    def test_summary_counts_errors(self):
+        """Test que verifica que los errores cuentan en el throughput y la tasa de error"""
+        stats = loadtest.summarize([0.010, 0.020, 0.030], errors=1, elapsed=2)
+
+        self.assertEqual(stats["requests"], 4)
+        self.assertEqual(stats["error_rate"], 0.25)
+        self.assertEqual(stats["throughput"], 2)
+        self.assertEqual(stats["p50_ms"], 20)
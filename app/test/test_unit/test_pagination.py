@@ -0,0 +1,100 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from app.models import Category, Event, User, Venue
+from app.pagination import InvalidCursor, decode_cursor, encode_cursor, paginate
+
+
+class PaginationTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.venue = Venue.objects.create(
+            name="Test Venue",
+            address="Test Address",
+            city="Test City",
+            capacity=100,
+            contact="123456789"
+        )
+
+        self.category = Category.objects.create(
+            name="Test Category",
+            description="Test Description",
+            is_active=True
+        )
+
+        # Dos eventos por horario: el id desempata el orden
+        self.base = timezone.now() + timezone.timedelta(days=1)
+        self.events = [
+            Event.objects.create(
+                title=f"Evento {i}",
+                description="Descripción",
+                scheduled_at=self.base + timezone.timedelta(hours=i // 2),
+                organizer=self.organizer,
+                category=self.category,
+                venue=self.venue
+            )
+            for i in range(7)
+        ]
+
+    def test_cursor_round_trip(self):
+        """Test que verifica que el cursor conserva la fecha y el id"""
+        cursor = encode_cursor(self.base, 42)
+
+        self.assertEqual(decode_cursor(cursor), (self.base, 42))
+
+    def test_invalid_cursor(self):
+        """Test que verifica que un cursor alterado se rechaza"""
+        for cursor in ["no-es-un-cursor", encode_cursor(self.base, 1)[:-3], "WyJ4IiwxXQ"]:
+            with self.assertRaises(InvalidCursor):
+                decode_cursor(cursor)
+
+    def test_pages_cover_all_rows_once(self):
+        """Test que verifica que recorrer todas las páginas devuelve cada evento una vez y en orden"""
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            rows, cursor = paginate(Event.objects.all(), cursor, page_size=3)
+            seen.extend(rows)
+            pages += 1
+            if cursor is None:
+                break
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(seen, self.events)
+
+    def test_exact_page_has_no_next_cursor(self):
+        """Test que verifica que una página completa sin más filas no devuelve cursor"""
+        rows, cursor = paginate(Event.objects.all(), None, page_size=7)
+
+        self.assertEqual(len(rows), 7)
+        self.assertIsNone(cursor)
+
+    def test_new_rows_do_not_shift_pages(self):
+        """Test que verifica que un evento creado antes del cursor no repite filas en la página siguiente"""
+        first, cursor = paginate(Event.objects.all(), None, page_size=3)
+        Event.objects.create(
+            title="Nuevo",
+            description="Descripción",
+            scheduled_at=self.base - timezone.timedelta(hours=1),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+        second, _ = paginate(Event.objects.all(), cursor, page_size=3)
+
+        self.assertEqual(second, self.events[3:6])
+
+    def test_values_queryset(self):
+        """Test que verifica que también se puede paginar un queryset con values()"""
+        rows, cursor = paginate(Event.objects.values("pk", "scheduled_at"), None, page_size=3)
+        second, _ = paginate(Event.objects.values("pk", "scheduled_at"), cursor, page_size=3)
+
+        self.assertEqual([row["pk"] for row in rows + second], [event.pk for event in self.events[:6]])
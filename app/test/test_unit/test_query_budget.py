@@ -0,0 +1,82 @@
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from app.models import Category
+from app.query_budget import QueryBudgetExceeded, QueryBudgetMiddleware, query_budget
+
+
+@query_budget(2)
+def listing(request):
+    for category in Category.objects.all():
+        # N+1 a propósito
+        list(Category.objects.filter(pk=category.pk))
+    return HttpResponse("ok")
+
+
+@query_budget(1, POST=4)
+def form(request):
+    for category in Category.objects.all():
+        list(Category.objects.filter(pk=category.pk))
+    return HttpResponse("ok")
+
+
+def unbudgeted(request):
+    for category in Category.objects.all():
+        list(Category.objects.filter(pk=category.pk))
+    return HttpResponse("ok")
+
+
+class QueryBudgetMiddlewareTestCase(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def call(self, view, method="get"):
+        request = getattr(self.factory, method)("/listado/")
+        middleware = QueryBudgetMiddleware(view)
+        middleware.process_view(request, view, (), {})
+        return middleware(request)
+
+    def create_categories(self, count):
+        Category.objects.bulk_create([Category(name=f"Cat {i}", description="-") for i in range(count)])
+
+    def test_within_budget(self):
+        """Test que verifica que una vista dentro del presupuesto responde normalmente"""
+        self.create_categories(1)
+
+        with override_settings(QUERY_BUDGET_STRICT=True):
+            self.assertEqual(self.call(listing).status_code, 200)
+
+    def test_strict_mode_raises(self):
+        """Test que verifica que en modo estricto pasarse del presupuesto es un error"""
+        self.create_categories(3)
+
+        with override_settings(QUERY_BUDGET_STRICT=True):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.call(listing)
+
+    def test_non_strict_mode_logs(self):
+        """Test que verifica que fuera del modo estricto solo se registra un warning"""
+        self.create_categories(3)
+
+        with override_settings(QUERY_BUDGET_STRICT=False):
+            with self.assertLogs("app.query_budget", level="WARNING") as logs:
+                response = self.call(listing)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("4 consultas (presupuesto: 2)", logs.output[0])
+
+    def test_views_without_budget_are_not_checked(self):
+        """Test que verifica que las vistas sin presupuesto declarado no se controlan"""
+        self.create_categories(3)
+
+        with override_settings(QUERY_BUDGET_STRICT=True):
+            self.assertEqual(self.call(unbudgeted).status_code, 200)
+
+    def test_budget_per_method(self):
+        """Test que verifica que cada método usa su propio presupuesto si lo declara"""
+        self.create_categories(3)
+
+        with override_settings(QUERY_BUDGET_STRICT=True):
+            self.assertEqual(self.call(form, "post").status_code, 200)
+            with self.assertRaises(QueryBudgetExceeded):
+                self.call(form)
@@ -0,0 +1,109 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from app import search
+from app.models import Category, Event, User, Venue
+
+
+class EventSearchTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.venue = Venue.objects.create(
+            name="Estadio Kempes",
+            address="Test Address",
+            city="Córdoba",
+            capacity=100,
+            contact="123456789"
+        )
+
+        self.music = Category.objects.create(name="Música", description="Conciertos")
+        self.theatre = Category.objects.create(name="Teatro", description="Obras")
+
+        self.rock = self.create_event("Festival de rock", "Bandas nacionales en vivo", self.music)
+        self.jazz = self.create_event("Noche de jazz", "Un invitado sorpresa que toca rock", self.music)
+        self.play = self.create_event("Hamlet", "Clásico de Shakespeare", self.theatre)
+
+    def create_event(self, title, description, category):
+        return Event.objects.create(
+            title=title,
+            description=description,
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=category,
+            venue=self.venue
+        )
+
+    def titles(self, query, events=None):
+        return [event.title for event in search.search(query, events)]
+
+    def test_title_ranks_above_description(self):
+        """Test que verifica que una coincidencia en el título pesa más que en la descripción"""
+        self.assertEqual(self.titles("rock"), ["Festival de rock", "Noche de jazz"])
+
+    def test_prefix_and_accents(self):
+        """Test que verifica la búsqueda por prefijo y sin distinguir acentos"""
+        self.assertEqual(self.titles("shakesp"), ["Hamlet"])
+        if connection.vendor == "sqlite":
+            self.assertEqual(self.titles("clasico"), ["Hamlet"])
+
+    def test_all_terms_must_match(self):
+        """Test que verifica que todas las palabras tienen que aparecer"""
+        self.assertEqual(self.titles("rock nacionales"), ["Festival de rock"])
+
+    def test_matches_venue_and_category(self):
+        """Test que verifica que se busca también en la ubicación y la categoría"""
+        self.assertEqual(len(self.titles("kempes")), 3)
+        self.assertEqual(self.titles("teatro"), ["Hamlet"])
+
+    def test_query_syntax_is_ignored(self):
+        """Test que verifica que los operadores del motor en la búsqueda no rompen la consulta"""
+        self.assertEqual(self.titles('"rock"* (^ -:'), ["Festival de rock", "Noche de jazz"])
+        self.assertEqual(self.titles("   "), [])
+
+    def test_combines_with_filters(self):
+        """Test que verifica que la búsqueda respeta los filtros del queryset"""
+        events = Event.objects.exclude(pk=self.rock.pk)
+
+        self.assertEqual(self.titles("rock", events), ["Noche de jazz"])
+
+    def test_index_follows_changes(self):
+        """Test que verifica que el índice se actualiza al editar y borrar eventos"""
+        self.play.title = "Macbeth"
+        self.play.save()
+        self.assertEqual(self.titles("macbeth"), ["Macbeth"])
+        self.assertEqual(self.titles("hamlet"), [])
+
+        self.play.delete()
+        self.assertEqual(self.titles("macbeth"), [])
+
+    def test_index_follows_renamed_category_and_venue(self):
+        """Test que verifica que renombrar una categoría o ubicación reindexa sus eventos"""
+        self.theatre.name = "Drama"
+        self.theatre.save()
+        self.venue.name = "Anfiteatro"
+        self.venue.save()
+
+        self.assertEqual(self.titles("drama"), ["Hamlet"])
+        self.assertEqual(len(self.titles("anfiteatro")), 3)
+
+    def test_reindex_command(self):
+        """Test que verifica que el comando reconstruye el índice completo"""
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {search.TABLE}")
+        self.assertEqual(self.titles("rock"), [])
+
+        out = StringIO()
+        call_command("reindex_event_search", stdout=out)
+
+        self.assertIn("3 eventos indexados", out.getvalue())
+        self.assertEqual(self.titles("rock"), ["Festival de rock", "Noche de jazz"])
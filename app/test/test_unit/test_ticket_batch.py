@@ -0,0 +1,100 @@
+from itertools import count
+
+from django.test import TestCase
+from django.utils import timezone
+
+from app.models import Category, Event, Ticket, User, Venue
+
+
+class TicketBatchTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.buyers = [
+            User.objects.create_user(username=f"buyer{i}", email=f"buyer{i}@test.com", password="password123")
+            for i in range(3)
+        ]
+
+        self.category = Category.objects.create(name="Test Category", description="Test Description")
+        self.venue = Venue.objects.create(
+            name="Test Venue", address="Test Address", city="Test City", capacity=5, contact="123"
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+        codes = count(1)
+        self.next_code = lambda: f"BATCH{next(codes)}"
+
+    def order(self, buyer, quantity, **extra):
+        return {"event": self.event.pk, "user": buyer.pk, "type": "GENERAL", "quantity": quantity, **extra}
+
+    def test_batch_creates_tickets_and_reports_each_order(self):
+        """Test que verifica que un lote crea los tickets válidos y reporta los inválidos"""
+        results = Ticket.new_batch(
+            [
+                self.order(self.buyers[0], 2),
+                self.order(self.buyers[1], 1, type="PLATEA"),
+                {"event": self.event.pk},
+                self.order(self.buyers[2], 1),
+            ],
+            buy_date=timezone.now().date(),
+            next_code=self.next_code,
+        )
+
+        self.assertEqual([r["success"] for r in results], [True, False, False, True])
+        self.assertEqual(Ticket.objects.count(), 2)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 3)
+
+    def test_batch_applies_user_limit_across_orders(self):
+        """Test que verifica que el límite de 4 por usuario suma las órdenes del mismo lote"""
+        self.venue.capacity = 100
+        self.venue.save()
+
+        results = Ticket.new_batch(
+            [self.order(self.buyers[0], 3), self.order(self.buyers[0], 2)],
+            buy_date=timezone.now().date(),
+            next_code=self.next_code,
+        )
+
+        self.assertTrue(results[0]["success"])
+        self.assertFalse(results[1]["success"])
+        self.assertIn("4", results[1]["error"])
+
+    def test_batch_fills_capacity_in_order(self):
+        """Test que verifica que si no entra todo el lote se aceptan las primeras órdenes que entran"""
+        results = Ticket.new_batch(
+            [self.order(self.buyers[0], 3), self.order(self.buyers[1], 3), self.order(self.buyers[2], 2)],
+            buy_date=timezone.now().date(),
+            next_code=self.next_code,
+        )
+
+        self.assertEqual([r["success"] for r in results], [True, False, True])
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 5)
+
+    def test_batch_rejects_events_of_other_organizers(self):
+        """Test que verifica que un organizador solo puede vender sus propios eventos"""
+        other = User.objects.create_user(username="other", email="other@test.com", password="x", is_organizer=True)
+
+        results = Ticket.new_batch(
+            [self.order(self.buyers[0], 1)],
+            buy_date=timezone.now().date(),
+            next_code=self.next_code,
+            organizer=other,
+        )
+
+        self.assertFalse(results[0]["success"])
+        self.assertEqual(Ticket.objects.count(), 0)
@@ -0,0 +1,121 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from app.models import Category, Event, Ticket, User, Venue
+
+
+class TicketCapacityCounterTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.venue = Venue.objects.create(
+            name="Test Venue",
+            address="Test Address",
+            city="Test City",
+            capacity=5,
+            contact="123456789"
+        )
+
+        self.category = Category.objects.create(
+            name="Test Category",
+            description="Test Description",
+            is_active=True
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+    def test_reserve_tickets_within_capacity(self):
+        """Test que verifica que se reservan entradas mientras haya capacidad"""
+        self.assertTrue(self.event.reserve_tickets(3))
+        self.assertTrue(self.event.reserve_tickets(2))
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 5)
+
+    def test_reserve_tickets_exceeding_capacity(self):
+        """Test que verifica que el UPDATE condicional no deja sobrevender"""
+        self.assertTrue(self.event.reserve_tickets(4))
+        self.assertFalse(self.event.reserve_tickets(2))
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 4)
+
+    def test_release_tickets_never_negative(self):
+        """Test que verifica que liberar entradas no deja el contador en negativo"""
+        self.event.reserve_tickets(1)
+        self.event.release_tickets(3)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 0)
+
+    def test_new_ticket_updates_counter(self):
+        """Test que verifica que Ticket.new suma la cantidad al contador del evento"""
+        success, errors = Ticket.new(
+            buy_date=timezone.now().date(),
+            ticket_code="ABC123",
+            quantity=2,
+            type="GENERAL",
+            event=self.event,
+            user=self.user,
+        )
+        self.assertTrue(success)
+        self.assertIsNone(errors)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 2)
+
+    def test_new_ticket_rejected_when_sold_out(self):
+        """Test que verifica que no se crea el ticket si el contador indica que no hay lugar"""
+        self.event.reserve_tickets(5)
+
+        success, errors = Ticket.new(
+            buy_date=timezone.now().date(),
+            ticket_code="ABC123",
+            quantity=1,
+            type="GENERAL",
+            event=self.event,
+            user=self.user,
+        )
+        self.assertFalse(success)
+        self.assertIn("capacity", errors)
+        self.assertEqual(Ticket.objects.count(), 0)
+
+    def test_delete_and_update_quantity_adjust_counter(self):
+        """Test que verifica que editar y eliminar un ticket ajustan el contador"""
+        Ticket.new(
+            buy_date=timezone.now().date(),
+            ticket_code="ABC123",
+            quantity=2,
+            type="GENERAL",
+            event=self.event,
+            user=self.user,
+        )
+        ticket = Ticket.objects.get(ticket_code="ABC123")
+
+        success, _ = ticket.update_quantity(4, "VIP")
+        self.assertTrue(success)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 4)
+
+        success, errors = ticket.update_quantity(6, "VIP")
+        self.assertFalse(success)
+        self.assertIn("capacity", errors)
+
+        ticket.delete()
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 0)
@@ -0,0 +1,46 @@
+from django.test import TestCase
+
+from app import ticket_codes
+
+
+class TicketCodesTestCase(TestCase):
+    def test_encode_decode_round_trip(self):
+        """Test que verifica que cada código se decodifica a su número de secuencia"""
+        for number in [1, 2, 31, 32, 1000, 123456789, ticket_codes.MAX_SEQUENCE]:
+            code = ticket_codes.encode(number)
+            self.assertEqual(len(code), ticket_codes.CODE_LENGTH)
+            self.assertEqual(ticket_codes.decode(code), number)
+
+    def test_check_digit_detects_single_character_errors(self):
+        """Test que verifica que cambiar cualquier carácter invalida el código"""
+        code = ticket_codes.encode(4242)
+        self.assertTrue(ticket_codes.is_valid(code))
+
+        for position in range(len(code)):
+            for char in ticket_codes.ALPHABET:
+                if char == code[position]:
+                    continue
+                typo = code[:position] + char + code[position + 1:]
+                self.assertFalse(ticket_codes.is_valid(typo), typo)
+
+    def test_is_valid_normalizes_input(self):
+        """Test que verifica que se aceptan minúsculas y las equivalencias de Crockford"""
+        code = ticket_codes.encode(77)
+        self.assertTrue(ticket_codes.is_valid(code.lower()))
+        self.assertTrue(ticket_codes.is_valid(code.replace("0", "O").replace("1", "I")))
+        self.assertFalse(ticket_codes.is_valid("ABC123"))
+        self.assertFalse(ticket_codes.is_valid(None))
+
+    def test_allocate_block_returns_disjoint_ranges(self):
+        """Test que verifica que dos reservas de bloque nunca se superponen"""
+        first = ticket_codes.allocate_block(100)
+        second = ticket_codes.allocate_block(100)
+        self.assertEqual(first[1] - first[0], 100)
+        self.assertLessEqual(first[1], second[0])
+
+    def test_generator_has_no_collisions(self):
+        """Test que verifica que el generador no repite códigos entre bloques"""
+        generator = ticket_codes.TicketCodeGenerator(block_size=50)
+        codes = [generator.next_code() for _ in range(20000)]
+        self.assertEqual(len(set(codes)), len(codes))
+        self.assertTrue(all(ticket_codes.is_valid(code) for code in codes[:100]))
@@ -0,0 +1,115 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from app.models import Category, Event, Ticket, TicketHold, User, Venue
+
+
+@override_settings(TICKET_HOLD_TTL=300)
+class TicketHoldTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.user = User.objects.create_user(
+            username="regular_user",
+            email="user@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.venue = Venue.objects.create(
+            name="Test Venue",
+            address="Test Address",
+            city="Test City",
+            capacity=4,
+            contact="123456789"
+        )
+
+        self.category = Category.objects.create(
+            name="Test Category",
+            description="Test Description",
+            is_active=True
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+    def test_hold_counts_against_capacity(self):
+        """Test que verifica que una retención descuenta capacidad inmediatamente"""
+        success, hold = TicketHold.new(self.event, self.user, 3, "GENERAL")
+        self.assertTrue(success)
+        self.assertTrue(hold.expires_at > timezone.now() + timedelta(seconds=290))
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_held, 3)
+        self.assertFalse(self.event.reserve_tickets(2))
+
+    def test_hold_respects_user_limit(self):
+        """Test que verifica que las retenciones activas cuentan para el límite de 4 por usuario"""
+        self.venue.capacity = 100
+        self.venue.save()
+        TicketHold.new(self.event, self.user, 3, "GENERAL")
+
+        success, errors = TicketHold.new(self.event, self.user, 2, "GENERAL")
+        self.assertFalse(success)
+        self.assertIn("quantity", errors)
+
+    def test_confirm_hold_creates_ticket(self):
+        """Test que verifica que confirmar mueve las entradas de retenidas a vendidas"""
+        _, hold = TicketHold.new(self.event, self.user, 2, "VIP")
+
+        success, ticket = hold.confirm(timezone.now().date(), "ABC123")
+        self.assertTrue(success)
+        self.assertEqual(ticket.quantity, 2)
+        self.assertEqual(ticket.type, "VIP")
+        self.assertFalse(TicketHold.objects.exists())
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_held, 0)
+        self.assertEqual(self.event.tickets_sold, 2)
+
+    def test_confirm_expired_hold_fails(self):
+        """Test que verifica que una retención vencida no se puede confirmar y libera el lugar"""
+        _, hold = TicketHold.new(self.event, self.user, 2, "GENERAL")
+        TicketHold.objects.filter(pk=hold.pk).update(expires_at=timezone.now() - timedelta(seconds=1))
+        hold.refresh_from_db()
+
+        success, errors = hold.confirm(timezone.now().date(), "ABC123")
+        self.assertFalse(success)
+        self.assertIn("hold", errors)
+        self.assertEqual(Ticket.objects.count(), 0)
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_held, 0)
+
+    def test_release_expired_in_batches(self):
+        """Test que verifica que el barrido libera solo las retenciones vencidas"""
+        self.venue.capacity = 100
+        self.venue.save()
+        other = User.objects.create_user(username="other", email="other@test.com", password="password123")
+
+        _, expired_1 = TicketHold.new(self.event, self.user, 1, "GENERAL")
+        _, expired_2 = TicketHold.new(self.event, other, 2, "GENERAL")
+        _, active = TicketHold.new(self.event, self.user, 1, "GENERAL")
+        TicketHold.objects.filter(pk__in=[expired_1.pk, expired_2.pk]).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        released = TicketHold.release_expired(batch_size=1)
+        self.assertEqual(released, 2)
+        self.assertEqual(list(TicketHold.objects.values_list("pk", flat=True)), [active.pk])
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_held, 1)
@@ -0,0 +1,124 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from app.models import Category, Event, Ticket, TicketHold, TicketPool, User, Venue
+
+
+class TicketPoolTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.users = [
+            User.objects.create_user(
+                username=f"user{i}",
+                email=f"user{i}@test.com",
+                password="password123",
+                is_organizer=False
+            )
+            for i in range(3)
+        ]
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=Category.objects.create(name="Test Category", description="Test Description"),
+            venue=Venue.objects.create(
+                name="Test Venue", address="Test Address", city="Test City", capacity=10, contact="123"
+            ),
+        )
+
+        TicketPool.configure(self.event, "VIP", "2", "500000")
+
+    def buy(self, user, quantity, type):
+        return Ticket.new(
+            buy_date=timezone.now().date(),
+            ticket_code=f"{user.username}-{type}",
+            quantity=quantity,
+            type=type,
+            event=self.event,
+            user=user,
+        )
+
+    def test_vip_sell_out_does_not_block_general(self):
+        """Test que verifica que agotar el cupo VIP no bloquea las entradas generales"""
+        self.assertTrue(self.buy(self.users[0], 2, "VIP")[0])
+
+        success, errors = self.buy(self.users[1], 1, "VIP")
+        self.assertFalse(success)
+        self.assertIn("capacity", errors)
+
+        self.assertTrue(self.buy(self.users[1], 3, "GENERAL")[0])
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 5)
+        self.assertEqual(TicketPool.objects.get(event=self.event, type="VIP").sold, 2)
+
+    def test_availability_per_type(self):
+        """Test que verifica la disponibilidad y el precio de cada tipo con una consulta"""
+        self.buy(self.users[0], 1, "VIP")
+        event = Event.objects.select_related("venue").get(pk=self.event.pk)
+
+        with self.assertNumQueries(1):
+            availability = {tier["type"]: tier for tier in event.availability()}
+
+        self.assertEqual(availability["VIP"]["available"], 1)
+        self.assertEqual(availability["VIP"]["price"], 500000)
+        self.assertEqual(availability["GENERAL"]["available"], 9)
+        self.assertEqual(availability["GENERAL"]["price"], Ticket.DEFAULT_PRICES["GENERAL"])
+
+    def test_changing_type_moves_between_pools(self):
+        """Test que verifica que cambiar el tipo de un ticket pasa las entradas de un cupo al otro"""
+        self.buy(self.users[0], 2, "GENERAL")
+        ticket = Ticket.objects.get(user=self.users[0])
+
+        success, _ = ticket.update_quantity(2, "VIP")
+        self.assertTrue(success)
+        self.assertEqual(TicketPool.objects.get(event=self.event, type="VIP").sold, 2)
+
+        success, errors = ticket.update_quantity(3, "VIP")
+        self.assertFalse(success)
+        self.assertIn("capacity", errors)
+        self.assertEqual(TicketPool.objects.get(event=self.event, type="VIP").sold, 2)
+
+        ticket.delete()
+        self.assertEqual(TicketPool.objects.get(event=self.event, type="VIP").sold, 0)
+
+    def test_deleting_user_releases_tickets(self):
+        """Test que verifica que al borrar un usuario sus entradas vuelven al evento y al cupo"""
+        self.buy(self.users[0], 2, "VIP")
+        self.buy(self.users[1], 1, "GENERAL")
+
+        self.users[0].delete()
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 1)
+        self.assertEqual(TicketPool.objects.get(event=self.event, type="VIP").sold, 0)
+
+    def test_holds_count_against_pool(self):
+        """Test que verifica que las retenciones ocupan el cupo hasta liberarse"""
+        success, hold = TicketHold.new(self.event, self.users[0], 2, "VIP")
+        self.assertTrue(success)
+
+        self.assertFalse(self.buy(self.users[1], 1, "VIP")[0])
+
+        hold.release()
+        self.assertTrue(self.buy(self.users[1], 1, "VIP")[0])
+
+    def test_configure_rejects_capacity_below_sold(self):
+        """Test que verifica que no se puede achicar un cupo por debajo de lo vendido"""
+        self.buy(self.users[0], 2, "VIP")
+
+        success, errors = TicketPool.configure(self.event, "VIP", "1", "")
+        self.assertFalse(success)
+        self.assertIn("capacity", errors)
+
+        success, _ = TicketPool.configure(self.event, "VIP", "", "")
+        self.assertTrue(success)
+        self.assertFalse(TicketPool.objects.filter(event=self.event).exists())
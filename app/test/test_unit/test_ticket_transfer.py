@@ -0,0 +1,130 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from app.models import Category, CheckIn, Event, Ticket, TicketHold, TicketTransfer, User, Venue
+
+
+class TicketTransferTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.seller = User.objects.create_user(
+            username="seller",
+            email="seller@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.buyer = User.objects.create_user(
+            username="buyer",
+            email="buyer@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.venue = Venue.objects.create(
+            name="Test Venue",
+            address="Test Address",
+            city="Test City",
+            capacity=10,
+            contact="123456789"
+        )
+
+        self.category = Category.objects.create(
+            name="Test Category",
+            description="Test Description",
+            is_active=True
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+        Ticket.new(
+            buy_date=timezone.now(),
+            ticket_code="TRANSFER1",
+            quantity=2,
+            type="GENERAL",
+            event=self.event,
+            user=self.seller,
+        )
+        self.ticket = Ticket.objects.get(ticket_code="TRANSFER1")
+
+    def test_transfer_changes_owner(self):
+        """Test que verifica que la transferencia cambia el dueño sin tocar el contador del evento"""
+        success, transfer = self.ticket.transfer(self.buyer)
+
+        self.assertTrue(success)
+        self.assertEqual(Ticket.objects.get(pk=self.ticket.pk).user, self.buyer)
+        self.assertEqual(transfer.from_user, self.seller)
+        self.assertEqual(transfer.to_user, self.buyer)
+        self.assertEqual(transfer.quantity, 2)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.tickets_sold, 2)
+
+    def test_transfer_respects_recipient_limit(self):
+        """Test que verifica que el destinatario no puede superar las 4 entradas por evento"""
+        Ticket.objects.create(
+            buy_date=timezone.now(), ticket_code="OWNED", quantity=2, type="GENERAL", event=self.event, user=self.buyer
+        )
+        TicketHold.objects.create(
+            event=self.event, user=self.buyer, quantity=1, type="GENERAL",
+            expires_at=timezone.now() + timezone.timedelta(minutes=5),
+        )
+
+        success, errors = self.ticket.transfer(self.buyer)
+
+        self.assertFalse(success)
+        self.assertIn("quantity", errors)
+        self.assertEqual(Ticket.objects.get(pk=self.ticket.pk).user, self.seller)
+        self.assertFalse(TicketTransfer.objects.exists())
+
+    def test_transfer_to_self_or_organizer_fails(self):
+        """Test que verifica que no se puede transferir al mismo dueño ni a un organizador"""
+        self.assertFalse(self.ticket.transfer(self.seller)[0])
+        self.assertFalse(self.ticket.transfer(self.organizer)[0])
+
+    def test_stale_ticket_cannot_be_transferred_twice(self):
+        """Test que verifica que una copia vieja del ticket no puede volver a transferirlo"""
+        stale = Ticket.objects.get(pk=self.ticket.pk)
+        self.ticket.transfer(self.buyer)
+
+        third = User.objects.create_user(username="third", email="third@test.com", password="password123")
+        success, errors = stale.transfer(third)
+
+        self.assertFalse(success)
+        self.assertEqual(Ticket.objects.get(pk=self.ticket.pk).user, self.buyer)
+
+    def test_checked_in_ticket_cannot_be_transferred(self):
+        """Test que verifica que un ticket que ya ingresó no se puede transferir"""
+        CheckIn.objects.create(ticket=self.ticket, admitted_at=timezone.now())
+
+        success, errors = self.ticket.transfer(self.buyer)
+
+        self.assertFalse(success)
+        self.assertIn("checkin", errors)
+
+    def test_chain_survives_ticket_deletion(self):
+        """Test que verifica que la cadena de transferencias se conserva al borrar el ticket"""
+        third = User.objects.create_user(username="third", email="third@test.com", password="password123")
+        self.ticket.transfer(self.buyer)
+        self.ticket.transfer(third)
+        self.ticket.delete()
+
+        chain = TicketTransfer.chain("TRANSFER1")
+
+        self.assertEqual(
+            [(transfer.from_user, transfer.to_user) for transfer in chain],
+            [(self.seller, self.buyer), (self.buyer, third)],
+        )
+        self.assertIsNone(chain[0].ticket)
@@ -0,0 +1,142 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from app.models import Category, Event, Rating, UpcomingEvent, User, Venue
+
+
+class UpcomingEventTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+        self.user = User.objects.create_user(
+            username="user",
+            email="user@test.com",
+            password="password123"
+        )
+        self.venue = Venue.objects.create(
+            name="Estadio", address="Test Address", city="Córdoba", capacity=100, contact="123456789"
+        )
+        self.category = Category.objects.create(name="Música", description="Conciertos")
+        self.event = self.create_event(days=10)
+
+    def create_event(self, days):
+        return Event.objects.create(
+            title="Concierto",
+            description="Descripción",
+            scheduled_at=timezone.now() + timezone.timedelta(days=days),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+    def projected(self, event=None):
+        return UpcomingEvent.objects.get(event=event or self.event)
+
+    def test_saved_event_is_projected(self):
+        """Test que verifica que al crear y editar un evento se proyectan sus datos"""
+        row = self.projected()
+        self.assertEqual(row.id, self.event.id)
+        self.assertEqual(row.category_name, "Música")
+        self.assertEqual(row.venue_city, "Córdoba")
+        self.assertEqual(row.organizer_username, "organizer")
+        self.assertEqual(row.remaining_capacity, 100)
+        self.assertIsNone(row.average_rating)
+
+        self.event.title = "Concierto reprogramado"
+        self.event.save()
+        self.assertEqual(self.projected().title, "Concierto reprogramado")
+
+    def test_refresh_upserts_in_one_transaction(self):
+        """Test que verifica que refresh actualiza la fila existente en lugar de borrarla e insertarla"""
+        UpcomingEvent.objects.filter(event=self.event).update(title="Desactualizado")
+        past = self.create_event(days=1)
+        Event.objects.filter(pk=past.pk).update(scheduled_at=timezone.now() - timezone.timedelta(days=1))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(UpcomingEvent.refresh([self.event.pk, past.pk]), 1)
+
+        sql = [query["sql"] for query in queries]
+        self.assertTrue(any("ON CONFLICT" in query for query in sql))
+        # La lectura de los eventos va después del SAVEPOINT, dentro de la transacción
+        self.assertTrue(sql[0].startswith("SAVEPOINT"))
+        self.assertEqual(self.projected().title, "Concierto")
+        self.assertFalse(UpcomingEvent.objects.filter(event=past).exists())
+
+    def test_past_and_deleted_events_are_removed(self):
+        """Test que verifica que los eventos pasados o borrados salen de la proyección"""
+        self.event.scheduled_at = timezone.now() - timezone.timedelta(days=1)
+        self.event.save()
+        self.assertFalse(UpcomingEvent.objects.exists())
+
+        other = self.create_event(days=5)
+        other.delete()
+        self.assertFalse(UpcomingEvent.objects.exists())
+
+    def test_related_changes_are_projected(self):
+        """Test que verifica que renombrar la ubicación, la categoría o el organizador se proyecta"""
+        self.venue.name = "Club"
+        self.venue.capacity = 50
+        self.venue.save()
+        self.category.name = "Rock"
+        self.category.save()
+        self.organizer.username = "productora"
+        self.organizer.save()
+
+        row = self.projected()
+        self.assertEqual(row.venue_name, "Club")
+        self.assertEqual(row.remaining_capacity, 50)
+        self.assertEqual(row.category_name, "Rock")
+        self.assertEqual(row.organizer_username, "productora")
+
+    def test_login_does_not_reproject(self):
+        """Test que verifica que guardar solo last_login no vuelve a proyectar los eventos del organizador"""
+        User.objects.filter(pk=self.organizer.pk).update(username="otro")
+        self.organizer.last_login = timezone.now()
+        self.organizer.save(update_fields=["last_login"])
+
+        self.assertEqual(self.projected().organizer_username, "organizer")
+
+    def test_ratings_are_projected(self):
+        """Test que verifica que el promedio de calificaciones se actualiza"""
+        Rating.objects.create(event=self.event, user=self.user, title="Bueno", text="Texto", rating=4)
+        Rating.objects.create(event=self.event, user=self.organizer, title="Malo", text="Texto", rating=1)
+        self.assertEqual(self.projected().average_rating, 2.5)
+
+        Rating.objects.filter(user=self.organizer).get().delete()
+        self.assertEqual(self.projected().average_rating, 4)
+
+    def test_capacity_is_projected_on_commit(self):
+        """Test que verifica que la capacidad restante se actualiza al confirmar la venta"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(self.event.reserve_tickets(3))
+            self.assertTrue(self.event.hold_tickets(2))
+
+        self.assertEqual(self.projected().remaining_capacity, 95)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.release_tickets(3)
+            Event.release_held_tickets(self.event.pk, 2)
+
+        self.assertEqual(self.projected().remaining_capacity, 100)
+
+    def test_compact(self):
+        """Test que verifica que la compactación quita los pasados y corrige los cambios hechos con update()"""
+        past = self.create_event(days=1)
+        Event.objects.filter(pk=past.pk).update(scheduled_at=timezone.now() - timezone.timedelta(days=1))
+        Event.objects.filter(pk=self.event.pk).update(title="Cambiado sin señales")
+        UpcomingEvent.objects.filter(event=past).update(scheduled_at=timezone.now() - timezone.timedelta(days=1))
+
+        out = StringIO()
+        call_command("compact_upcoming_events", stdout=out)
+
+        self.assertIn("1 eventos pasados quitados, 1 eventos proyectados", out.getvalue())
+        self.assertEqual(list(UpcomingEvent.objects.values_list("title", flat=True)), ["Cambiado sin señales"])
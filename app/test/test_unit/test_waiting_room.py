@@ -0,0 +1,90 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from app import waiting_room
+from app.models import Category, Event, User, Venue, WaitingRoom
+
+
+class WaitingRoomStoreTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.users = [
+            User.objects.create_user(username=f"user{i}", email=f"user{i}@test.com", password="password123")
+            for i in range(4)
+        ]
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=Category.objects.create(name="Test Category", description="Test Description"),
+            venue=Venue.objects.create(
+                name="Test Venue", address="Test Address", city="Test City", capacity=100, contact="123"
+            ),
+        )
+        self.now = timezone.now()
+
+    def advance(self, seconds):
+        self.now += timedelta(seconds=seconds)
+
+    def check_store(self, store):
+        with patch("app.waiting_room.timezone.now", side_effect=lambda: self.now):
+            statuses = [store.join(self.event.pk, user.pk) for user in self.users]
+
+            self.assertEqual([s["admitted"] for s in statuses], [True, True, False, False])
+            self.assertEqual(store.status(self.event.pk, self.users[3].pk)["position"], 2)
+
+            # Volver a entrar no cambia el lugar en la fila
+            self.assertEqual(store.join(self.event.pk, self.users[3].pk)["position"], 2)
+
+            self.advance(1)
+            self.assertTrue(store.status(self.event.pk, self.users[2].pk)["admitted"])
+            self.assertEqual(store.status(self.event.pk, self.users[3].pk)["position"], 1)
+
+            self.advance(1)
+            self.assertTrue(store.status(self.event.pk, self.users[3].pk)["admitted"])
+
+            self.assertFalse(store.status(self.event.pk, self.organizer.pk)["joined"])
+
+    def test_memory_store_admits_at_rate(self):
+        """Test que verifica que el store en memoria admite según el token bucket"""
+        self.check_store(waiting_room.MemoryQueueStore(rate=1, burst=2))
+
+    def test_database_store_admits_at_rate(self):
+        """Test que verifica que el store en base de datos admite según el token bucket"""
+        self.check_store(waiting_room.DatabaseQueueStore(rate=1, burst=2))
+        self.assertEqual(WaitingRoom.objects.get(event=self.event).last_number, 4)
+
+    def test_refill_caps_tokens_at_burst(self):
+        """Test que verifica que las fichas no se acumulan por encima del burst"""
+        room = waiting_room.MemoryQueueStore.Room(self.now, burst=2)
+        room.last_number = 10
+
+        self.assertEqual(waiting_room.refill(room, self.now + timedelta(hours=1), rate=1, burst=2), 2)
+        self.assertEqual(room.admitted_until, 2)
+
+    def test_database_store_status_locks_only_to_admit(self):
+        """Test que verifica que un poll sin números para admitir es solo lectura"""
+        store = waiting_room.DatabaseQueueStore(rate=1, burst=2)
+        with patch("app.waiting_room.timezone.now", side_effect=lambda: self.now):
+            for user in self.users:
+                store.join(self.event.pk, user.pk)
+
+            # Sin fichas nuevas: el número y la sala, sin transacción ni escritura
+            with self.assertNumQueries(2):
+                self.assertEqual(store.status(self.event.pk, self.users[3].pk)["position"], 2)
+
+            self.advance(1)
+            with self.assertNumQueries(6):
+                self.assertEqual(store.status(self.event.pk, self.users[3].pk)["position"], 1)
+            self.assertEqual(WaitingRoom.objects.get(event=self.event).admitted_until, 3)
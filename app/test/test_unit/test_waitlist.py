@@ -0,0 +1,200 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from app.models import (
+    Category,
+    Event,
+    Notification,
+    Ticket,
+    TicketHold,
+    TicketPool,
+    User,
+    Venue,
+    WaitlistEntry,
+)
+
+
+@override_settings(WAITLIST_OFFER_TTL=600)
+class WaitlistEntryTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer",
+            email="organizer@test.com",
+            password="password123",
+            is_organizer=True
+        )
+
+        self.buyer = User.objects.create_user(
+            username="buyer",
+            email="buyer@test.com",
+            password="password123",
+            is_organizer=False
+        )
+
+        self.users = [
+            User.objects.create_user(
+                username=f"waiting_{i}",
+                email=f"waiting_{i}@test.com",
+                password="password123",
+                is_organizer=False
+            )
+            for i in range(3)
+        ]
+
+        self.venue = Venue.objects.create(
+            name="Test Venue",
+            address="Test Address",
+            city="Test City",
+            capacity=4,
+            contact="123456789"
+        )
+
+        self.category = Category.objects.create(
+            name="Test Category",
+            description="Test Description",
+            is_active=True
+        )
+
+        self.event = Event.objects.create(
+            title="Test Event",
+            description="Test Description",
+            scheduled_at=timezone.now() + timezone.timedelta(days=10),
+            organizer=self.organizer,
+            category=self.category,
+            venue=self.venue
+        )
+
+        success, _ = Ticket.new(
+            buy_date=timezone.now(),
+            ticket_code="SOLDOUT",
+            quantity=4,
+            type="GENERAL",
+            event=self.event,
+            user=self.buyer,
+        )
+        self.assertTrue(success)
+        self.ticket = Ticket.objects.get(ticket_code="SOLDOUT")
+
+    def test_join_and_position(self):
+        """Test que verifica que las posiciones siguen el orden de llegada"""
+        entries = [WaitlistEntry.new(self.event, user, 1, "GENERAL")[1] for user in self.users]
+
+        self.assertEqual([entry.position() for entry in entries], [1, 2, 3])
+
+    def test_join_twice_fails(self):
+        """Test que verifica que un usuario no puede estar dos veces en la lista de un evento"""
+        WaitlistEntry.new(self.event, self.users[0], 1, "GENERAL")
+        success, errors = WaitlistEntry.new(self.event, self.users[0], 2, "GENERAL")
+
+        self.assertFalse(success)
+        self.assertIn("waitlist", errors)
+
+    def test_join_with_invalid_quantity(self):
+        """Test que verifica la validación de la cantidad"""
+        success, errors = WaitlistEntry.new(self.event, self.users[0], 5, "GENERAL")
+
+        self.assertFalse(success)
+        self.assertIn("quantity", errors)
+
+    def test_promote_offers_in_order(self):
+        """Test que verifica que las entradas liberadas se ofrecen por orden de llegada"""
+        for user, quantity in zip(self.users, [3, 1, 1]):
+            WaitlistEntry.new(self.event, user, quantity, "GENERAL")
+
+        self.ticket.delete()
+        offered = WaitlistEntry.promote(self.event.pk, batch_size=2)
+
+        # 3 + 1 ocupan la capacidad; el tercero sigue esperando
+        self.assertEqual(offered, 2)
+        holds = TicketHold.objects.filter(event=self.event).order_by("user__username")
+        self.assertEqual(
+            [(hold.user, hold.quantity) for hold in holds],
+            [(self.users[0], 3), (self.users[1], 1)],
+        )
+        self.assertTrue(holds[0].expires_at > timezone.now() + timezone.timedelta(seconds=590))
+        waiting = WaitlistEntry.objects.get(offered_at__isnull=True)
+        self.assertEqual(waiting.user, self.users[2])
+        self.assertEqual(waiting.position(), 1)
+
+    def test_promote_does_not_skip_the_head_of_the_line(self):
+        """Test que verifica que un pedido grande que no entra no es salteado por los de atrás"""
+        WaitlistEntry.new(self.event, self.users[0], 3, "GENERAL")
+        WaitlistEntry.new(self.event, self.users[1], 1, "GENERAL")
+        self.ticket.update_quantity(2, "GENERAL")
+
+        offered = WaitlistEntry.promote(self.event.pk)
+
+        self.assertEqual(offered, 0)
+        self.assertFalse(TicketHold.objects.exists())
+
+    def waitlist_queries(self, queries):
+        return [query for query in queries if 'FROM "app_waitlistentry"' in query["sql"]]
+
+    def test_promote_stops_when_the_event_is_full(self):
+        """Test que verifica que sin capacidad en el evento no se recorre el resto de la lista"""
+        users = User.objects.bulk_create(User(username=f"fila_{i}", email=f"fila_{i}@test.com") for i in range(120))
+        WaitlistEntry.new(self.event, self.users[0], 3, "GENERAL")
+        WaitlistEntry.objects.bulk_create(
+            WaitlistEntry(event=self.event, user=user, quantity=1, type="GENERAL") for user in users
+        )
+        self.ticket.update_quantity(2, "GENERAL")
+
+        with CaptureQueriesContext(connection) as queries:
+            offered = WaitlistEntry.promote(self.event.pk, batch_size=50)
+
+        self.assertEqual(offered, 0)
+        self.assertEqual(len(self.waitlist_queries(queries)), 1)
+
+    def test_promote_skips_blocked_types_in_the_query(self):
+        """Test que verifica que un tipo sin cupo no se sigue leyendo y los demás tipos se ofrecen"""
+        TicketPool.objects.create(event=self.event, type="VIP", capacity=0)
+        users = User.objects.bulk_create(User(username=f"vip_{i}", email=f"vip_{i}@test.com") for i in range(60))
+        WaitlistEntry.objects.bulk_create(
+            WaitlistEntry(event=self.event, user=user, quantity=1, type="VIP") for user in users
+        )
+        WaitlistEntry.new(self.event, self.users[0], 1, "GENERAL")
+        self.ticket.delete()
+
+        with CaptureQueriesContext(connection) as queries:
+            offered = WaitlistEntry.promote(self.event.pk, batch_size=50)
+
+        self.assertEqual(offered, 1)
+        self.assertTrue(TicketHold.objects.filter(user=self.users[0]).exists())
+        # El primer lote trae VIP; los siguientes los excluyen: la GENERAL y después ninguno
+        self.assertEqual(len(self.waitlist_queries(queries)), 3)
+
+    def test_offer_notifies_user(self):
+        """Test que verifica que la oferta crea una notificación de prioridad alta"""
+        _, entry = WaitlistEntry.new(self.event, self.users[0], 2, "GENERAL")
+        self.ticket.delete()
+
+        WaitlistEntry.promote(self.event.pk)
+
+        entry.refresh_from_db()
+        self.assertIsNotNone(entry.offered_at)
+        self.assertEqual(entry.hold.quantity, 2)
+        notification = Notification.objects.get(users=self.users[0])
+        self.assertEqual(notification.priority, Notification.Priority.HIGH)
+        self.assertEqual(notification.event, self.event)
+
+    def test_promote_drops_entries_over_the_user_limit(self):
+        """Test que verifica que se descartan los pedidos que ya no respetan el límite por usuario"""
+        Venue.objects.filter(pk=self.venue.pk).update(capacity=8)
+        WaitlistEntry.new(self.event, self.buyer, 1, "GENERAL")
+        WaitlistEntry.new(self.event, self.users[0], 1, "GENERAL")
+
+        offered = WaitlistEntry.promote(self.event.pk)
+
+        self.assertEqual(offered, 1)
+        self.assertFalse(WaitlistEntry.objects.filter(user=self.buyer).exists())
+        self.assertTrue(TicketHold.objects.filter(user=self.users[0]).exists())
+
+    def test_promote_past_event(self):
+        """Test que verifica que no se ofrecen entradas de eventos que ya ocurrieron"""
+        WaitlistEntry.new(self.event, self.users[0], 1, "GENERAL")
+        self.ticket.delete()
+        Event.objects.filter(pk=self.event.pk).update(scheduled_at=timezone.now() - timezone.timedelta(days=1))
+
+        self.assertEqual(WaitlistEntry.promote(self.event.pk), 0)
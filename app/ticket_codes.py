@@ -0,0 +1,141 @@
+"""
+Generador de códigos de ticket sin colisiones.
+
+Cada código sale de un número de secuencia único. Los números se reservan de a bloques
+en la tabla TicketCodeSequence (una escritura cada `block_size` códigos) y se mezclan con
+una permutación biyectiva de 40 bits, así los códigos consecutivos no son adivinables
+pero dos números distintos nunca dan el mismo código.
+
+Formato: 8 caracteres en base32 de Crockford + 1 dígito verificador (Luhn mod 32).
+Los códigos viejos (8 caracteres hexadecimales) nunca coinciden porque tienen otro largo.
+"""
+
+import threading
+
+from django.db import transaction
+from django.db.models import F
+
+from .models import TicketCodeSequence
+
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+ALPHABET_INDEX = {char: i for i, char in enumerate(ALPHABET)}
+# Equivalencias de Crockford para lo que se tipea a mano en la puerta
+ALIASES = str.maketrans({"O": "0", "I": "1", "L": "1", "-": None, " ": None})
+
+PAYLOAD_LENGTH = 8
+CODE_LENGTH = PAYLOAD_LENGTH + 1
+BITS = 5 * PAYLOAD_LENGTH
+MASK = (1 << BITS) - 1
+MAX_SEQUENCE = MASK
+
+_MULTIPLIER_A = 0x9E3779B97F & MASK | 1
+_MULTIPLIER_B = 0xC2B2AE3D27 & MASK | 1
+_INVERSE_A = pow(_MULTIPLIER_A, -1, 1 << BITS)
+_INVERSE_B = pow(_MULTIPLIER_B, -1, 1 << BITS)
+_SHIFT = BITS // 2
+
+
+def scramble(number):
+    """Permutación biyectiva de los enteros de 40 bits."""
+    number = (number * _MULTIPLIER_A) & MASK
+    number ^= number >> _SHIFT
+    number = (number * _MULTIPLIER_B) & MASK
+    number ^= number >> _SHIFT
+    return number
+
+
+def unscramble(number):
+    """Inversa de scramble."""
+    number ^= number >> _SHIFT
+    number = (number * _INVERSE_B) & MASK
+    number ^= number >> _SHIFT
+    number = (number * _INVERSE_A) & MASK
+    return number
+
+
+def check_symbol(payload):
+    """Dígito verificador Luhn mod 32: detecta cualquier carácter cambiado y la mayoría de las transposiciones."""
+    total = 0
+    factor = 2
+    for char in reversed(payload):
+        addend = factor * ALPHABET_INDEX[char]
+        total += addend // 32 + addend % 32
+        factor = 3 - factor
+    return ALPHABET[-total % 32]
+
+
+def encode(number):
+    if not 0 <= number <= MAX_SEQUENCE:
+        raise ValueError("Número de secuencia fuera de rango")
+
+    value = scramble(number)
+    chars = []
+    for _ in range(PAYLOAD_LENGTH):
+        value, digit = divmod(value, 32)
+        chars.append(ALPHABET[digit])
+    payload = "".join(reversed(chars))
+    return payload + check_symbol(payload)
+
+
+def decode(code):
+    """Retorna el número de secuencia de un código válido, o None si el código no es válido."""
+    code = normalize(code)
+    if not is_valid(code):
+        return None
+
+    value = 0
+    for char in code[:PAYLOAD_LENGTH]:
+        value = value * 32 + ALPHABET_INDEX[char]
+    return unscramble(value)
+
+
+def normalize(code):
+    return (code or "").upper().translate(ALIASES)
+
+
+def is_valid(code):
+    """Validación sin base de datos, pensada para los lectores de la puerta."""
+    code = normalize(code)
+    if len(code) != CODE_LENGTH or any(char not in ALPHABET_INDEX for char in code):
+        return False
+    return check_symbol(code[:PAYLOAD_LENGTH]) == code[PAYLOAD_LENGTH]
+
+
+def allocate_block(size, name="ticket"):
+    """
+    Reserva `size` números de secuencia consecutivos. El UPDATE bloquea la fila hasta el
+    commit, así que dos procesos nunca reciben el mismo bloque. Debe llamarse fuera de otra
+    transacción: si la transacción externa hace rollback el bloque se volvería a entregar.
+    """
+    with transaction.atomic():
+        TicketCodeSequence.objects.get_or_create(name=name)
+        TicketCodeSequence.objects.filter(name=name).update(next_value=F("next_value") + size)
+        end = TicketCodeSequence.objects.filter(name=name).values_list("next_value", flat=True).get()
+
+    if end - 1 > MAX_SEQUENCE:
+        raise OverflowError("Se agotaron los códigos de ticket disponibles")
+    return end - size, end
+
+
+class TicketCodeGenerator:
+    def __init__(self, block_size=1000, allocator=allocate_block):
+        self.block_size = block_size
+        self.allocator = allocator
+        self.next_number = 0
+        self.block_end = 0
+        self.lock = threading.Lock()
+
+    def next_code(self):
+        with self.lock:
+            if self.next_number >= self.block_end:
+                self.next_number, self.block_end = self.allocator(self.block_size)
+            number = self.next_number
+            self.next_number += 1
+        return encode(number)
+
+
+_generator = TicketCodeGenerator()
+
+
+def next_code():
+    return _generator.next_code()
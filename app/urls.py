@@ -9,15 +9,38 @@ urlpatterns = [
     path("accounts/logout/", LogoutView.as_view(), name="logout"),
     path("accounts/login/", views.login_view, name="login"),
     path("events/", views.events, name="events"),
+    path("events/json/", views.events_json, name="events_json"),
+    path("api/v1/events/", views.api_events, name="api_events"),
+    path("api/v1/events/<int:id>/", views.api_event_detail, name="api_event_detail"),
+    path("calendar/<str:token>/tickets.ics", views.calendar_tickets, name="calendar_tickets"),
+    path("calendar/<str:token>/organizer.ics", views.calendar_organizer, name="calendar_organizer"),
+    path("calendar/<str:token>/categories/<int:category_id>.ics", views.calendar_category, name="calendar_category"),
     path("events/create/", views.event_form, name="event_form"),
     path("events/<int:id>/edit/", views.event_form, name="event_edit"),
     path("events/<int:id>/", views.event_detail, name="event_detail"),
     path("events/<int:id>/delete/", views.event_delete, name="event_delete"),
     path("events/<int:id>/users/", views.events_users, name="events_users"),
+    path("events/export.<str:fmt>", views.events_export, name="events_export"),
+    path("events/<int:event_id>/export/<str:kind>.<str:fmt>", views.event_export, name="event_export"),
+    path("events/<int:id>/pools/", views.event_pools, name="event_pools"),
     path('events/<int:event_id>/purchase/', views.purchase_ticket, name='purchase_ticket'),
+    path('events/<int:event_id>/gate/open/', views.gate_open, name='gate_open'),
+    path('events/<int:event_id>/gate/close/', views.gate_close, name='gate_close'),
+    path('events/<int:event_id>/gate/status/', views.gate_status, name='gate_status'),
+    path('events/<int:event_id>/checkin/', views.checkin_scan, name='checkin_scan'),
+    path('events/<int:event_id>/gate/snapshot/', views.gate_snapshot_export, name='gate_snapshot'),
+    path('events/<int:event_id>/gate/sync/', views.gate_sync, name='gate_sync'),
+    path('tickets/batch/', views.purchase_tickets_batch, name='purchase_tickets_batch'),
+    path('events/<int:event_id>/queue/', views.queue_status, name='queue_status'),
+    path('events/<int:event_id>/hold/', views.hold_tickets, name='hold_tickets'),
+    path('holds/<int:hold_id>/release/', views.release_hold, name='release_hold'),
+    path('events/<int:event_id>/waitlist/', views.join_waitlist, name='join_waitlist'),
+    path('waitlist/<int:entry_id>/leave/', views.leave_waitlist, name='leave_waitlist'),
     path('events/<int:event_id>/check_ticket_limit/', views.check_ticket_limit, name='check_ticket_limit'),
+    path('events/<int:event_id>/allowance/', views.ticket_allowance, name='ticket_allowance'),
     path('events/<int:event_id>/viewTickets/', views.view_ticket, name='view_ticket'),
     path('events/<int:event_id>/edit_ticket/<int:ticket_id>/', views.edit_ticket, name='edit_ticket'),
+    path('events/<int:event_id>/tickets/<int:ticket_id>/transfer/', views.transfer_ticket, name='transfer_ticket'),
     path('events/<int:event_id>/tickets/<int:ticket_id>/check_limit/', views.check_ticket_limit_for_edit, name='check_ticket_limit_for_edit'),
     path("events/<int:event_id>/rating/add/", views.add_rating, name="add_rating"),
     path("events/<int:event_id>/rating/edit/", views.edit_rating, name="edit_rating"),
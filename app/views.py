@@ -1,17 +1,44 @@
-import uuid
+import hashlib
+import json
 from datetime import datetime, timedelta
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import authenticate, login
 from django.contrib.auth.decorators import login_required
-from django.db import models
-from django.db.models import Count
+from django.db import transaction
+from django.db.models import Count, Exists, F, Max, OuterRef, Q
 from django.db.models.deletion import ProtectedError
-from django.http import JsonResponse
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseNotModified,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
+from django.urls import reverse
 from django.utils import timezone
-
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags, quote_etag
+
+from . import (
+    api,
+    checkin,
+    exports,
+    facets,
+    fragment_cache,
+    gate_snapshot,
+    geo,
+    ical,
+    pagination,
+    search,
+    ticket_codes,
+    waiting_room,
+)
 from .forms import RatingForm
+from .idempotency import idempotent, not_stored
 from .models import (
     Category,
     Comment,
@@ -20,9 +47,20 @@ from .models import (
     Rating,
     RefoundRequest,
     Ticket,
+    TicketHold,
+    TicketPool,
+    UpcomingEvent,
     User,
     Venue,
+    WaitlistEntry,
 )
+from .query_budget import query_budget
+
+# Máximo de órdenes aceptadas por purchase_tickets_batch
+BATCH_MAX_ORDERS = 1000
+
+# Máximo de eventos por página en events_json
+EVENTS_JSON_MAX_LIMIT = 100
 
 
 def register(request):
@@ -73,50 +111,244 @@ def login_view(request):
 def home(request):
     return render(request, "home.html")
 
-@login_required
-def events(request):
+def unfaceted_events(request, events=None):
+    """
+    Eventos visibles para el usuario con el filtro de fecha, sin los filtros de categoría,
+    ubicación y mes (ver app/facets.py). Con `lat`, `lng` y `km` solo quedan los eventos a
+    menos de `km` kilómetros del punto (ver app/geo.py). Retorna (queryset sin ordenar, filtros pedidos).
+    La búsqueda por palabras (`q`) no se aplica acá: va por app/search.py.
+    `events` reemplaza al queryset de Event, por ejemplo por UpcomingEvent.objects.
+    """
+    search_query = request.GET.get('q', '').strip()
     date_filter = request.GET.get('date')
     category_filter = request.GET.get('category')
     venue_filter = request.GET.get('venue')
+    month_filter = request.GET.get('month')
+    near_filter = geo.parse_point(request.GET.get('lat'), request.GET.get('lng'), request.GET.get('km'))
+
+    if events is None:
+        # El listado muestra la categoría, la ubicación y el organizador de cada evento
+        events = Event.objects.select_related('category', 'venue', 'organizer')
 
     if request.user.is_organizer:
-        events = Event.objects.filter(organizer=request.user)
+        events = events.filter(organizer=request.user)
     else:
         # time_now = datetime.now() - timedelta(hours=3)
         current_time_aware = timezone.now() - timedelta(hours=3)
-        events = Event.objects.filter(scheduled_at__gte=current_time_aware)
+        events = events.filter(scheduled_at__gte=current_time_aware)
     
     if date_filter:
         try:
             date_filter = datetime.strptime(date_filter, '%Y-%m-%d').date()
-            events = events.filter(scheduled_at_date_gte=date_filter)
+            # Comparación contra el inicio del día para que se use el índice de scheduled_at
+            day_start = timezone.make_aware(datetime.combine(date_filter, datetime.min.time()))
+            events = events.filter(scheduled_at__gte=day_start)
         except ValueError:
             pass
-    
-    if category_filter:
-        events = events.filter(category_id=category_filter)
-    
-    if venue_filter:
-        events = events.filter(venue_id=venue_filter)
-    
-    events = events.order_by("scheduled_at")
-    
-    categories = Category.objects.filter(is_active=True)
-    venues = Venue.objects.all().order_by('name')
+
+    if near_filter:
+        events = geo.near(events, *near_filter)
+
+    return events, {
+        "q": search_query,
+        "date": date_filter,
+        "category": category_filter,
+        "venue": venue_filter,
+        "month": month_filter,
+        "near": near_filter,
+    }
+
+def filtered_events(request):
+    """Como unfaceted_events, con los filtros de categoría, ubicación y mes aplicados."""
+    events, filters = unfaceted_events(request)
+    return facets.apply(events, filters), filters
+
+@login_required
+@query_budget(8)
+def events(request):
+    # Calendario para suscribirse desde otras aplicaciones: las entradas del asistente o los
+    # eventos del organizador
+    calendar_view = "calendar_organizer" if request.user.is_organizer else "calendar_tickets"
+    calendar_url = request.build_absolute_uri(reverse(calendar_view, kwargs={"token": ical.feed_token(request.user)}))
+
+    if request.user.is_organizer:
+        # El listado del organizador es solo suyo y lleva formularios con el token CSRF
+        listing = render_events_listing(request)
+    else:
+        listing = fragment_cache.get_or_render("events", request.GET, lambda: render_events_listing(request))
 
     return render(
         request,
         "app/events.html",
         {
-            "events": events, 
+            "listing": listing,
             "user_is_organizer": request.user.is_organizer,
-            "selected_date": date_filter if date_filter else '',
-            "selected_category": category_filter,
-            "selected_venue": venue_filter,
+            "calendar_url": calendar_url,
+        },
+    )
+
+def render_events_listing(request):
+    """HTML de los filtros, la tabla y la paginación del listado de eventos."""
+    if request.user.is_organizer:
+        source = Event.objects.annotate(
+            category_name=F('category__name'),
+            venue_name=F('venue__name'),
+            organizer_username=F('organizer__username'),
+        )
+    else:
+        # Los asistentes solo ven eventos próximos: se leen de la proyección, sin joins
+        source = UpcomingEvent.objects.all()
+    unfaceted, filters = unfaceted_events(request, source)
+    if filters["q"]:
+        unfaceted = search.matching(filters["q"], unfaceted)
+    events = facets.apply(unfaceted, filters)
+
+    cursor = request.GET.get('cursor')
+    if filters["q"]:
+        # Los resultados de una búsqueda van por relevancia, hasta EVENT_SEARCH_LIMIT
+        cursor = None
+        events, next_cursor = search.search(filters["q"], events), None
+    else:
+        try:
+            events, next_cursor = pagination.paginate(events, cursor, settings.EVENTS_PAGE_SIZE)
+        except pagination.InvalidCursor:
+            cursor = None
+            events, next_cursor = pagination.paginate(events, None, settings.EVENTS_PAGE_SIZE)
+
+    next_query = None
+    if next_cursor:
+        query = request.GET.copy()
+        query['cursor'] = next_cursor
+        next_query = query.urlencode()
+
+    first_query = None
+    if cursor:
+        query = request.GET.copy()
+        query.pop('cursor')
+        first_query = query.urlencode()
+    
+    # Solo se ofrecen las opciones con eventos (y la elegida, aunque ya no tenga)
+    counts = facets.counts(unfaceted, filters)
+    categories = [
+        category
+        for category in Category.objects.filter(is_active=True)
+        if counts["category"][category.id] or filters["category"] == str(category.id)
+    ]
+    for category in categories:
+        category.event_count = counts["category"][category.id]
+    venues = [
+        venue
+        for venue in Venue.objects.all().order_by('name')
+        if counts["venue"][venue.id] or filters["venue"] == str(venue.id)
+    ]
+    for venue in venues:
+        venue.event_count = counts["venue"][venue.id]
+    selected_month = facets.parse_month(filters["month"])
+    months = sorted(counts["month"].keys() | ({selected_month} - {None}))
+    months = [{"date": month, "event_count": counts["month"][month]} for month in months]
+
+    return render_to_string(
+        "app/events_listing.html",
+        {
+            "events": events,
+            "user_is_organizer": request.user.is_organizer,
+            "search_query": filters["q"],
+            "selected_date": filters["date"] if filters["date"] else '',
+            "selected_category": filters["category"],
+            "selected_venue": filters["venue"],
+            "selected_month": selected_month,
+            "near": filters["near"],
+            "radius_choices": geo.RADIUS_CHOICES,
             "categories": categories,
-            "venues": venues
+            "venues": venues,
+            "months": months,
+            "next_query": next_query,
+            "first_query": first_query,
         },
+        request=request,
     )
+
+@login_required
+@query_budget(5)
+def events_json(request):
+    """
+    Listado de eventos paginado por cursor, con los mismos filtros que la vista `events`.
+    Parámetros: `cursor` (el `next_cursor` de la página anterior) y `limit`. Con `q` se
+    devuelven los `limit` resultados más relevantes de la búsqueda, sin cursor.
+    """
+    events, filters = filtered_events(request)
+
+    try:
+        limit = min(max(int(request.GET.get('limit', settings.EVENTS_PAGE_SIZE)), 1), EVENTS_JSON_MAX_LIMIT)
+    except ValueError:
+        return JsonResponse({'success': False, 'error': 'El límite debe ser un número válido'}, status=400)
+
+    if filters["q"]:
+        events, next_cursor = search.search(filters["q"], events, limit), None
+    else:
+        try:
+            events, next_cursor = pagination.paginate(events, request.GET.get('cursor'), limit)
+        except pagination.InvalidCursor as error:
+            return JsonResponse({'success': False, 'error': str(error)}, status=400)
+
+    return JsonResponse({
+        'success': True,
+        'events': [
+            {
+                'id': event.pk,
+                'title': event.title,
+                'scheduled_at': event.scheduled_at.isoformat(),
+                'category': event.category.name,
+                'venue': event.venue.name,
+                'organizer': event.organizer.username,
+                'url': reverse('event_detail', kwargs={'id': event.pk}),
+            }
+            for event in events
+        ],
+        'next_cursor': next_cursor,
+    })
+
+@login_required
+@query_budget(4)
+def api_events(request):
+    """
+    API v1: listado de eventos con los mismos filtros y la misma paginación por cursor que
+    events_json, con ETag (ver app/api.py).
+    """
+    events, filters = filtered_events(request)
+
+    try:
+        limit = min(max(int(request.GET.get('limit', settings.EVENTS_PAGE_SIZE)), 1), EVENTS_JSON_MAX_LIMIT)
+    except ValueError:
+        return JsonResponse({'success': False, 'error': 'El límite debe ser un número válido'}, status=400)
+
+    if filters["q"]:
+        rows, next_cursor = search.search_values(filters["q"], events, api.LIST_FIELDS, limit), None
+    else:
+        try:
+            rows, next_cursor = pagination.paginate(events.values(*api.LIST_FIELDS), request.GET.get('cursor'), limit)
+        except pagination.InvalidCursor as error:
+            return JsonResponse({'success': False, 'error': str(error)}, status=400)
+
+    return api.conditional_json(request, api.etag(rows, 'list', next_cursor), lambda: {
+        'success': True,
+        'events': [api.event_summary(row) for row in rows],
+        'next_cursor': next_cursor,
+    })
+
+@login_required
+@query_budget(3)
+def api_event_detail(request, id):
+    """API v1: detalle de un evento, con ETag (ver app/api.py)."""
+    row = Event.objects.filter(pk=id).values(*api.DETAIL_FIELDS).first()
+    if row is None:
+        return JsonResponse({'success': False, 'error': 'Evento no encontrado'}, status=404)
+
+    return api.conditional_json(request, api.etag([row], 'detail'), lambda: {
+        'success': True,
+        'event': api.event_detail(row),
+    })
+
 @login_required
 def event_detail(request, id):
     event = get_object_or_404(Event, id=id)
@@ -333,6 +565,56 @@ def event_form(request, id=None):
         },
     )
 
+@login_required
+def event_pools(request, id):
+    """
+    Cupo y precio por tipo de entrada. Un tipo sin cupo ni precio comparte la capacidad
+    del venue y usa el precio por defecto.
+    """
+    event = get_object_or_404(Event.objects.select_related("venue"), pk=id)
+    if not (request.user.is_superuser or request.user.pk == event.organizer_id):
+        return redirect("events")
+
+    errors = {}
+    if request.method == "POST":
+        with transaction.atomic():
+            for type, _ in Ticket.TICKET_TYPES:
+                success, result = TicketPool.configure(
+                    event,
+                    type,
+                    request.POST.get(f"capacity_{type}", "").strip(),
+                    request.POST.get(f"price_{type}", "").strip(),
+                )
+                if not success:
+                    errors.update({f"{field}_{type}": error for field, error in result.items()})
+
+            if errors:
+                transaction.set_rollback(True)
+
+        if not errors:
+            messages.success(request, "Cupos actualizados")
+            return redirect("event_detail", id=event.pk)
+
+    pools = {pool.type: pool for pool in event.pools.all()}
+    rows = [
+        {
+            "type": type,
+            "label": label,
+            "pool": pools.get(type),
+            "default_price": Ticket.DEFAULT_PRICES[type],
+            "capacity": request.POST.get(f"capacity_{type}") if errors else getattr(pools.get(type), "capacity", None),
+            "price": request.POST.get(f"price_{type}") if errors else getattr(pools.get(type), "price", None),
+        }
+        for type, label in Ticket.TICKET_TYPES
+    ]
+
+    return render(request, "app/event_pools.html", {
+        "event": event,
+        "rows": rows,
+        "errors": errors,
+        "user_is_organizer": request.user.is_organizer,
+    })
+
 @login_required
 def add_rating(request, event_id):
     event = get_object_or_404(Event, id=event_id)
@@ -404,10 +686,11 @@ def delete_rating(request, event_id):
     return redirect('event_detail', id=event.pk)
     
 @login_required
+@idempotent("purchase_ticket")
 def purchase_ticket(request, event_id):
-    event = get_object_or_404(Event, id=event_id)
+    event = get_object_or_404(Ticket.purchase_queryset(request.user), id=event_id)
     
-    if request.user == event.organizer:
+    if request.user.pk == event.organizer_id:
         messages.error(request, "Los organizadores no pueden comprar tickets para sus propios eventos")
         return redirect('event_detail', id=event_id)
     
@@ -415,6 +698,14 @@ def purchase_ticket(request, event_id):
         messages.error(request, "No se pueden comprar entradas para eventos que ya ocurrieron")
         return redirect('event_detail', id=event_id)
     
+    if waiting_room.is_enabled():
+        queue_status = waiting_room.join(event.pk, request.user.pk)
+        if not queue_status["admitted"]:
+            # La compra no se ejecutó: la clave de idempotencia tiene que servir al reintentar
+            return not_stored(
+                render(request, 'app/waiting_room.html', {'event': event, 'queue_status': queue_status})
+            )
+    
     if request.method == "POST":
         try:
             quantity = request.POST.get("cantidad")
@@ -433,15 +724,20 @@ def purchase_ticket(request, event_id):
                 messages.error(request, "La cantidad debe ser un número válido")
                 return render(request, 'app/purchase_ticket.html', {'event': event})
             
-            tickets_vendidos = Ticket.objects.filter(event=event).aggregate(
-                total=models.Sum('quantity'))['total'] or 0
-            if tickets_vendidos + quantity > event.venue.capacity:
-                messages.error(request, f"No hay suficientes entradas disponibles. Quedan {event.venue.capacity - tickets_vendidos} entradas.")
-                return render(request, 'app/purchase_ticket.html', {'event': event})
-            
-            ticket_code = str(uuid.uuid4())[:8].upper()
+            ticket_code = ticket_codes.next_code()
             buy_date = timezone.now().date()
             
+            hold_id = request.POST.get("hold_id")
+            if hold_id:
+                hold = get_object_or_404(TicketHold, pk=hold_id, event=event, user=request.user)
+                success, result = hold.confirm(buy_date, ticket_code)
+                if success:
+                    messages.success(request, "Ticket comprado exitosamente!")
+                    return redirect('view_ticket', event_id=event_id)
+                for error in result.values():
+                    messages.error(request, error)
+                return render(request, 'app/purchase_ticket.html', {'event': event, 'errors': result})
+            
             success, errors = Ticket.new(
                 buy_date=buy_date,
                 ticket_code=ticket_code,
@@ -465,13 +761,22 @@ def purchase_ticket(request, event_id):
                 
         except Exception:
             messages.error(request, "Error al procesar la compra. Por favor intente nuevamente.")
+            # 500 para que el error no quede guardado como respuesta de la clave de idempotencia
             return render(request, 'app/purchase_ticket.html', {
                 'event': event
-            })
+            }, status=500)
+    
+    # Entradas ofrecidas desde la lista de espera (o retenidas en otro checkout)
+    hold = TicketHold.objects.filter(
+        event=event, user=request.user, expires_at__gt=timezone.now()
+    ).order_by('expires_at').first()
             
-    return render(request, 'app/purchase_ticket.html', {'event': event})
+    return render(request, 'app/purchase_ticket.html', {'event': event, 'hold': hold})
 
 @login_required
+# Borrar un ticket libera hasta 4 entradas, así que el POST hace a lo sumo 4 ofertas a la
+# lista de espera (cada una con su retención y su notificación)
+@query_budget(7, POST=60)
 def view_ticket(request, event_id):
     event = get_object_or_404(Event, id=event_id)
     
@@ -479,16 +784,18 @@ def view_ticket(request, event_id):
         ticket_id = request.POST.get('ticket_id')
         if ticket_id:
             if request.user.is_organizer:
-                ticket = get_object_or_404(Ticket, id=ticket_id, event_id=event_id)
+                ticket = get_object_or_404(Ticket.objects.select_related('user'), id=ticket_id, event_id=event_id)
             else:
                 ticket = get_object_or_404(Ticket, id=ticket_id, event_id=event_id, user=request.user)
+            ticket.event = event
             ticket.delete()
+            WaitlistEntry.promote(event_id)
             return redirect('view_ticket', event_id=event_id)
     
     if request.user.is_organizer or request.user.is_superuser:
-        tickets = Ticket.objects.filter(event=event)
+        tickets = Ticket.objects.filter(event=event).select_related('user')
     else:
-        tickets = Ticket.objects.filter(event=event, user=request.user)
+        tickets = Ticket.objects.filter(event=event, user=request.user).select_related('user')
     
     return render(request, 'app/view_ticket.html', {
         'tickets': tickets, 
@@ -497,9 +804,257 @@ def view_ticket(request, event_id):
     })
 
 
-def edit_ticket(request, event_id, ticket_id):
+@login_required
+def purchase_tickets_batch(request):
+    """
+    Endpoint JSON para boletería y partners: recibe {"orders": [...]} con event, user,
+    type y quantity, y devuelve el resultado de cada orden.
+    """
+    user = request.user
+
+    if not (user.is_organizer or user.is_superuser):
+        return JsonResponse({'success': False, 'error': 'Sin permisos'}, status=403)
+
+    if request.method != "POST":
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+
+    try:
+        orders = json.loads(request.body)["orders"]
+        if not isinstance(orders, list):
+            raise TypeError
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({'success': False, 'error': 'El cuerpo debe ser JSON con una lista "orders"'}, status=400)
+
+    if len(orders) > BATCH_MAX_ORDERS:
+        return JsonResponse({'success': False, 'error': f'Máximo {BATCH_MAX_ORDERS} órdenes por lote'}, status=400)
+
+    results = Ticket.new_batch(
+        orders,
+        buy_date=timezone.now().date(),
+        next_code=ticket_codes.next_code,
+        organizer=None if user.is_superuser else user,
+    )
+
+    return JsonResponse({
+        'success': True,
+        'created': sum(1 for result in results if result['success']),
+        'results': results,
+    })
+
+def get_gate_for_user(user, event_id):
+    # Los permisos se controlan antes de cargar el índice del evento
+    gate = checkin.peek_gate(event_id)
+    if gate is not None:
+        organizer_id = gate.organizer_id
+    else:
+        organizer_id = Event.objects.filter(pk=event_id).values_list("organizer_id", flat=True).first()
+        if organizer_id is None:
+            raise Http404("Evento no encontrado")
+    if not (user.is_superuser or user.pk == organizer_id):
+        return None
+    gate = gate or checkin.get_gate(event_id)
+    if gate is None:
+        raise Http404("Evento no encontrado")
+    return gate
+
+@login_required
+def gate_open(request, event_id):
+    """
+    Carga en memoria los códigos del evento para el control de ingreso
+    """
+    if request.method != "POST":
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+
+    event = get_object_or_404(Event, pk=event_id)
+    if not (request.user.is_superuser or request.user.pk == event.organizer_id):
+        return JsonResponse({'success': False, 'error': 'Sin permisos'}, status=403)
+
+    gate = checkin.open_gate(event_id)
+    return JsonResponse({'success': True, **gate.stats()})
+
+@login_required
+def gate_close(request, event_id):
+    if request.method != "POST":
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+
+    event = get_object_or_404(Event, pk=event_id)
+    if not (request.user.is_superuser or request.user.pk == event.organizer_id):
+        return JsonResponse({'success': False, 'error': 'Sin permisos'}, status=403)
+
+    return JsonResponse({'success': True, 'flushed': checkin.close_gate(event_id)})
+
+@login_required
+def checkin_scan(request, event_id):
+    """
+    Endpoint de los lectores de la puerta: registra el ingreso de un código de ticket
+    """
+    if request.method != "POST":
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+
+    gate = get_gate_for_user(request.user, event_id)
+    if gate is None:
+        return JsonResponse({'success': False, 'error': 'Sin permisos'}, status=403)
+
+    status, quantity = gate.scan(request.POST.get("code"), gate=request.POST.get("gate", ""))
+
+    return JsonResponse({
+        'success': status == checkin.ADMITTED,
+        'status': status,
+        'quantity': quantity,
+    })
+
+@login_required
+def gate_status(request, event_id):
+    """
+    Estado de la puerta. Los lectores lo consultan periódicamente, y cada consulta guarda
+    los ingresos pendientes si ya pasó CHECKIN_FLUSH_SECONDS sin escaneos.
+    """
+    gate = get_gate_for_user(request.user, event_id)
+    if gate is None:
+        return JsonResponse({'success': False, 'error': 'Sin permisos'}, status=403)
+
+    flushed = gate.flush_if_due()
+    return JsonResponse({'success': True, 'flushed': flushed, **gate.stats()})
+
+@login_required
+def gate_snapshot_export(request, event_id):
+    """
+    Snapshot binario de los códigos válidos para los lectores sin conexión.
+    Con ?since=<ms> devuelve solo los cambios desde el snapshot anterior.
+    """
+    event = get_object_or_404(Event, pk=event_id)
+    if not (request.user.is_superuser or request.user.pk == event.organizer_id):
+        return JsonResponse({'success': False, 'error': 'Sin permisos'}, status=403)
+
+    since = request.GET.get("since")
+    if since is not None:
+        try:
+            since = gate_snapshot.from_millis(int(since))
+        except (ValueError, OverflowError, OSError):
+            return JsonResponse({'success': False, 'error': 'since debe ser un timestamp en milisegundos'}, status=400)
+
+    response = StreamingHttpResponse(
+        gate_snapshot.generate(event.pk, since=since),
+        content_type="application/octet-stream",
+    )
+    kind = "full" if since is None else "delta"
+    response["Content-Disposition"] = f'attachment; filename="gate-{event.pk}-{kind}.bin"'
+    response["X-Snapshot-Version"] = str(gate_snapshot.VERSION)
+    return response
+
+@login_required
+def gate_sync(request, event_id):
+    """
+    Recibe los ingresos registrados sin conexión:
+    {"admissions": [{"code": ..., "admitted_at": <ms>, "gate": ...}, ...]}
+    """
+    if request.method != "POST":
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+
+    event = get_object_or_404(Event, pk=event_id)
+    if not (request.user.is_superuser or request.user.pk == event.organizer_id):
+        return JsonResponse({'success': False, 'error': 'Sin permisos'}, status=403)
+
+    try:
+        admissions = [
+            (
+                str(item["code"]),
+                gate_snapshot.from_millis(int(item["admitted_at"])),
+                str(item.get("gate", ""))[:50],
+            )
+            for item in json.loads(request.body)["admissions"]
+        ]
+    except (ValueError, KeyError, TypeError, AttributeError, OverflowError, OSError):
+        return JsonResponse({'success': False, 'error': 'El cuerpo debe ser JSON con una lista "admissions"'}, status=400)
+
+    if len(admissions) > BATCH_MAX_ORDERS:
+        return JsonResponse({'success': False, 'error': f'Máximo {BATCH_MAX_ORDERS} ingresos por envío'}, status=400)
+
+    created, unknown = checkin.import_admissions(event.pk, admissions)
+    return JsonResponse({'success': True, 'created': created, 'unknown': unknown})
+
+@login_required
+def hold_tickets(request, event_id):
+    """
+    Endpoint AJAX que retiene entradas durante el checkout
+    """
+    event = get_object_or_404(Event.objects.select_related('venue'), id=event_id)
+
+    if request.method != "POST":
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+
+    if request.user == event.organizer:
+        return JsonResponse({'success': False, 'error': 'Los organizadores no pueden comprar tickets para sus propios eventos'})
+
+    success, result = TicketHold.new(
+        event=event,
+        user=request.user,
+        quantity=request.POST.get("cantidad", ""),
+        type=request.POST.get("tipoEntrada", "GENERAL"),
+    )
+
+    if not success:
+        return JsonResponse({'success': False, 'errors': result})
+
+    return JsonResponse({
+        'success': True,
+        'hold_id': result.pk,
+        'quantity': result.quantity,
+        'expires_at': result.expires_at.isoformat(),
+    })
+
+@login_required
+def join_waitlist(request, event_id):
+    """
+    Anota al usuario en la lista de espera de un evento agotado
+    """
     event = get_object_or_404(Event, id=event_id)
-    ticket = get_object_or_404(Ticket, id=ticket_id)
+
+    if request.method != "POST":
+        return redirect('purchase_ticket', event_id=event_id)
+
+    success, result = WaitlistEntry.new(
+        event=event,
+        user=request.user,
+        quantity=request.POST.get("cantidad", ""),
+        type=request.POST.get("tipoEntrada", "GENERAL"),
+    )
+
+    if success:
+        messages.success(request, f"Te anotaste en la lista de espera (lugar {result.position()}). Te avisaremos cuando se liberen entradas.")
+    else:
+        for error in result.values():
+            messages.error(request, error)
+    return redirect('event_detail', id=event_id)
+
+@login_required
+def leave_waitlist(request, entry_id):
+    entry = get_object_or_404(WaitlistEntry, pk=entry_id, user=request.user, offered_at__isnull=True)
+
+    if request.method == "POST":
+        entry.delete()
+        messages.success(request, "Saliste de la lista de espera")
+    return redirect('event_detail', id=entry.event_id)
+
+@login_required
+def release_hold(request, hold_id):
+    hold = get_object_or_404(TicketHold, pk=hold_id, user=request.user)
+
+    if request.method != "POST":
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+
+    released = hold.release()
+    if released:
+        WaitlistEntry.promote(hold.event_id)
+    return JsonResponse({'success': released})
+
+
+def edit_ticket(request, event_id, ticket_id):
+    ticket = get_object_or_404(Ticket.objects.select_related('user'), id=ticket_id, event_id=event_id)
+    event = get_object_or_404(
+        Ticket.purchase_queryset(ticket.user, exclude_ticket_id=ticket.pk), id=event_id
+    )
+    ticket.event = event
     
     if not (request.user == ticket.user or request.user == event.organizer):
         messages.error(request, "No tienes permisos para editar este ticket")
@@ -529,18 +1084,22 @@ def edit_ticket(request, event_id, ticket_id):
                     'ticket': ticket
                 })
             
-            tickets_vendidos = Ticket.objects.filter(event=event).exclude(
-                id=ticket.pk).aggregate(total=models.Sum('quantity'))['total'] or 0
-            if tickets_vendidos + quantity > event.venue.capacity:
-                messages.error(request, f"La cantidad excede la capacidad disponible del evento. Máximo disponible: {event.venue.capacity - tickets_vendidos}")
+            errors = {}
+            frees_seats = quantity < ticket.quantity or ticket_type != ticket.type
+            if request.user == ticket.user:
+                errors = Ticket.validate_ticket_edit_limit(ticket.user, event, quantity, ticket)
+            if not errors:
+                _, errors = ticket.update_quantity(quantity, ticket_type)
+            if not errors and frees_seats:
+                WaitlistEntry.promote(event_id)
+            if errors:
+                for error in errors.values():
+                    messages.error(request, error)
                 return render(request, 'app/edit_ticket.html', {
                     'event': event,
                     'ticket': ticket
                 })
             
-            ticket.type = ticket_type
-            ticket.quantity = quantity
-            ticket.save()
             messages.success(request, "Ticket actualizado exitosamente")
             return redirect('view_ticket', event_id=event_id)
             
@@ -556,8 +1115,35 @@ def edit_ticket(request, event_id, ticket_id):
         'ticket': ticket
     })
 
+@login_required
+def transfer_ticket(request, event_id, ticket_id):
+    """
+    Transfiere un ticket propio a otro usuario (por nombre de usuario o email)
+    """
+    ticket = get_object_or_404(
+        Ticket.objects.select_related('event'), id=ticket_id, event_id=event_id, user=request.user
+    )
+
+    if request.method != "POST":
+        return redirect('view_ticket', event_id=event_id)
+
+    destinatario = request.POST.get("destinatario", "").strip()
+    to_user = User.objects.filter(Q(username=destinatario) | Q(email__iexact=destinatario)).first() if destinatario else None
+    if to_user is None:
+        messages.error(request, "No existe un usuario con ese nombre o email")
+        return redirect('view_ticket', event_id=event_id)
+
+    success, result = ticket.transfer(to_user)
+    if success:
+        messages.success(request, f"El ticket {ticket.ticket_code} fue transferido a {to_user.username}")
+    else:
+        for error in result.values():
+            messages.error(request, error)
+    return redirect('view_ticket', event_id=event_id)
+
+@query_budget(6)
 def comments(request):
-    comments = Comment.objects.all().order_by("created_at")
+    comments = Comment.objects.select_related("event", "user").order_by("created_at")
     return render(
         request,
         "app/comments/comments.html",
@@ -729,7 +1315,47 @@ def category_delete(request, category_id):
 @login_required
 def category_detail(request, id):
     category = get_object_or_404(Category, pk=id)
-    return render(request, "app/categorys/category_detail.html", {"category": category})
+    return render(
+        request,
+        "app/categorys/category_detail.html",
+        {
+            "category": category,
+            "calendar_url": request.build_absolute_uri(
+                reverse("calendar_category", kwargs={"token": ical.feed_token(request.user), "category_id": category.pk})
+            ),
+        },
+    )
+
+def feed_user(token):
+    user = ical.user_from_token(token)
+    if user is None:
+        raise Http404("Calendario no encontrado")
+    return user
+
+def calendar_tickets(request, token):
+    """Calendario (.ics) de los eventos para los que el dueño del token tiene entradas."""
+    user = feed_user(token)
+    events = Event.objects.filter(Exists(Ticket.objects.filter(event=OuterRef("pk"), user=user)))
+    # Las compras y devoluciones no modifican el evento: también cuentan para la versión
+    tickets = Ticket.objects.filter(user=user).aggregate(total=Count("pk"), last=Max("pk"))
+    version = f"{tickets['total']}:{tickets['last']}"
+    return ical.feed_response(request, events, "Mis entradas", "entradas.ics", version=version)
+
+def calendar_organizer(request, token):
+    """Calendario (.ics) de los eventos que organiza el dueño del token."""
+    user = feed_user(token)
+    if not user.is_organizer:
+        raise Http404("Calendario no encontrado")
+    events = Event.objects.filter(organizer=user)
+    return ical.feed_response(request, events, f"Eventos de {user.username}", "organizador.ics")
+
+def calendar_category(request, token, category_id):
+    """Calendario (.ics) de los próximos eventos de una categoría."""
+    feed_user(token)
+    category = get_object_or_404(Category, pk=category_id)
+    events = Event.objects.filter(category=category, scheduled_at__gte=timezone.now() - timedelta(hours=3))
+    return ical.feed_response(request, events, category.name, f"categoria-{category.pk}.ics")
+
 def venues(request):
     user = request.user
     
@@ -842,6 +1468,10 @@ def venue_edit(request, id):
                 },
             )
         
+        if (address, city) != (venue.address, venue.city):
+            # Las coordenadas eran de la dirección anterior: se vuelven a cargar con
+            # import_venue_coordinates
+            venue.set_coordinates(None, None)
         venue.name = name
         venue.address = address
         venue.city = city
@@ -861,6 +1491,7 @@ def venue_edit(request, id):
     )
 
 @login_required
+@idempotent("refound_request")
 def refound_request(request, id=None):
     user = request.user
     errors = {}
@@ -957,6 +1588,7 @@ def refound_request(request, id=None):
     )
     
 
+@query_budget(8)
 def notifications(request):
     user = request.user
     events_not_found = not Event.objects.exists()
@@ -968,7 +1600,12 @@ def notifications(request):
     event_filter = request.GET.get("event", "")
     priority_filter = request.GET.get("priority", "")
 
-    notifications = Notification.objects.all().order_by("-created_at")
+    # La cantidad de destinatarios se cuenta en la misma consulta
+    notifications = (
+        Notification.objects.select_related("event")
+        .annotate(users_count=Count("users"))
+        .order_by("-created_at")
+    )
 
     if search_query:
         notifications = notifications.filter(title__icontains=search_query)
@@ -1019,7 +1656,23 @@ def accept_reject_refound_request(request, refound_id, action):
     refound_request = get_object_or_404(RefoundRequest, pk=refound_id)
 
     if action == 'approve':
+        # Solo el ticket de quien pidió el reembolso: si lo transfirió, ya es de otro usuario
+        ticket = Ticket.objects.filter(
+            ticket_code=refound_request.ticket_code,
+            event_id=refound_request.event_id,
+            user_id=refound_request.user_id,
+        ).first()
+        if ticket is None:
+            messages.error(
+                request,
+                f"El ticket {refound_request.ticket_code} ya no pertenece a quien pidió el reembolso.",
+            )
+            return redirect("refound_request")
+
         refound_request.approved = True
+        # El ticket reembolsado deja de valer y sus entradas pasan a la lista de espera
+        ticket.delete()
+        WaitlistEntry.promote(refound_request.event_id)
         messages.success(request, f"La solicitud de reembolso para el ticket {refound_request.ticket_code} ha sido aprobada.")
     elif action == 'reject':
         refound_request.approved = False
@@ -1032,6 +1685,7 @@ def accept_reject_refound_request(request, refound_id, action):
     return redirect("refound_request")
 
 @login_required
+@query_budget(6)
 def refounds(request):
     user = request.user
     if user.is_superuser:
@@ -1040,6 +1694,7 @@ def refounds(request):
         refounds_by_user = RefoundRequest.objects.filter(event__organizer=user)
     else:
         refounds_by_user = RefoundRequest.objects.filter(user=user)
+    refounds_by_user = refounds_by_user.select_related("event", "user")
 
     return render(
         request,
@@ -1170,15 +1825,47 @@ def notification_form(request, id=None):
     )
     
 @login_required
+@query_budget(5)
 def events_users(request, id):
     print("Llamando a events_users con ID:", id)
     event = get_object_or_404(Event, pk=id)
     
-    tickets = Ticket.objects.filter(event=event)
-    users = [{"id": ticket.user.pk, "username": ticket.user.username} for ticket in tickets]
+    tickets = Ticket.objects.filter(event=event).values_list("user_id", "user__username")
+    users = [{"id": user_id, "username": username} for user_id, username in tickets]
 
     return JsonResponse({"usuarios": users})
 
+def export_response(export, filename):
+    response = StreamingHttpResponse(export, content_type=export.content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{export.format}"'
+    return response
+
+@login_required
+def events_export(request, fmt):
+    """Eventos del organizador (todos para un superusuario) en CSV o JSONL."""
+    user = request.user
+    if not (user.is_organizer or user.is_superuser):
+        return JsonResponse({'success': False, 'error': 'Sin permisos'}, status=403)
+    if fmt not in exports.FORMATS:
+        raise Http404("Formato desconocido")
+
+    rows = exports.events_rows(None if user.is_superuser else user)
+    return export_response(exports.Export("events", fmt, rows), "eventos")
+
+@login_required
+def event_export(request, event_id, kind, fmt):
+    """Entradas (`tickets`) o asistentes (`attendees`) de un evento en CSV o JSONL."""
+    event = get_object_or_404(Event, pk=event_id)
+    if not (request.user.is_superuser or request.user.pk == event.organizer_id):
+        return JsonResponse({'success': False, 'error': 'Sin permisos'}, status=403)
+
+    sources = {"tickets": exports.tickets_rows, "attendees": exports.attendees_rows}
+    if kind not in sources or fmt not in exports.FORMATS:
+        raise Http404("Exportación desconocida")
+
+    export = exports.Export(kind, fmt, sources[kind](event.pk))
+    return export_response(export, f"evento-{event.pk}-{kind}")
+
 @login_required
 def notification_update(request, id):
     user = request.user
@@ -1209,9 +1896,10 @@ def notification_update(request, id):
         
         
 @login_required
+@query_budget(7)
 def user_notifications(request):
     user = request.user
-    notifications = Notification.objects.filter(users=user).order_by("-created_at")
+    notifications = Notification.objects.filter(users=user).select_related("event").order_by("-created_at")
     unread_count = notifications.filter(is_read=False).count()
     
     return render(
@@ -1237,17 +1925,48 @@ def mark_all_as_read(request):
     
     return redirect('user_notifications')
 
+@login_required
+def queue_status(request, event_id):
+    """
+    Endpoint AJAX liviano para consultar la posición en la sala de espera.
+    No consulta eventos ni tickets.
+    """
+    return JsonResponse(waiting_room.status(event_id, request.user.pk))
+
+def json_with_etag(request, data):
+    """
+    JsonResponse con ETag. Si el cliente ya tiene esa misma respuesta devuelve 304 sin cuerpo.
+    """
+    body = json.dumps(data)
+    etag = quote_etag(hashlib.md5(body.encode(), usedforsecurity=False).hexdigest())
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
 @login_required
 def check_ticket_limit(request, event_id):
-    event = get_object_or_404(Event, id=event_id)
+    """
+    Endpoint AJAX del formulario de compra. Se responde desde la caché de
+    Ticket.cached_user_tickets, sin consultas mientras el usuario no compre.
+    """
+    if waiting_room.is_enabled():
+        queue_status = waiting_room.status(event_id, request.user.pk)
+        if not queue_status["admitted"]:
+            return JsonResponse({'success': False, 'queued': True, 'position': queue_status["position"]})
+
+    cached = Ticket.cached_user_tickets(request.user.pk, event_id)
+    if cached is None:
+        raise Http404("Evento no encontrado")
+
     cantidad = int(request.GET.get('cantidad', 1))
-    
-    current_count = Ticket.get_user_tickets_count(user=request.user, event=event)
-    
-    success = (current_count + cantidad) <= 4
-    
-    return JsonResponse({
-        'success': success,
+    current_count = sum(cached["tickets"].values())
+
+    return json_with_etag(request, {
+        'success': (current_count + cantidad) <= 4,
         'current_count': current_count,
         'total': current_count + cantidad,
         'remaining': max(0, 4 - current_count)
@@ -1258,35 +1977,51 @@ def check_ticket_limit_for_edit(request, event_id, ticket_id):
     """
     Endpoint AJAX para verificar límites al editar un ticket específico
     """
-    event = get_object_or_404(Event, id=event_id)
-    ticket = get_object_or_404(Ticket, id=ticket_id)
+    cached = Ticket.cached_user_tickets(request.user.pk, event_id)
+    if cached is None:
+        raise Http404("Evento no encontrado")
+
     cantidad = int(request.GET.get('cantidad', 1))
-    
-    if not (request.user == ticket.user or request.user == event.organizer):
-        return JsonResponse({'success': False, 'error': 'Sin permisos'})
-    
-    if request.user.is_organizer:
+
+    # Si el ticket no está entre los del usuario solo puede consultarlo el organizador
+    if ticket_id not in cached["tickets"]:
+        if request.user.pk != cached["organizer_id"]:
+            get_object_or_404(Ticket, id=ticket_id)
+            return JsonResponse({'success': False, 'error': 'Sin permisos'})
+        get_object_or_404(Ticket, id=ticket_id, event_id=event_id)
+
+    if request.user.is_organizer or ticket_id not in cached["tickets"]:
         return JsonResponse({
             'success': True,
             'current_count': 0,
             'total': cantidad,
             'remaining': float('inf')
         })
-    
-    current_count = Ticket.objects.filter(
-        user=ticket.user, 
-        event=event
-    ).exclude(
-        id=ticket.pk
-    ).aggregate(
-        total=models.Sum('quantity')
-    )['total'] or 0
-    
-    success = (current_count + cantidad) <= 4
-    
-    return JsonResponse({
-        'success': success,
+
+    current_count = sum(cached["tickets"].values()) - cached["tickets"][ticket_id]
+
+    return json_with_etag(request, {
+        'success': (current_count + cantidad) <= 4,
         'current_count': current_count,
         'total': current_count + cantidad,
         'remaining': max(0, 4 - current_count)
     })
+
+@login_required
+def ticket_allowance(request, event_id):
+    """
+    Entradas que el usuario todavía puede comprar y entradas que le quedan al evento
+    (total y por tipo), en una sola respuesta.
+    """
+    cached = Ticket.cached_user_tickets(request.user.pk, event_id)
+    if cached is None:
+        raise Http404("Evento no encontrado")
+    availability = Event.cached_availability(event_id)
+
+    user_remaining = max(0, 4 - sum(cached["tickets"].values()))
+    return json_with_etag(request, {
+        'user_remaining': user_remaining,
+        'event_remaining': availability["available"],
+        'types': availability["types"],
+        'can_buy': min(user_remaining, availability["available"]),
+    })
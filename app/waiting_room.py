@@ -0,0 +1,182 @@
+"""
+Sala de espera para la venta de entradas de eventos muy demandados.
+
+Cada usuario que entra a comprar recibe un número en la fila del evento. Los números se
+admiten a un ritmo fijo usando un token bucket: se acumulan `RATE` fichas por segundo
+(hasta `BURST`) y cada ficha admite al siguiente número de la fila.
+
+El estado se guarda en un store intercambiable (settings.WAITING_ROOM["STORE"]):
+- DatabaseQueueStore: compartido entre workers, usa las tablas WaitingRoom/WaitingRoomEntry.
+- MemoryQueueStore: en memoria del proceso, pensado para tests y desarrollo local.
+
+Ninguna consulta de la sala de espera toca las tablas de tickets.
+"""
+
+import threading
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import WaitingRoom, WaitingRoomEntry
+
+
+def refill(room, now, rate, burst):
+    """
+    Recarga las fichas del token bucket y admite los números que alcancen.
+    `room` es cualquier objeto con last_number, admitted_until, tokens y refilled_at.
+    Retorna la cantidad de números admitidos.
+    """
+    elapsed = max((now - room.refilled_at).total_seconds(), 0)
+    tokens = min(burst, room.tokens + elapsed * rate)
+    admitted = min(int(tokens), room.last_number - room.admitted_until)
+
+    if admitted > 0:
+        room.admitted_until += admitted
+        room.tokens = tokens - admitted
+        room.refilled_at = now
+    return admitted
+
+
+def build_status(number, admitted_until):
+    if number is None:
+        return {"joined": False, "admitted": False, "position": None}
+
+    return {
+        "joined": True,
+        "admitted": number <= admitted_until,
+        "position": max(number - admitted_until, 0),
+    }
+
+
+class MemoryQueueStore:
+    """
+    Store en memoria del proceso. No se comparte entre workers.
+    """
+
+    class Room:
+        def __init__(self, now, burst):
+            self.last_number = 0
+            self.admitted_until = 0
+            self.tokens = float(burst)
+            self.refilled_at = now
+            self.numbers = {}
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.rooms = {}
+        self.lock = threading.Lock()
+
+    def _get_room(self, event_id, now):
+        if event_id not in self.rooms:
+            self.rooms[event_id] = self.Room(now, self.burst)
+        return self.rooms[event_id]
+
+    def join(self, event_id, user_id):
+        now = timezone.now()
+        with self.lock:
+            room = self._get_room(event_id, now)
+            if user_id not in room.numbers:
+                room.last_number += 1
+                room.numbers[user_id] = room.last_number
+            refill(room, now, self.rate, self.burst)
+            return build_status(room.numbers[user_id], room.admitted_until)
+
+    def status(self, event_id, user_id):
+        now = timezone.now()
+        with self.lock:
+            room = self.rooms.get(event_id)
+            if room is None:
+                return build_status(None, 0)
+            refill(room, now, self.rate, self.burst)
+            return build_status(room.numbers.get(user_id), room.admitted_until)
+
+
+class DatabaseQueueStore:
+    """
+    Store compartido en la base de datos. Solo escribe el estado de la sala cuando
+    se admiten números nuevos, así que los polls sin cambios son una lectura.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+
+    def join(self, event_id, user_id):
+        now = timezone.now()
+        with transaction.atomic():
+            room, _ = WaitingRoom.objects.select_for_update().get_or_create(
+                event_id=event_id,
+                defaults={"tokens": self.burst, "refilled_at": now},
+            )
+
+            number = WaitingRoomEntry.objects.filter(
+                event_id=event_id, user_id=user_id
+            ).values_list("number", flat=True).first()
+
+            if number is None:
+                room.last_number += 1
+                number = room.last_number
+                WaitingRoomEntry.objects.create(event_id=event_id, user_id=user_id, number=number)
+
+            refill(room, now, self.rate, self.burst)
+            room.save()
+
+        return build_status(number, room.admitted_until)
+
+    def status(self, event_id, user_id):
+        now = timezone.now()
+        number = WaitingRoomEntry.objects.filter(
+            event_id=event_id, user_id=user_id
+        ).values_list("number", flat=True).first()
+
+        if number is None:
+            return build_status(None, 0)
+
+        # Primero se lee sin bloquear: la fila de la sala solo se bloquea si toca admitir
+        # números nuevos, y ahí se vuelve a calcular porque otro poll pudo haberse adelantado
+        room = WaitingRoom.objects.get(event_id=event_id)
+        if refill(room, now, self.rate, self.burst):
+            with transaction.atomic():
+                room = WaitingRoom.objects.select_for_update().get(event_id=event_id)
+                if refill(room, now, self.rate, self.burst):
+                    room.save(update_fields=["admitted_until", "tokens", "refilled_at"])
+
+        return build_status(number, room.admitted_until)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            config = settings.WAITING_ROOM
+            _store = import_string(config["STORE"])(rate=config["RATE"], burst=config["BURST"])
+        return _store
+
+
+@receiver(setting_changed)
+def reset_store(*, setting=None, **kwargs):
+    global _store
+    if setting in (None, "WAITING_ROOM"):
+        with _store_lock:
+            _store = None
+
+
+def is_enabled():
+    return settings.WAITING_ROOM["ENABLED"]
+
+
+def join(event_id, user_id):
+    return get_store().join(event_id, user_id)
+
+
+def status(event_id, user_id):
+    return get_store().status(event_id, user_id)
@@ -45,6 +45,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "app.query_budget.QueryBudgetMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -88,6 +89,16 @@ if DB_ENGINE == "django.db.backends.sqlite3":
             "NAME": BASE_DIR / os.getenv("DB_NAME", "db.sqlite3"),
         }
     }
+    # Con DB_SQLITE_WAL=1 las lecturas no esperan a las escrituras (pruebas de carga locales)
+    if os.getenv("DB_SQLITE_WAL") == "1":
+        DATABASES["default"]["OPTIONS"] = {
+            "init_command": "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;",
+            "transaction_mode": "IMMEDIATE",
+            "timeout": 20,
+        }
+        # La base de los tests también en un archivo: en memoria, los threads del servidor
+        # de LiveServerTestCase comparten una sola conexión (ver test_loadtest.py)
+        DATABASES["default"]["TEST"] = {"NAME": BASE_DIR / f"test_{os.getenv('DB_NAME', 'db.sqlite3')}"}
 else:
     DATABASES = {
         "default": {
@@ -100,6 +111,16 @@ else:
         }
     }
 
+# Caché compartida entre requests. LocMemCache es por proceso; con varios workers conviene
+# una compartida, por ejemplo CACHE_BACKEND=django.core.cache.backends.redis.RedisCache y
+# CACHE_LOCATION=redis://127.0.0.1:6379, o FileBasedCache con un directorio en CACHE_LOCATION.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -153,3 +174,57 @@ LOGIN_REDIRECT_URL = "/events/"
 LOGIN_URL = "/accounts/login/"
 
 LOGOUT_REDIRECT_URL = "/accounts/login/"
+
+# Eventos por página del listado (paginado por cursor, ver app/pagination.py)
+EVENTS_PAGE_SIZE = int(os.getenv("EVENTS_PAGE_SIZE", "20"))
+
+# Segundos que se mantienen retenidas las entradas durante el checkout
+TICKET_HOLD_TTL = int(os.getenv("TICKET_HOLD_TTL", "600"))
+
+# Sala de espera para ventas con mucha demanda (ver app/waiting_room.py)
+WAITING_ROOM = {
+    "ENABLED": os.getenv("WAITING_ROOM_ENABLED", "False") == "True",
+    "STORE": os.getenv("WAITING_ROOM_STORE", "app.waiting_room.DatabaseQueueStore"),
+    # Usuarios admitidos por segundo y máximo acumulable del token bucket
+    "RATE": float(os.getenv("WAITING_ROOM_RATE", "5")),
+    "BURST": int(os.getenv("WAITING_ROOM_BURST", "20")),
+}
+
+# Los ingresos escaneados en la puerta se guardan en lotes (ver app/checkin.py)
+CHECKIN_FLUSH_SIZE = int(os.getenv("CHECKIN_FLUSH_SIZE", "100"))
+CHECKIN_FLUSH_SECONDS = float(os.getenv("CHECKIN_FLUSH_SECONDS", "2"))
+# Segundos que se recuerda un código inexistente antes de volver a buscarlo en la base
+CHECKIN_MISS_SECONDS = float(os.getenv("CHECKIN_MISS_SECONDS", "5"))
+
+# Caché de las consultas AJAX de límite de entradas (ver Ticket.cached_user_tickets).
+# La cantidad por usuario se invalida en cada escritura; la disponibilidad del evento se
+# comparte entre todos los usuarios y solo vence por tiempo.
+TICKET_LIMIT_CACHE_SECONDS = int(os.getenv("TICKET_LIMIT_CACHE_SECONDS", "300"))
+TICKET_AVAILABILITY_CACHE_SECONDS = float(os.getenv("TICKET_AVAILABILITY_CACHE_SECONDS", "2"))
+
+# Segundos que tiene un usuario de la lista de espera para confirmar las entradas ofrecidas
+WAITLIST_OFFER_TTL = int(os.getenv("WAITLIST_OFFER_TTL", "1800"))
+
+# Claves de idempotencia de los POST de compra y reembolso (ver app/idempotency.py).
+# Una clave vence IDEMPOTENCY_KEY_TTL segundos después de guardar la respuesta; si la
+# vista nunca terminó, la reserva se libera a los IDEMPOTENCY_LOCK_SECONDS segundos.
+IDEMPOTENCY_KEY_TTL = int(os.getenv("IDEMPOTENCY_KEY_TTL", "86400"))
+IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "60"))
+
+# Las vistas con @query_budget(n) no pueden hacer más de n consultas (ver app/query_budget.py).
+# Sin modo estricto solo se registra un warning. Los tests de presupuesto lo activan, y con
+# QUERY_BUDGET_STRICT=True la suite completa tiene que pasar igual.
+QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "False") == "True"
+
+# Búsqueda de eventos por palabras clave (ver app/search.py): FTS5 en SQLite, tsvector en Postgres
+EVENT_SEARCH_BACKEND = os.getenv(
+    "EVENT_SEARCH_BACKEND",
+    "app.search.PostgresSearchBackend" if "postgresql" in DB_ENGINE else "app.search.SQLiteSearchBackend",
+)
+# Máximo de resultados por búsqueda
+EVENT_SEARCH_LIMIT = int(os.getenv("EVENT_SEARCH_LIMIT", "50"))
+
+# Segundos que se guarda el HTML del listado de eventos (ver app/fragment_cache.py). Se
+# invalida al modificar el catálogo; el vencimiento cubre los eventos que van quedando en
+# el pasado. Con 0 se desactiva.
+EVENTS_FRAGMENT_CACHE_SECONDS = int(os.getenv("EVENTS_FRAGMENT_CACHE_SECONDS", "60"))